@@ -0,0 +1,459 @@
+"""
+Exports many .blend files from the command line, without the UI
+
+    python batch_export.py "scenery/**/*.blend" --jobs 4 --report report.json
+    python batch_export.py --manifest nightly.txt --blender /opt/blender/blender
+
+Each job is one background Blender that exports .blend file after .blend file,
+so the addon is registered (and lights.txt is parsed) once per job instead of once
+per file. Every --files-per-blender files a job's Blender is restarted, keeping
+memory from growing forever. A file that takes longer than --timeout seconds
+to export is given up on, its Blender is killed and the next file gets a new one.
+
+Blender runs this same file with --python and --worker, which is the other half:
+it connects back to us over a localhost socket and exports whatever it is sent.
+
+The JSON report has, for each .blend file, its status, errors, warnings, and timings
+taken from XPlaneLogger, and the OBJs it wrote. .blend files that write the same OBJ
+(easy to do with --output-dir) overwrite each other, so they're all marked failed.
+The exit code is 0 only if every file exported without errors.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import glob
+import json
+import os
+import queue
+import secrets
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Bumped whenever the report changes in a way readers must know about
+REPORT_FORMAT_VERSION = 2
+
+WORKER_ADDRESS_ENV_VAR = "XPLANE2BLENDER_BATCH_WORKER_ADDRESS"
+WORKER_TOKEN_ENV_VAR = "XPLANE2BLENDER_BATCH_WORKER_TOKEN"
+
+# A .blend file's result, what a worker sends back and what goes in the report
+# status is one of "exported", "failed" (the exporter logged errors or cancelled,
+# or another .blend file writes the same OBJ), "exception" (something raised inside Blender),
+# "crashed" (Blender died), or "timeout" (Blender was killed after --timeout seconds).
+# outputs are the absolute paths of the OBJs it wrote (or left unchanged)
+BlendFileResult = collections.namedtuple(
+    "BlendFileResult",
+    ["blendFile", "status", "errors", "warnings", "errorCount", "warningCount", "timings", "outputs"]
+)
+
+
+def _make_argparse():
+    parser = argparse.ArgumentParser(description="Exports .blend files to X-Plane OBJs with many background Blenders")
+    file_selection = parser.add_argument_group("File Selection")
+    file_selection.add_argument("blend_files",
+            nargs="*",
+            help=".blend files or glob patterns (** searches folders recursively)",
+            type=str)
+    file_selection.add_argument("--manifest",
+            help="Text file with one .blend file or glob pattern per line, # starts a comment",
+            type=str)
+
+    export_control = parser.add_argument_group("Export Control")
+    export_control.add_argument("-j", "--jobs",
+            default=min(4, os.cpu_count() or 1),
+            help="How many Blenders to export with at once",
+            type=int)
+    export_control.add_argument("--files-per-blender",
+            default=50,
+            help="Restart a job's Blender after exporting this many .blend files, 0 to never restart",
+            type=int)
+    export_control.add_argument("--timeout",
+            default=1800,
+            help="Kill Blender if exporting one .blend file takes longer than this many seconds, 0 to wait forever",
+            type=float)
+    export_control.add_argument("--output-dir",
+            help="Write OBJs here instead of relative to each .blend file",
+            type=str)
+    export_control.add_argument("--report",
+            default="batch_export_report.json",
+            help="Where to write the JSON report",
+            type=str)
+    export_control.add_argument("--log-dir",
+            default=".",
+            help="Where each job's Blender output goes, as batch_export_job_N.log",
+            type=str)
+    export_control.add_argument("-q", "--quiet",
+            default=False,
+            help="Only print failures and the summary",
+            action="store_true")
+
+    blender_options = parser.add_argument_group("Blender Options")
+    blender_options.add_argument("--blender",
+            default="blender",# Use the blender in the system path
+            type=str,
+            help="Provide alternative path to Blender executable")
+    blender_options.add_argument("-n", "--no-factory-startup",
+            help="Run Blender with current prefs rather than factory prefs",
+            action="store_true")
+
+    return parser
+
+
+def find_blend_files(patterns:List[str], manifest:Optional[str])->List[str]:
+    '''
+    Expands the patterns and manifest lines into a list of .blend files,
+    in the order given, without duplicates
+    '''
+    patterns = list(patterns)
+    if manifest:
+        with open(manifest) as manifest_file:
+            for line in manifest_file:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    patterns.append(os.path.join(os.path.dirname(manifest), line))
+
+    blend_files = [] # type: List[str]
+    seen = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for blend_file in matches:
+            blend_file = os.path.abspath(blend_file)
+            if blend_file not in seen:
+                seen.add(blend_file)
+                blend_files.append(blend_file)
+    return blend_files
+
+
+class BatchBlender():
+    '''
+    One job's background Blender, running this file with --worker.
+    It is started on first use and restarted if it dies or has exported
+    --files-per-blender files.
+
+    .blend files are sent one JSON line at a time, the worker answers with
+    a JSON line holding its BlendFileResult. The first line from the worker must
+    be the token we gave it, so we know we're talking to our Blender
+    '''
+
+    # How long to wait for Blender to start and connect
+    STARTUP_TIMEOUT = 120
+
+    def __init__(self, argv, log_filepath:str)->None:
+        self.argv = argv
+        self.log_filepath = log_filepath
+        self.process = None # type: Optional[subprocess.Popen]
+        self.connection = None # type: Optional[socket.socket]
+        self.stream = None
+        self.files_exported = 0
+
+    def start(self)->None:
+        token = secrets.token_hex(16)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            server.settimeout(self.STARTUP_TIMEOUT)
+
+            env = dict(os.environ)
+            env[WORKER_ADDRESS_ENV_VAR] = "%s:%d" % server.getsockname()
+            env[WORKER_TOKEN_ENV_VAR] = token
+
+            blender_args = [
+                self.argv.blender,
+                '--addons',
+                'io_xplane2blender',
+                '--factory-startup',
+                '-noaudio',
+                '-b',
+                '--python',
+                os.path.abspath(__file__),
+                '--',
+                '--worker',
+            ]
+            if self.argv.no_factory_startup:
+                blender_args.remove('--factory-startup')
+
+            with open(self.log_filepath, "a") as log:
+                self.process = subprocess.Popen(blender_args, stdout=log, stderr=subprocess.STDOUT, env=env)
+
+            try:
+                self.connection, address = server.accept()
+            except socket.timeout:
+                self.close()
+                raise RuntimeError("Blender didn't connect within %d seconds, see %s" % (self.STARTUP_TIMEOUT, self.log_filepath))
+
+        # Exports can take as long as they like
+        self.connection.settimeout(None)
+        self.stream = self.connection.makefile("rw", encoding="utf-8", newline="\n")
+        if self.stream.readline().strip() != token:
+            self.close()
+            raise RuntimeError("Something other than our Blender connected")
+        self.files_exported = 0
+
+    def close(self, kill:bool = False)->None:
+        '''
+        Tells the worker to quit and waits for it. With kill,
+        when it isn't listening, Blender is killed right away
+        '''
+        if self.process is not None and kill:
+            self.process.kill()
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+        if self.connection is not None:
+            # Closing the connection tells the worker to quit
+            self.connection.close()
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process, self.connection, self.stream = None, None, None
+
+    def export(self, blend_file:str)->BlendFileResult:
+        if (self.process is not None
+                and self.argv.files_per_blender > 0
+                and self.files_exported >= self.argv.files_per_blender):
+            self.close()
+        timer_start = time.perf_counter()
+        if self.process is None or self.process.poll() is not None:
+            self.close()
+            try:
+                self.start()
+            except (OSError, RuntimeError) as e:
+                return self._unexported_result(blend_file, "crashed", str(e), timer_start)
+
+        self.connection.settimeout(self.argv.timeout if self.argv.timeout > 0 else None)
+        try:
+            self.stream.write(json.dumps({"blendFile": blend_file, "outputDir": self.argv.output_dir}) + "\n")
+            self.stream.flush()
+            response = self.stream.readline()
+        except socket.timeout:
+            # Stuck, as far as we can tell. The next file gets a new Blender
+            self.close(kill=True)
+            return self._unexported_result(
+                blend_file,
+                "timeout",
+                "Blender was killed after exporting for %g seconds, see %s" % (self.argv.timeout, self.log_filepath),
+                timer_start
+            )
+        except OSError:
+            response = ""
+        self.files_exported += 1
+
+        if response:
+            return BlendFileResult(**json.loads(response))
+
+        # Crashed, hung up, or worse. The next file gets a new Blender
+        self.close()
+        with open(self.log_filepath) as log:
+            log_tail = log.read()[-4000:]
+        return self._unexported_result(
+            blend_file,
+            "crashed",
+            "Blender died while exporting, end of %s:\n%s" % (self.log_filepath, log_tail),
+            timer_start
+        )
+
+    @staticmethod
+    def _unexported_result(blend_file:str, status:str, message:str, timer_start:float)->BlendFileResult:
+        return BlendFileResult(
+            blendFile=blend_file,
+            status=status,
+            errors=[{"message": message, "root": None, "object": None, "count": 1}],
+            warnings=[],
+            errorCount=1,
+            warningCount=0,
+            timings={"total": time.perf_counter() - timer_start},
+            outputs=[],
+        )
+
+
+def mark_shared_outputs(results:List[BlendFileResult])->List[BlendFileResult]:
+    '''
+    Returns results with every .blend file that writes an OBJ another .blend file
+    also writes marked failed, with an error naming the others. Which one is left
+    on disk depends on which Blender finished last
+    '''
+    writers = collections.defaultdict(list) # type: Dict[str, List[str]]
+    for result in results:
+        for output in result.outputs:
+            writers[os.path.normcase(output)].append(result.blendFile)
+
+    marked = [] # type: List[BlendFileResult]
+    for result in results:
+        errors = []
+        for output in result.outputs:
+            others = [blend_file for blend_file in writers[os.path.normcase(output)] if blend_file != result.blendFile]
+            if others:
+                errors.append({
+                    "message": "%s is also written by %s, they overwrite each other" % (output, ", ".join(others)),
+                    "root": None,
+                    "object": None,
+                    "count": 1
+                })
+        if errors:
+            result = result._replace(status="failed", errors=result.errors + errors, errorCount=result.errorCount + len(errors))
+        marked.append(result)
+    return marked
+
+
+def write_report(filepath:str, results:List[BlendFileResult], seconds:float)->None:
+    statuses = collections.Counter(result.status for result in results)
+    report = {
+        "version": REPORT_FORMAT_VERSION,
+        "summary": {
+            "files": len(results),
+            "statuses": dict(statuses),
+            "errors": sum(result.errorCount for result in results),
+            "warnings": sum(result.warningCount for result in results),
+            "seconds": seconds,
+        },
+        "files": [result._asdict() for result in results],
+    }
+    with open(filepath, "w") as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+
+
+def main(argv=None)->int:
+    '''
+    Return is exit code, 0 for good, anything else is an error
+    '''
+    timer_start = time.perf_counter()
+    if argv is None:
+        argv = _make_argparse().parse_args(sys.argv[1:])
+
+    blend_files = find_blend_files(argv.blend_files, argv.manifest)
+    if not blend_files:
+        print("No .blend files given, see --help")
+        return 1
+
+    jobs = max(1, min(argv.jobs, len(blend_files)))
+    os.makedirs(argv.log_dir, exist_ok=True)
+    if argv.output_dir:
+        argv.output_dir = os.path.abspath(argv.output_dir)
+        os.makedirs(argv.output_dir, exist_ok=True)
+
+    free_blenders = queue.Queue() # type: queue.Queue
+    blenders = [] # type: List[BatchBlender]
+    for job in range(jobs):
+        blenders.append(BatchBlender(argv, os.path.join(argv.log_dir, "batch_export_job_%d.log" % job)))
+        free_blenders.put(blenders[-1])
+
+    def export_in_free_blender(blend_file:str)->BlendFileResult:
+        blender = free_blenders.get()
+        try:
+            return blender.export(blend_file)
+        finally:
+            free_blenders.put(blender)
+
+    results = [] # type: List[BlendFileResult]
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(export_in_free_blender, blend_file) for blend_file in blend_files]
+            # Reported in the order given, no matter which Blender finishes first
+            for future in futures:
+                result = future.result()
+                results.append(result)
+                if result.status != "exported":
+                    print("%s %s: %d errors, %d warnings" % (result.blendFile, result.status.upper(), result.errorCount, result.warningCount))
+                    for error in result.errors[:5]:
+                        print("    " + error["message"].splitlines()[0])
+                elif not argv.quiet:
+                    print("%s exported in %.2f seconds, %d warnings" % (result.blendFile, result.timings["total"], result.warningCount))
+    finally:
+        for blender in blenders:
+            blender.close()
+
+    marked_results = mark_shared_outputs(results)
+    for result, marked_result in zip(results, marked_results):
+        for error in marked_result.errors[len(result.errors):]:
+            print("%s FAILED: %s" % (result.blendFile, error["message"]))
+    results = marked_results
+
+    seconds = time.perf_counter() - timer_start
+    write_report(argv.report, results, seconds)
+
+    failed = sum(1 for result in results if result.status != "exported")
+    print("FINAL RESULTS: %d of %d .blend files exported, %d failed. Finished in %.2f seconds, report in %s"
+          % (len(results) - failed, len(results), failed, seconds, argv.report))
+    return 1 if failed else 0
+
+
+def export_blend_file(blend_file:str, output_dir:Optional[str])->BlendFileResult:
+    '''
+    Worker side: Opens and exports one .blend file in this Blender
+    '''
+    import contextlib
+    import io
+    import traceback
+
+    import bpy
+    from io_xplane2blender import xplane_export
+    from io_xplane2blender.xplane_helpers import logger
+
+    def to_dicts(messages)->List[Dict[str, Any]]:
+        return [{"message": message.message, "root": message.root, "object": message.object, "count": message.count}
+                for message in messages]
+
+    timings = {} # type: Dict[str, float]
+    timer_start = time.perf_counter()
+    logger.clearMessages()
+    # Left over from the last file if this one can't be opened
+    del xplane_export.lastExportFilepaths[:]
+    # The exporter prints everything it logs, it doesn't need to go anywhere
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            bpy.ops.wm.open_mainfile(filepath=blend_file)
+            timings["open"] = time.perf_counter() - timer_start
+
+            export_start = time.perf_counter()
+            if output_dir:
+                result = bpy.ops.export.xplane_obj(filepath=os.path.join(output_dir, ""))
+            else:
+                result = bpy.ops.export.xplane_obj(filepath="", export_is_relative=True)
+            timings["export"] = time.perf_counter() - export_start
+        except Exception:
+            logger.error(traceback.format_exc())
+            status = "exception"
+        else:
+            status = "exported" if result == {"FINISHED"} and not logger.hasErrors() else "failed"
+    timings["total"] = time.perf_counter() - timer_start
+
+    return BlendFileResult(
+        blendFile=blend_file,
+        status=status,
+        errors=to_dicts(logger.findErrors()),
+        warnings=to_dicts(logger.findWarnings()),
+        errorCount=logger.countErrors(),
+        warningCount=logger.countWarnings(),
+        timings=timings,
+        outputs=list(xplane_export.lastExportFilepaths),
+    )
+
+
+def worker_main()->None:
+    host, port = os.environ[WORKER_ADDRESS_ENV_VAR].rsplit(":", 1)
+    with socket.create_connection((host, int(port))) as connection:
+        stream = connection.makefile("rw", encoding="utf-8", newline="\n")
+        stream.write(os.environ[WORKER_TOKEN_ENV_VAR] + "\n")
+        stream.flush()
+
+        for request in stream:
+            request = json.loads(request)
+            result = export_blend_file(request["blendFile"], request["outputDir"])
+            stream.write(json.dumps(result._asdict()) + "\n")
+            stream.flush()
+
+
+if __name__ == "__main__":
+    # Blender stops parsing after '--', we start there
+    if "--" in sys.argv and "--worker" in sys.argv[sys.argv.index("--") + 1:]:
+        worker_main()
+    else:
+        sys.exit(main())
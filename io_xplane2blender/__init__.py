@@ -43,6 +43,7 @@ if "bpy" in locals():
     imp.reload(xplane_ops_dev)
     imp.reload(xplane_config)
     imp.reload(xplane_updater)
+    imp.reload(xplane_live_export)
 else:
     import bpy
     from . import xplane_ui
@@ -51,7 +52,9 @@ else:
     from . import xplane_ops
     from . import xplane_ops_dev
     from . import xplane_config
+    from . import xplane_helpers
     from . import xplane_updater
+    from . import xplane_live_export
 
 
 # Function: menu_func
@@ -66,21 +69,25 @@ def menu_func(self, context):
 # Function: register
 # Registers the addon with all its classes and the menu function.
 def register():
+    xplane_helpers.register()
     xplane_export.register()
     xplane_props.register()
     xplane_ops.register()
     xplane_ops_dev.register()
     xplane_ui.register()
+    xplane_live_export.register()
     bpy.types.TOPBAR_MT_file_export.append(menu_func)
 
 # Function: unregister
 # Unregisters the addon and all its classes and removes the entry from the menu.
 def unregister():
+    xplane_live_export.unregister()
     xplane_export.unregister()
     xplane_ui.unregister()
     xplane_ops.unregister()
     xplane_ops_dev.unregister()
     xplane_props.unregister()
+    xplane_helpers.unregister()
     bpy.types.TOPBAR_MT_file_export.remove(menu_func)
 
 if __name__ == "__main__":
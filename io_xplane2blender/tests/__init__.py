@@ -1,25 +1,32 @@
 import collections
 import pathlib
 import itertools
+import json
 import os
 import shutil
 import sys
+import time
 import unittest
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import bpy
 import io_xplane2blender
+import numpy
 from io_xplane2blender import xplane_config, xplane_helpers
 from io_xplane2blender.tests import animation_file_mappings, test_creation_helpers
 from io_xplane2blender.xplane_config import getDebug, setDebug
 from io_xplane2blender.xplane_helpers import XPlaneLogger, logger
 from io_xplane2blender.xplane_types import (xplane_bone, xplane_file,
-                                            xplane_primitive)
+                                            xplane_manipulator, xplane_primitive)
 
 FLOAT_TOLERANCE = 0.0001
 
 __dirname__ = os.path.dirname(__file__)
-TMP_DIR = os.path.realpath(os.path.join(__dirname__, '../../tests/tmp'))
+# tests.py gives each parallel worker its own folder, otherwise everything shares tests/tmp
+TMP_DIR = os.path.realpath(
+    os.environ.get("XPLANE2BLENDER_TEST_TMP_DIR")
+    or os.path.join(__dirname__, '../../tests/tmp')
+)
 
 FilterLinesCallback = Callable[[List[Union[float, str]]], bool]
 
@@ -74,6 +81,7 @@ class XPlaneTestCase(unittest.TestCase):
         dd_index = sys.argv.index('--')
         blender_args, xplane_args = sys.argv[:dd_index],sys.argv[dd_index+1:]
         setDebug('--force-xplane-debug' in xplane_args)
+        xplane_helpers.clear_scene_index()
 
         if useLogger:
             self.useLogger()
@@ -174,6 +182,47 @@ class XPlaneTestCase(unittest.TestCase):
 
         return lines
 
+    @staticmethod
+    def _linesAlmostEqual(
+            linesA:List[Tuple[Union[float, str], ...]],
+            linesB:List[Tuple[Union[float, str], ...]],
+            floatTolerance:float)->bool:
+        '''
+        A fast check that parsed lines match, using the same rules as assertFilesEqual.
+        Identical lines are skipped, the rest of the numbers are gathered by directive
+        and compared all at once. False means there is a mismatch somewhere,
+        not where or why
+        '''
+        if len(linesA) != len(linesB):
+            return False
+
+        # directive: ([numbers from a], [numbers from b])
+        numbers = collections.defaultdict(lambda: ([], [])) # type: Dict[str, Tuple[List[float], List[float]]]
+        for lineA, lineB in zip(linesA, linesB):
+            if lineA == lineB:
+                continue
+            if len(lineA) != len(lineB) or lineA[0] != lineB[0]:
+                return False
+
+            numbersA, numbersB = numbers[lineA[0]]
+            for segmentA, segmentB in zip(lineA, lineB):
+                if isinstance(segmentA, (float, int)) and isinstance(segmentB, (float, int)):
+                    numbersA.append(segmentA)
+                    numbersB.append(segmentB)
+                elif segmentA != segmentB:
+                    return False
+
+        for directive, (numbersA, numbersB) in numbers.items():
+            numbersA = numpy.array(numbersA, dtype=numpy.float64)
+            numbersB = numpy.array(numbersB, dtype=numpy.float64)
+            # See the TODO in assertFilesEqual, rotations and manip keyframes are compared unsigned
+            if isinstance(directive, str) and ("rotate" in directive or "manip_keyframe" in directive):
+                numbersA = numpy.abs(numbersA)
+                numbersB = numpy.abs(numbersB)
+            if not numpy.all(numpy.abs(numbersA - numbersB) < floatTolerance):
+                return False
+        return True
+
     def assertFilesEqual(self,
                          a: str,
                          b: str,
@@ -183,6 +232,10 @@ class XPlaneTestCase(unittest.TestCase):
         a and b should be the contents of files a and b as returned
         from open(file).read()
         '''
+        # Identical text can't have any differences to explain
+        if a == b:
+            return
+
         def isnumber(d):
             return isinstance(d, (float, int))
 
@@ -197,6 +250,10 @@ class XPlaneTestCase(unittest.TestCase):
             linesA = list(filter(filterCallback, linesA))
             linesB = list(filter(filterCallback, linesB))
 
+        if self._linesAlmostEqual(linesA, linesB, floatTolerance):
+            return
+
+        # Something is different, compare line by line to find and explain it
         # ensure same number of lines
         try:
             self.assertEquals(len(linesA), len(linesB))
@@ -302,7 +359,7 @@ class XPlaneTestCase(unittest.TestCase):
         of all messages
         """
         try:
-            found_errors = len(logger.findErrors())
+            found_errors = logger.countErrors()
             self.assertEqual(found_errors, expected_logger_errors)
         except AssertionError as e:
             raise AssertionError(f"Expected {expected_logger_errors} logger errors, got {found_errors}") from None
@@ -378,6 +435,60 @@ class XPlaneTestCase(unittest.TestCase):
             else:
                 self.assertEquals(expectedValue, value, 'Attribute "%s" is not equal' % name)
 
+    def assertSearchIndexMatchesLinearSearch(self,
+                                             search_index:"SearchIndex",
+                                             keys:List[str],
+                                             filter_names:List[str])->None:
+        """
+        Asserts search_index finds exactly what the search windows' old
+        linear scan over keys finds, for each filter_name
+        """
+        self.assertEqual(len(search_index), len(keys))
+
+        def linear_search(filter_name:str)->Set[int]:
+            searches = {frozenset(search.split(' ')) for search in filter_name.upper().split('|')}
+            return {i for i, key in enumerate(keys)
+                    if any(all(term in key.upper() for term in search) for search in searches)}
+
+        for filter_name in filter_names:
+            self.assertEqual(search_index.search(filter_name), linear_search(filter_name), msg=filter_name)
+
+    def assertSearchIndexErrorRemembered(self,
+                                         get_search_index:Callable[[str], Union["SearchIndex", str]],
+                                         filename:str,
+                                         bad_contents:str,
+                                         good_contents:str)->None:
+        """
+        Asserts get_search_index remembers why a resource file couldn't be parsed
+        until the file changes, instead of re-parsing it every redraw.
+
+        bad_contents and good_contents must be the same length, so swapping them
+        and putting back the mtime doesn't look like a change
+        """
+        self.assertEqual(len(bad_contents), len(good_contents))
+        os.makedirs(TMP_DIR, exist_ok=True)
+        filepath = os.path.join(TMP_DIR, filename)
+        with open(filepath, "w") as resource_file:
+            resource_file.write(bad_contents)
+        try:
+            os.remove(filepath + ".pickle")
+        except FileNotFoundError:
+            pass
+        stat = os.stat(filepath)
+
+        error = get_search_index(filepath)
+        self.assertIsInstance(error, str)
+
+        with open(filepath, "w") as resource_file:
+            resource_file.write(good_contents)
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(get_search_index(filepath), error)
+
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        search_index = get_search_index(filepath)
+        self.assertNotIsInstance(search_index, str)
+        self.assertEqual(len(search_index), 1)
+
     def createXPlaneFileFromPotentialRoot(
             self,
             potential_root:Union[xplane_helpers.PotentialRoot, str],
@@ -438,7 +549,7 @@ class XPlaneTestCase(unittest.TestCase):
         else:
             xp_file = xplane_file.createFileFromBlenderRootObject(potential_root, view_layer)
         out = xp_file.write()
-        xplane_file._all_keyframe_infos.clear()
+        xplane_file.clearExportCaches()
 
         if dest:
             with open(os.path.join(TMP_DIR, dest + '.obj'), 'w') as tmp_file:
@@ -514,13 +625,30 @@ def make_fixture_path(dirname,filename,sub_dir=""):
     return os.path.join(dirname, 'fixtures', sub_dir, filename + '.obj')
 
 
+class TimedTextTestResult(unittest.TextTestResult):
+    """Also records how long each test method took, for tests.py's timing history"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_timings = {} # type: Dict[str, float]
+        self._test_start = 0.0
+
+    def startTest(self, test):
+        self._test_start = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.test_timings[f"{type(test).__name__}.{test._testMethodName}"] = time.perf_counter() - self._test_start
+
+
 def runTestCases(testCases):
     #Until a better solution for knowing if the logger's error count should be used to quit the testing,
     #we are currently saying only 1 is allow per suite at a time (which is likely how it should be anyways)
     assert len(testCases) == 1, "Currently, only one test case per suite is supported at a time"
     suite = unittest.defaultTestLoader.loadTestsFromTestCase(testCases[0])
-    test_result = unittest.TextTestRunner().run(suite)
+    test_result = unittest.TextTestRunner(resultclass=TimedTextTestResult).run(suite)
 
     # See XPlane2Blender/tests.py for documentation. The strings must be kept in sync!
     # This is not an optional debug print statement! The test runner needs this print statement to function
     print(f"RESULT: After {(test_result.testsRun)} tests got {len(test_result.errors)} errors, {len(test_result.failures)} failures, and {len(test_result.skipped)} skipped")
+    print(f"TIMINGS: {json.dumps(test_result.test_timings)}")
@@ -1,7 +1,15 @@
-"""The starting point for the export process, the start of the addon"""
+"""
+The starting point for the export process, the start of the addon.
 
+xplane_types (and everything collecting and writing needs, like numpy)
+is only imported once an export starts, keeping Blender's startup fast
+"""
+
+import contextlib
+import hashlib
 import os
 import os.path
+import shutil
 import sys
 
 import bpy
@@ -10,10 +18,8 @@ import mathutils
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 from .xplane_config import getDebug
-from .xplane_helpers import XPlaneLogger, logger
-from .xplane_types import xplane_file
-
-from typing import Any, IO, Optional
+from .xplane_helpers import XPlaneLogger, frame_state, logger
+from typing import Any, Dict, IO, List, Optional, Tuple
 
 
 class XPLANE_MT_xplane_export_log(bpy.types.Menu):
@@ -28,6 +34,149 @@ def showLogDialog():
     if not ('-b' in sys.argv or '--background' in sys.argv):
         bpy.ops.wm.call_menu(name="XPLANE_MT_xplane_export_log")
 
+@contextlib.contextmanager
+def sceneInContext(scene:bpy.types.Scene):
+    """
+    Makes scene bpy.context.scene for the with block, since the exporter
+    reads settings like the X-Plane version from there.
+
+    Raises RuntimeError if Blender won't switch scenes, like in background mode
+    """
+    if bpy.context.scene == scene:
+        yield
+        return
+
+    window = bpy.context.window
+    if window is None:
+        raise RuntimeError("Can't switch to scene '%s' without a window to show it in" % scene.name)
+    oldScene = window.scene
+    window.scene = scene
+    try:
+        if bpy.context.scene != scene:
+            raise RuntimeError("Blender did not switch to scene '%s'" % scene.name)
+        yield
+    finally:
+        window.scene = oldScene
+
+
+def _contentHash(text:str)->bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def writeIfChanged(filepath:str, content:str)->bool:
+    """
+    Writes content to filepath, unless the file already has exactly that content.
+    The file is written next to it under a temporary name first, then renamed over it,
+    so it is never left half written. An existing file's permissions are kept.
+
+    Returns True if the file was written, raises OSError like open would
+    """
+    # Compared as it would be written, with this platform's line endings
+    content_on_disk = content.replace("\n", os.linesep)
+    try:
+        with open(filepath, "r", newline="") as old_file:
+            if _contentHash(old_file.read()) == _contentHash(content_on_disk):
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    tmp_filepath = "%s.%d.tmp" % (filepath, os.getpid())
+    try:
+        with open(tmp_filepath, "w") as tmp_file:
+            tmp_file.write(content)
+        if os.path.exists(filepath):
+            shutil.copymode(filepath, tmp_filepath)
+        os.replace(tmp_filepath, filepath)
+    except OSError:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
+    return True
+
+
+# The OBJs the last run of EXPORT_OT_ExportXPlane wrote or found unchanged,
+# for batch_export.py which can't get anything else back from an operator
+lastExportFilepaths = [] # type: List[str]
+
+
+def describeWrites(written:int, unchanged:int, found:int)->str:
+    """
+    Says how many of the found OBJs were written and left unchanged. The rest
+    weren't written or compared at all (Dry Run, or nothing in them to export)
+    """
+    description = "%d of %d OBJs written, %d unchanged" % (written, found, unchanged)
+    if found - written - unchanged:
+        description += ", %d not written" % (found - written - unchanged)
+    return description
+
+
+def writeXPlaneFile(xplaneFile: "xplane_file.XPlaneFile",
+                    directory: str,
+                    writtenFilepaths: Optional[List[str]] = None,
+                    unchangedFilepaths: Optional[List[str]] = None)->bool:
+    """
+    Finally, at the end of it all, attempts to write an XPlaneFile.
+    OBJs whose content hasn't changed are not touched, when an OBJ is written
+    its path is appended to writtenFilepaths, when it is unchanged to
+    unchangedFilepaths (if given).
+
+    Returns False if there was a problem, else True
+    """
+    debug = getDebug()
+
+    # only write layers that contain objects
+    if not xplaneFile.get_xplane_objects():
+        return False
+
+    if xplaneFile.filename.find('//') == 0:
+        xplaneFile.filename = xplaneFile.filename.replace('//','',1)
+
+    #Change any backslashes to foward slashes for file paths
+    xplaneFile.filename = xplaneFile.filename.replace('\\','/')
+
+    if os.path.isabs(xplaneFile.filename):
+        logger.error("Bad export path %s: File paths must be relative to the .blend file" % (xplaneFile.filename))
+        return False
+
+    # Get the relative path
+    # Append .obj if needed
+    # Make paths based on the absolute path
+    # Write
+    relpath = os.path.normpath(os.path.join(directory, xplaneFile.filename))
+    if not '.obj' in relpath:
+        relpath += '.obj'
+
+    fullpath = os.path.abspath(os.path.join(os.path.dirname(bpy.context.blend_data.filepath),relpath))
+    with logger.withContext(root=xplaneFile.filename):
+        out = xplaneFile.write()
+
+    if logger.hasErrors():
+        return False
+
+    plugin_development = bpy.context.scene.xplane.plugin_development
+    dry_run = bpy.context.scene.xplane.dev_export_as_dry_run
+    if (not plugin_development or (plugin_development and not dry_run)):
+        try:
+            os.makedirs(os.path.dirname(fullpath),exist_ok=True)
+            logger.info("Writing %s" % fullpath)
+            written = writeIfChanged(fullpath, out)
+        except OSError as e:
+            logger.error(e)
+        else:
+            if written:
+                if writtenFilepaths is not None:
+                    writtenFilepaths.append(fullpath)
+                logger.success("Wrote %s" % fullpath)
+            else:
+                if unchangedFilepaths is not None:
+                    unchangedFilepaths.append(fullpath)
+                logger.success("%s is unchanged, not rewritten" % fullpath)
+    else:
+        logger.info('Skipped writing %s due to "Dry Run"' % (fullpath))
+
+    return True
+
+
 class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
     '''Export to X-Plane Object file format (.obj)'''
     bl_idname = "export.xplane_obj"
@@ -41,6 +190,16 @@ class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
         maxlen= 1024, default= ""
     )
 
+    all_scenes: bpy.props.BoolProperty(
+        name = "All Scenes",
+        description = "Export the roots of every scene, not just the current one",
+        default = False)
+
+    scene_names: bpy.props.StringProperty(
+        name = "Scenes",
+        description = "Comma separated names of the scenes to export, instead of just the current one",
+        default = "")
+
     export_is_relative: bpy.props.BoolProperty(
         name = "Export Is Relative",
         description="Set to true when starting the export via the button (with or without the GUI on in case of unit testing)",
@@ -53,8 +212,11 @@ class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
     # Parameters:
     #   context - Blender context object.
     def execute(self, context):
+        from .xplane_types import xplane_file
+
         # prepare logging
         self._startLogging()
+        del lastExportFilepaths[:]
 
         debug = getDebug()
         export_directory = self.properties.filepath
@@ -73,31 +235,47 @@ class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
             bpy.context.scene.xplane.dev_enable_breakpoints:
             breakpoint()
 
-        # store current frame as we will go back to it
-        currentFrame = bpy.context.scene.frame_current
-
-        # goto first frame so everything is in inital state
-        bpy.context.scene.frame_set(frame = 1)
-        bpy.context.view_layer.update()
+        scenes = self._scenesToExport()
+        if scenes is None:
+            self._endLogging()
+            return {'CANCELLED'}
 
-        xplaneFiles = xplane_file.createFilesFromBlenderRootObjects(bpy.context.scene, bpy.context.view_layer)
-        for xplaneFile in xplaneFiles:
-            if not self._writeXPlaneFile(xplaneFile, export_directory):
-                if logger.hasErrors():
+        # Keyframes and manipulator checks are remembered for the whole run.
+        # Anything remembered from before is out of date
+        xplane_file.clearExportCaches()
+        xplaneFiles = [] # type: List["xplane_file.XPlaneFile"]
+        writtenFilepaths = [] # type: List[str]
+        unchangedFilepaths = [] # type: List[str]
+        sceneReports = [] # type: List[Tuple[str, int, int, int]]
+        exportedBy = {} # type: Dict[str, str]
+        try:
+            for scene in scenes:
+                writtenBefore = len(writtenFilepaths)
+                unchangedBefore = len(unchangedFilepaths)
+                try:
+                    with sceneInContext(scene):
+                        sceneFiles = self._exportCurrentScene(export_directory, writtenFilepaths, unchangedFilepaths)
+                except RuntimeError as e:
+                    logger.error(e)
+                    sceneFiles = None
+
+                if sceneFiles is None:
                     self._endLogging()
-                    showLogDialog()
-
-                if bpy.context.scene.xplane.plugin_development and \
-                    bpy.context.scene.xplane.dev_continue_export_on_error:
-                    logger.info("Continuing export despite error in %s" % xplaneFile.filename)
-                    logger.clearMessages()
-                    continue
-                else:
                     return {'CANCELLED'}
 
-        # return to stored frame
-        bpy.context.scene.frame_set(frame = currentFrame)
-        bpy.context.view_layer.update()
+                for xplaneFile in sceneFiles:
+                    if exportedBy.get(xplaneFile.filename, scene.name) != scene.name:
+                        logger.warn("%s is exported by scene '%s' and scene '%s', only the last is kept"
+                                    % (xplaneFile.filename, exportedBy[xplaneFile.filename], scene.name))
+                    exportedBy[xplaneFile.filename] = scene.name
+                xplaneFiles.extend(sceneFiles)
+                sceneReports.append((scene.name,
+                                     len(writtenFilepaths) - writtenBefore,
+                                     len(unchangedFilepaths) - unchangedBefore,
+                                     len(sceneFiles)))
+        finally:
+            xplane_file.clearExportCaches()
+            lastExportFilepaths.extend(writtenFilepaths + unchangedFilepaths)
 
         #TODO: enable when log dialog box is working
         #if logger.hasErrors() or logger.hasWarnings():
@@ -111,10 +289,71 @@ class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
             self._endLogging()
             return {'CANCELLED'}
         elif not logger.hasErrors() and xplaneFiles:
-            logger.success("Export finished without errors")
+            if len(scenes) > 1:
+                for sceneName, written, unchanged, found in sceneReports:
+                    logger.success("Scene '%s': %s" % (sceneName, describeWrites(written, unchanged, found)))
+            logger.success("Export finished without errors, %s"
+                           % describeWrites(len(writtenFilepaths), len(unchangedFilepaths), len(xplaneFiles)))
             self._endLogging()
             return {'FINISHED'}
 
+    def _scenesToExport(self)->Optional[List[bpy.types.Scene]]:
+        """
+        Returns the scenes chosen by all_scenes or scene_names,
+        otherwise the current scene. Returns None if a scene is missing
+        """
+        if self.properties.all_scenes:
+            return list(bpy.data.scenes)
+        elif self.properties.scene_names.strip():
+            scenes = []
+            for name in filter(None, (name.strip() for name in self.properties.scene_names.split(","))):
+                try:
+                    scenes.append(bpy.data.scenes[name])
+                except KeyError:
+                    logger.error("There is no scene named '%s' to export" % name)
+            return None if logger.hasErrors() else scenes
+        else:
+            return [bpy.context.scene]
+
+    def _exportCurrentScene(self,
+                            export_directory:str,
+                            writtenFilepaths:List[str],
+                            unchangedFilepaths:List[str])->Optional[List["xplane_file.XPlaneFile"]]:
+        """
+        Exports the roots of bpy.context.scene, returning the XPlaneFiles found,
+        or None if the export has to stop
+        """
+        from .xplane_types import xplane_file
+
+        scene = bpy.context.scene
+        # store current frame as we will go back to it
+        currentFrame = scene.frame_current
+
+        # goto first frame so everything is in inital state
+        frame_state.set(scene, 1)
+        bpy.context.view_layer.update()
+
+        try:
+            xplaneFiles = xplane_file.createFilesFromBlenderRootObjects(scene, bpy.context.view_layer, clear_caches=False)
+            for xplaneFile in xplaneFiles:
+                if not writeXPlaneFile(xplaneFile, export_directory, writtenFilepaths, unchangedFilepaths):
+                    if logger.hasErrors():
+                        showLogDialog()
+
+                    if scene.xplane.plugin_development and \
+                        scene.xplane.dev_continue_export_on_error:
+                        logger.info("Continuing export despite error in %s" % xplaneFile.filename)
+                        logger.clearMessages()
+                        continue
+                    else:
+                        return None
+        finally:
+            # return to stored frame
+            frame_state.set(scene, currentFrame)
+            bpy.context.view_layer.update()
+
+        return xplaneFiles
+
     def _startLogging(self):
         debug = getDebug()
         logLevels = ['error', 'warning']
@@ -147,58 +386,6 @@ class EXPORT_OT_ExportXPlane(bpy.types.Operator, ExportHelper):
         if self.logFile:
             self.logFile.close()
 
-    def _writeXPlaneFile(self, xplaneFile: xplane_file.XPlaneFile, directory: str)->bool:
-        """
-        Finally, at the end of it all, attempts to write an XPlaneFile.
-        Returns False if there was a problem, else True
-        """
-        debug = getDebug()
-
-        # only write layers that contain objects
-        if not xplaneFile.get_xplane_objects():
-            return False
-
-        if xplaneFile.filename.find('//') == 0:
-            xplaneFile.filename = xplaneFile.filename.replace('//','',1)
-
-        #Change any backslashes to foward slashes for file paths
-        xplaneFile.filename = xplaneFile.filename.replace('\\','/')
-
-        if os.path.isabs(xplaneFile.filename):
-            logger.error("Bad export path %s: File paths must be relative to the .blend file" % (xplaneFile.filename))
-            return False
-
-        # Get the relative path
-        # Append .obj if needed
-        # Make paths based on the absolute path
-        # Write
-        relpath = os.path.normpath(os.path.join(directory, xplaneFile.filename))
-        if not '.obj' in relpath:
-            relpath += '.obj'
-
-        fullpath = os.path.abspath(os.path.join(os.path.dirname(bpy.context.blend_data.filepath),relpath))
-        out = xplaneFile.write()
-
-        if logger.hasErrors():
-            return False
-
-        plugin_development = bpy.context.scene.xplane.plugin_development
-        dry_run = bpy.context.scene.xplane.dev_export_as_dry_run
-        if (not plugin_development or (plugin_development and not dry_run)):
-            try:
-                os.makedirs(os.path.dirname(fullpath),exist_ok=True)
-            except OSError as e:
-                logger.error(e)
-            else:
-                with open(fullpath, "w") as objFile:
-                    logger.info("Writing %s" % fullpath)
-                    objFile.write(out)
-                    logger.success("Wrote %s" % fullpath)
-        else:
-            logger.info('Skipped writing %s due to "Dry Run"' % (fullpath))
-
-        return True
-
     def invoke(self, context, event):
         """
         Used from Blender when user hits the Export-Entry in the File>Export menu.
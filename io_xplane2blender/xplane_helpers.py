@@ -1,13 +1,15 @@
+import contextlib
 import datetime
 import itertools
 import os
 import re
 from datetime import timezone
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import bpy
 import io_xplane2blender
 import mathutils
+from bpy.app.handlers import persistent
 from io_xplane2blender import xplane_config, xplane_constants
 from io_xplane2blender.xplane_constants import PRECISION_OBJ_FLOAT
 
@@ -96,6 +98,37 @@ def get_rotation_from_rotatable(
         return obj_or_bone.rotation_euler.copy()
 
 
+# The scene index: every collection in a scene (by scene.as_pointer()), and the path of
+# child names to each collection's LayerCollection in a view layer (by view_layer.as_pointer()).
+# UI draws, finding roots, and exporting all need these, and walking a tree of thousands
+# of collections each time is slow.
+#
+# Only the shape of the tree is kept. Visibility changes all the time (scripts, tests,
+# the outliner) so it is always read from the LayerCollection itself.
+#
+# IMPORTANT! This holds onto collections, so it must be cleared whenever they could
+# have been added, removed, re-parented, or freed. We clear
+# - when the number of collections changes, checked every time
+# - in scene_index_depsgraph_handler, for changes made in Blender
+# - on undo, redo, and loading a file
+# - in xplane_file.createFilesFromBlenderRootObjects and xplane_file.clearExportCaches
+_scene_collections: Dict[int, List[bpy.types.Collection]] = {}
+_layer_collection_paths: Dict[int, Dict[str, Tuple[str, ...]]] = {}
+_scene_index_collection_count = -1
+
+
+def clear_scene_index()->None:
+    _scene_collections.clear()
+    _layer_collection_paths.clear()
+
+
+def _check_scene_index()->None:
+    global _scene_index_collection_count
+    if _scene_index_collection_count != len(bpy.data.collections):
+        clear_scene_index()
+        _scene_index_collection_count = len(bpy.data.collections)
+
+
 def get_collections_in_scene(scene:bpy.types.Scene)->List[bpy.types.Collection]:
     """
     First entry in list is always the scene's 'Master Collection'
@@ -108,7 +141,14 @@ def get_collections_in_scene(scene:bpy.types.Scene)->List[bpy.types.Collection]:
 
         return collections
 
-    return [scene.collection] + get_collections_from_collection(scene.collection)
+    _check_scene_index()
+    try:
+        collections = _scene_collections[scene.as_pointer()]
+    except KeyError:
+        collections = _scene_collections[scene.as_pointer()] = (
+            [scene.collection] + get_collections_from_collection(scene.collection)
+        )
+    return collections[:]
 
 def get_layer_collections_in_view_layer(view_layer:bpy.types.ViewLayer)->List[bpy.types.LayerCollection]:
     """
@@ -127,10 +167,44 @@ def get_exportable_roots_in_scene(scene: bpy.types.Scene, view_layer:bpy.types.V
     return [root for root in filter(lambda o: is_exportable_root(o, view_layer), itertools.chain(get_collections_in_scene(scene), scene.objects))]
 
 
+def _find_layer_collection(collection:bpy.types.Collection, view_layer:bpy.types.ViewLayer)->Optional[bpy.types.LayerCollection]:
+    """
+    Returns collection's LayerCollection in view_layer, or None if it isn't in it.
+    LayerCollections are freed whenever Blender re-syncs the view layer, so we
+    remember the path to it and walk it, not the LayerCollection
+    """
+    def get_paths(layer_collection:bpy.types.LayerCollection, path:Tuple[str, ...])->Dict[str, Tuple[str, ...]]:
+        paths = {}
+        for child_lc in layer_collection.children:
+            child_path = path + (child_lc.name,)
+            paths[child_lc.name] = child_path
+            paths.update(get_paths(child_lc, child_path))
+        return paths
+
+    if collection.name == view_layer.layer_collection.name:
+        return view_layer.layer_collection
+
+    _check_scene_index()
+    paths = _layer_collection_paths.get(view_layer.as_pointer())
+    # If the tree changed without us hearing about it, the path is missing or
+    # leads nowhere. Then we look again, once, in a fresh set of paths
+    for fresh in ((False, True) if paths is not None else (True,)):
+        if fresh:
+            paths = _layer_collection_paths[view_layer.as_pointer()] = get_paths(view_layer.layer_collection, ())
+        layer_collection = view_layer.layer_collection
+        try:
+            for name in paths[collection.name]:
+                layer_collection = layer_collection.children[name]
+        except KeyError:
+            continue
+        return layer_collection
+    return None
+
+
 def is_visible_in_viewport(datablock: Union[bpy.types.Collection, bpy.types.Object], view_layer:bpy.types.ViewLayer)->Optional[ExportableRoot]:
     if isinstance(datablock, bpy.types.Collection):
-        all_layer_collections = {c.name: c for c in get_layer_collections_in_view_layer(view_layer)}
-        return all_layer_collections[datablock.name].is_visible
+        layer_collection = _find_layer_collection(datablock, view_layer)
+        return layer_collection is not None and layer_collection.is_visible
     elif isinstance(datablock, bpy.types.Object):
         return datablock.visible_get() or None
 
@@ -396,10 +470,60 @@ Logging Style Guide:
 Spending 20mins on a good error message is better than 2hrs troubleshooting an author's
 non-existant bug
 """
+class XPlaneLogMessage():
+    """
+    One logged message. Where it was logged from (root and object names)
+    is filled in from the logger's current context.
+
+    For older code, message['type'] works like message.type
+    """
+    __slots__ = ("type", "message", "context", "root", "object", "count")
+
+    def __init__(self,
+                 messageType:str,
+                 message:str,
+                 context=None,
+                 root:Optional[str]=None,
+                 object:Optional[str]=None)->None:
+        self.type = messageType
+        self.message = message
+        self.context = context
+        self.root = root
+        self.object = object
+        # How many times this was logged, more than 1 only when de-duplicating
+        self.count = 1
+
+    def __getitem__(self, key:str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __repr__(self)->str:
+        return f"<XPlaneLogMessage {self.type} {self.message!r} root={self.root} object={self.object} count={self.count}>"
+
+
 class XPlaneLogger():
+    # After this many messages of one type, only counts are kept.
+    # Transports still get every message
+    MAX_MESSAGES_PER_TYPE = 10000
+
     def __init__(self):
         self.transports = []
-        self.messages = []
+        self.messages = [] # type: List[XPlaneLogMessage]
+        # Message type: messages of that type, in order
+        self._messagesByType = {} # type: Dict[str, List[XPlaneLogMessage]]
+        # Message type: how many were logged, including repeats and ones past MAX_MESSAGES_PER_TYPE
+        self._counts = {} # type: Dict[str, int]
+        # (type, message, root, object): the first message, when de-duplicating
+        self._seen = {} # type: Dict[Tuple[str, str, Optional[str], Optional[str]], XPlaneLogMessage]
+
+        # If True, logging the same message from the same place again
+        # only increases the first message's count and isn't sent to transports
+        self.deduplicate = False
+
+        self.currentRoot = None # type: Optional[str]
+        self.currentObject = None # type: Optional[str]
 
     def addTransport(self, transport, messageTypes = ['error', 'warning', 'info', 'success']):
         self.transports.append({
@@ -416,6 +540,25 @@ class XPlaneLogger():
 
     def clearMessages(self):
         del self.messages[:]
+        self._messagesByType.clear()
+        self._counts.clear()
+        self._seen.clear()
+
+    @contextlib.contextmanager
+    def withContext(self, root:Optional[str] = None, obj:Optional[str] = None):
+        """
+        Messages logged inside this are marked with the root and object names given,
+        keeping the outer ones for those not given
+        """
+        oldRoot, oldObject = self.currentRoot, self.currentObject
+        if root is not None:
+            self.currentRoot = root
+        if obj is not None:
+            self.currentObject = obj
+        try:
+            yield self
+        finally:
+            self.currentRoot, self.currentObject = oldRoot, oldObject
 
     def messagesToString(self, messages = None):
         if messages == None:
@@ -424,16 +567,29 @@ class XPlaneLogger():
         out = ''
 
         for message in messages:
-            out += XPlaneLogger.messageToString(message['type'], message['message'], message['context']) + '\n'
+            out += XPlaneLogger.messageToString(message.type, message.message, message.context) + '\n'
 
         return out
 
     def log(self, messageType, message, context = None):
-        self.messages.append({
-            'type': messageType,
-            'message': message,
-            'context': context
-        })
+        self._counts[messageType] = self._counts.get(messageType, 0) + 1
+
+        if self.deduplicate:
+            key = (messageType, message, self.currentRoot, self.currentObject)
+            try:
+                self._seen[key].count += 1
+                return
+            except KeyError:
+                pass
+
+        record = XPlaneLogMessage(messageType, message, context, self.currentRoot, self.currentObject)
+        if self.deduplicate:
+            self._seen[key] = record
+
+        ofType = self._messagesByType.setdefault(messageType, [])
+        if len(ofType) < self.MAX_MESSAGES_PER_TYPE:
+            ofType.append(record)
+            self.messages.append(record)
 
         for transport in self.transports:
             if messageType in transport['types']:
@@ -451,21 +607,19 @@ class XPlaneLogger():
     def success(self, message, context = None):
         self.log('success', message, context)
 
-    def findOfType(self, messageType):
-        messages = []
+    def findOfType(self, messageType)->List[XPlaneLogMessage]:
+        """
+        Returns the kept messages of a type, which may be fewer than
+        countOfType if there were more than MAX_MESSAGES_PER_TYPE or repeats
+        """
+        return list(self._messagesByType.get(messageType, ()))
 
-        for message in self.messages:
-            if message['type'] == messageType:
-                messages.append(message)
+    def hasOfType(self, messageType)->bool:
+        return self._counts.get(messageType, 0) > 0
 
-        return messages
-
-    def hasOfType(self, messageType):
-        for message in self.messages:
-            if message['type'] == messageType:
-                return True
-
-        return False
+    def countOfType(self, messageType)->int:
+        """How many messages of this type were logged, including repeats and ones not kept"""
+        return self._counts.get(messageType, 0)
 
     def findErrors(self):
         return self.findOfType('error')
@@ -473,12 +627,18 @@ class XPlaneLogger():
     def hasErrors(self):
         return self.hasOfType('error')
 
+    def countErrors(self):
+        return self.countOfType('error')
+
     def findWarnings(self):
         return self.findOfType('warning')
 
     def hasWarnings(self):
         return self.hasOfType('warning')
 
+    def countWarnings(self):
+        return self.countOfType('warning')
+
     def findInfos(self):
         return self.findOfType('info')
 
@@ -519,3 +679,81 @@ class XPlaneLogger():
 
 
 logger = XPlaneLogger()
+
+
+class XPlaneFrameState():
+    """
+    Remembers which frame the exporter last had Blender evaluate, so
+    scene.frame_set, which re-evaluates the whole depsgraph, is only called
+    when the frame actually changes.
+
+    What is evaluated can only be trusted during one export, users (and tests)
+    change things in between. clear() is called with the other caches in
+    - xplane_file.clearExportCaches
+    - tests/__init__.exportExportableRoot
+    """
+    def __init__(self)->None:
+        # (scene name, frame) of our last frame_set
+        self._evaluated = None # type: Optional[Tuple[str, int]]
+        # How many times frame_set was really called, for tests and profiling
+        self.frame_set_count = 0
+
+    def set(self, scene:bpy.types.Scene, frame:int)->None:
+        """Makes frame the evaluated frame of scene, calling frame_set only if needed"""
+        if (self._evaluated == (scene.name, frame)
+                and scene.frame_current == frame):
+            return
+        scene.frame_set(frame)
+        self.frame_set_count += 1
+        self._evaluated = (scene.name, frame)
+
+    def clear(self)->None:
+        self._evaluated = None
+
+
+frame_state = XPlaneFrameState()
+
+
+def get_depsgraph(depsgraph:Optional[bpy.types.Depsgraph] = None)->bpy.types.Depsgraph:
+    """
+    Returns depsgraph, or the current one for handlers in
+    older Blenders, which aren't passed it
+    """
+    if depsgraph is not None:
+        return depsgraph
+    return (bpy.context.evaluated_depsgraph_get()
+            if hasattr(bpy.context, "evaluated_depsgraph_get")
+            else bpy.context.depsgraph)
+
+
+@persistent
+def scene_index_depsgraph_handler(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph = None)->None:
+    depsgraph = get_depsgraph(depsgraph)
+    if depsgraph.id_type_updated("COLLECTION"):
+        clear_scene_index()
+
+
+@persistent
+def scene_index_clear_handler(*args)->None:
+    clear_scene_index()
+
+
+_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, scene_index_depsgraph_handler),
+    (bpy.app.handlers.undo_post, scene_index_clear_handler),
+    (bpy.app.handlers.redo_post, scene_index_clear_handler),
+    (bpy.app.handlers.load_post, scene_index_clear_handler),
+)
+
+
+def register():
+    for handler_list, handler in _handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+
+def unregister():
+    for handler_list, handler in _handlers:
+        if handler in handler_list:
+            handler_list.remove(handler)
+    clear_scene_index()
@@ -0,0 +1,237 @@
+"""
+Live Export: re-exports the roots affected by changes, shortly after the changes stop.
+
+Turned on per scene with scene.xplane.live_export.
+
+1. depsgraph_update_post tells us what changed. We only write down names, so editing
+   stays as fast as ever
+2. Every change pushes back a timer. Once nothing has changed for live_export_delay
+   seconds, the timer finds which exportable roots the changes belong to
+3. Only those roots are collected and written, relative to the .blend file, with the
+   results in the usual xplane2blender.log text block
+
+A changed Object affects every root it, or any of its children, is collected into,
+because XPlaneBones are made from the Blender parent-child hierarchy (including parents
+outside of the root, see XPlaneFile.create_xplane_bone_hiearchy). A changed mesh,
+armature, light, material, or action affects the Objects using it.
+"""
+
+import time
+from typing import Iterable, List, Set, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+from io_xplane2blender import xplane_helpers
+from io_xplane2blender.xplane_helpers import PotentialRoot, XPlaneLogger, logger
+
+# (id_type, name) of everything changed since the last live export
+_changed_ids: Set[Tuple[str, str]] = set()
+
+# time.monotonic() of the latest change
+_last_change = 0.0
+
+# Changes seen while these are True are our own or the timeline's, not the user's
+_exporting = False
+_frame_changing = False
+
+# Datablocks that are the data of an Object
+_OBJECT_DATA_ID_TYPES = {"MESH", "ARMATURE", "LIGHT", "CURVE", "META", "FONT", "LATTICE", "CAMERA"}
+
+
+def _data_collection(id_type:str):
+    return {
+        "OBJECT": bpy.data.objects,
+        "COLLECTION": bpy.data.collections,
+        "MATERIAL": bpy.data.materials,
+        "ACTION": bpy.data.actions,
+        "MESH": bpy.data.meshes,
+        "ARMATURE": bpy.data.armatures,
+        "LIGHT": bpy.data.lights,
+        "CURVE": bpy.data.curves,
+        "META": bpy.data.metaballs,
+        "FONT": bpy.data.curves,
+        "LATTICE": bpy.data.lattices,
+        "CAMERA": bpy.data.cameras,
+    }.get(id_type)
+
+
+def _with_descendants(objects:Iterable[bpy.types.Object])->Set[bpy.types.Object]:
+    found = set()
+    stack = list(objects)
+    while stack:
+        obj = stack.pop()
+        if obj not in found:
+            found.add(obj)
+            stack.extend(obj.children)
+    return found
+
+
+def find_changed_objects(changed_ids:Iterable[Tuple[str, str]], scene:bpy.types.Scene)->Set[bpy.types.Object]:
+    """
+    Returns the Objects in the scene that changed or use something that changed,
+    and all of their children
+    """
+    changed = {id_type: set() for id_type in ("OBJECT", "MATERIAL", "ACTION", "DATA", "COLLECTION")}
+    for id_type, name in changed_ids:
+        collection = _data_collection(id_type)
+        datablock = collection.get(name) if collection is not None else None
+        if datablock is None:
+            # Deleted, or something we don't care about
+            continue
+        changed["DATA" if id_type in _OBJECT_DATA_ID_TYPES else id_type].add(datablock)
+
+    objects = set(changed["OBJECT"])
+    for collection in changed["COLLECTION"]:
+        objects.update(collection.all_objects)
+
+    if changed["MATERIAL"] or changed["ACTION"] or changed["DATA"]:
+        for obj in scene.objects:
+            if (obj.data in changed["DATA"]
+                    or (obj.animation_data and obj.animation_data.action in changed["ACTION"])
+                    or any(slot.material in changed["MATERIAL"] for slot in obj.material_slots)):
+                objects.add(obj)
+
+    return _with_descendants(obj for obj in objects if obj.name in scene.objects)
+
+
+def find_affected_roots(changed_ids:Iterable[Tuple[str, str]], scene:bpy.types.Scene, view_layer:bpy.types.ViewLayer)->List[PotentialRoot]:
+    """
+    Returns the exportable roots in the scene that contain, or are, something
+    that changed
+    """
+    changed_ids = set(changed_ids)
+    changed_objects = find_changed_objects(changed_ids, scene)
+    changed_collections = {name for id_type, name in changed_ids if id_type == "COLLECTION"}
+
+    affected = [] # type: List[PotentialRoot]
+    for potential_root in scene.objects[:] + xplane_helpers.get_collections_in_scene(scene)[1:]:
+        if not xplane_helpers.is_exportable_root(potential_root, view_layer):
+            continue
+        if isinstance(potential_root, bpy.types.Collection):
+            if (potential_root.name in changed_collections
+                    or not changed_objects.isdisjoint(potential_root.all_objects)):
+                affected.append(potential_root)
+        elif potential_root in changed_objects:
+            affected.append(potential_root)
+    return affected
+
+
+def export_roots(roots:List[PotentialRoot])->None:
+    """Collects and writes roots like the Export OBJs button, logging to xplane2blender.log"""
+    from io_xplane2blender import xplane_export
+    from io_xplane2blender.xplane_types import xplane_file
+
+    global _exporting
+    scene = bpy.context.scene
+    logLevels = ['error', 'warning', 'success']
+    logger.clearTransports()
+    logger.clearMessages()
+    logger.addTransport(XPlaneLogger.InternalTextTransport('xplane2blender.log'), logLevels)
+    logger.addTransport(XPlaneLogger.ConsoleTransport(), logLevels)
+
+    if not bpy.context.blend_data.filepath:
+        logger.error("Save your blend file to use Live Export")
+        return
+
+    _exporting = True
+    currentFrame = scene.frame_current
+    try:
+        xplane_helpers.frame_state.clear()
+        xplane_helpers.frame_state.set(scene, 1)
+        xplaneFiles = xplane_file.createFilesFromBlenderRootObjects(scene, bpy.context.view_layer, roots)
+        writtenFilepaths = [] # type: List[str]
+        unchangedFilepaths = [] # type: List[str]
+        for xplaneFile in xplaneFiles:
+            xplane_export.writeXPlaneFile(xplaneFile, "", writtenFilepaths, unchangedFilepaths)
+            if logger.hasErrors():
+                break
+        else:
+            logger.success("Live Export finished, %s"
+                           % xplane_export.describeWrites(len(writtenFilepaths), len(unchangedFilepaths), len(xplaneFiles)))
+    finally:
+        xplane_helpers.frame_state.set(scene, currentFrame)
+        _exporting = False
+
+
+def _live_export_timer():
+    """
+    Waits until nothing has changed for live_export_delay seconds,
+    then exports what was affected. Returns seconds until it should run again, or None when done
+    """
+    scene = bpy.context.scene
+    if not scene.xplane.live_export:
+        _changed_ids.clear()
+        return None
+
+    remaining = scene.xplane.live_export_delay - (time.monotonic() - _last_change)
+    if remaining > 0:
+        return remaining
+
+    changed_ids = set(_changed_ids)
+    _changed_ids.clear()
+    roots = find_affected_roots(changed_ids, scene, bpy.context.view_layer)
+    if roots:
+        export_roots(roots)
+    return None
+
+
+@persistent
+def depsgraph_update_handler(scene:bpy.types.Scene, depsgraph:bpy.types.Depsgraph = None)->None:
+    global _last_change
+    if (_exporting
+            or _frame_changing
+            or not scene.xplane.live_export):
+        return
+
+    for update in xplane_helpers.get_depsgraph(depsgraph).updates:
+        datablock = update.id.original
+        if datablock.id_type in {"SCENE", "WORLD", "WINDOWMANAGER", "SCREEN", "WORKSPACE"}:
+            continue
+        _changed_ids.add((datablock.id_type, datablock.name))
+
+    if _changed_ids:
+        _last_change = time.monotonic()
+        if not bpy.app.timers.is_registered(_live_export_timer):
+            bpy.app.timers.register(_live_export_timer, first_interval=scene.xplane.live_export_delay)
+
+
+@persistent
+def frame_change_pre_handler(scene:bpy.types.Scene, *args)->None:
+    global _frame_changing
+    _frame_changing = True
+
+
+@persistent
+def frame_change_post_handler(scene:bpy.types.Scene, *args)->None:
+    global _frame_changing
+    _frame_changing = False
+
+
+@persistent
+def load_post_handler(dummy)->None:
+    # Changes from the last file don't belong to this one
+    _changed_ids.clear()
+
+
+_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, depsgraph_update_handler),
+    (bpy.app.handlers.frame_change_pre, frame_change_pre_handler),
+    (bpy.app.handlers.frame_change_post, frame_change_post_handler),
+    (bpy.app.handlers.load_post, load_post_handler),
+)
+
+
+def register():
+    for handler_list, handler in _handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+
+def unregister():
+    for handler_list, handler in _handlers:
+        if handler in handler_list:
+            handler_list.remove(handler)
+    if bpy.app.timers.is_registered(_live_export_timer):
+        bpy.app.timers.unregister(_live_export_timer)
+    _changed_ids.clear()
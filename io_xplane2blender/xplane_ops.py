@@ -549,8 +549,13 @@ class SCENE_OT_export_to_relative_dir(bpy.types.Operator):
     #initial_dir that will be prepended to the path.
     initial_dir: bpy.props.StringProperty()
 
+    all_scenes: bpy.props.BoolProperty(
+        name="All Scenes",
+        description="Export the roots of every scene, not just the current one",
+        default=False)
+
     def execute(self, context):
-        bpy.ops.export.xplane_obj(filepath=self.initial_dir, export_is_relative=True)
+        bpy.ops.export.xplane_obj(filepath=self.initial_dir, export_is_relative=True, all_scenes=self.all_scenes)
         return {'FINISHED'}
 
 
@@ -580,10 +585,11 @@ class XPLANE_OT_CommandSearchToggle(bpy.types.Operator):
 
             command_search_list = bpy.context.scene.xplane.command_search_window_state.command_search_list
 
+            # Every command_search_list[-1] is another RNA lookup, keep what add gives us
             for command_info in file_content:
-                command_search_list.add()
-                command_search_list[-1].command = command_info.command
-                command_search_list[-1].command_description = command_info.description
+                item = command_search_list.add()
+                item.command = command_info.command
+                item.command_description = command_info.description
 
         prop = command_search_window_state.command_prop_dest
 
@@ -621,13 +627,14 @@ class XPLANE_OT_DatarefSearchToggle(bpy.types.Operator):
 
             dataref_search_list = bpy.context.scene.xplane.dataref_search_window_state.dataref_search_list
 
+            # Every dataref_search_list[-1] is another RNA lookup, keep what add gives us
             for dref_info in file_content:
-                dataref_search_list.add()
-                dataref_search_list[-1].dataref_path = dref_info.path
-                dataref_search_list[-1].dataref_type = dref_info.type
-                dataref_search_list[-1].dataref_is_writable = dref_info.is_writable
-                dataref_search_list[-1].dataref_units = dref_info.units
-                dataref_search_list[-1].dataref_description = dref_info.description
+                item = dataref_search_list.add()
+                item.dataref_path = dref_info.path
+                item.dataref_type = dref_info.type
+                item.dataref_is_writable = dref_info.is_writable
+                item.dataref_units = dref_info.units
+                item.dataref_description = dref_info.description
 
         prop = dataref_search_window_state.dataref_prop_dest
 
@@ -6,7 +6,6 @@ import re
 
 import bpy
 import io_xplane2blender
-from io_xplane2blender.tests import test_creation_helpers
 from io_xplane2blender import xplane_constants, xplane_helpers
 from io_xplane2blender.xplane_utils import xplane_lights_txt_parser
 from collections import OrderedDict
@@ -17,6 +16,7 @@ class SCENE_OT_dev_apply_default_material_to_all(bpy.types.Operator):
     bl_description = "Applies the 'Material' datablock to all without a material. If 'Material' does not exist, it will be created"
 
     def execute(self, context):
+        from io_xplane2blender.tests import test_creation_helpers
         mat = test_creation_helpers.create_material_default()
         for obj in bpy.data.objects:
             try:
@@ -1320,6 +1320,26 @@ class XPlaneSceneSettings(bpy.types.PropertyGroup):
         default = False
     )
 
+    simplify_keyframes: bpy.props.BoolProperty(
+        name = "Simplify Keyframes",
+        description = "Leaves out keyframes that don't change the animation, such as those on a straight line or in a run of the same value",
+        default = False
+    )
+
+    live_export: bpy.props.BoolProperty(
+        name = "Live Export",
+        description = "Re-exports the roots affected by your changes shortly after you stop editing, relative to the saved .blend file",
+        default = False
+    )
+
+    live_export_delay: bpy.props.FloatProperty(
+        name = "Live Export Delay",
+        description = "Seconds without changes before Live Export starts",
+        default = 1.0,
+        min = 0.1,
+        soft_max = 10.0
+    )
+
     version: bpy.props.EnumProperty(
         name = "X-Plane Version",
         default = VERSION_1130,
@@ -1,7 +1,7 @@
 # Author: Ondrej Brinkel <info@anzui.de>
 
 from .xplane_attribute import XPlaneAttribute
-from .xplane_attributes import XPlaneAttributes
+from .xplane_attributes import XPlaneAttributes, XPlaneAttributeSchema
 from .xplane_bone import XPlaneBone
 from .xplane_face import XPlaneFace
 from .xplane_keyframe import XPlaneKeyframe
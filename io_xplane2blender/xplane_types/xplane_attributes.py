@@ -1,34 +1,127 @@
-from collections import OrderedDict
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from io_xplane2blender.xplane_types.xplane_attribute import AttributeValueType, XPlaneAttribute
+
+
+def _weightOrder(names:Iterable[str], weightOf:Callable[[str], int])->List[str]:
+    """
+    What order() does: walking names in order, any attribute
+    heavier than everything before it is moved to the end
+    """
+    names = list(names)
+    ordered = names[:]
+    max_weight = 0
+    for name in names:
+        weight = weightOf(name)
+        if weight > max_weight:
+            ordered.remove(name)
+            ordered.append(name)
+            max_weight = weight
+    return ordered
+
+
+class XPlaneAttributeSchema():
+    """
+    The attributes every XPlaneAttributes made with this schema starts with,
+    as (name, default value, weight). They are shared, an XPlaneAttributes
+    only makes an XPlaneAttribute for one when it is asked for it.
+
+    order() on an untouched XPlaneAttributes only depends on the schema,
+    so its results are remembered here
+    """
+    __slots__ = ("names", "defaults", "weights", "slots", "_orderings")
+
+    def __init__(self, attributes:Sequence[Tuple[str, Optional[AttributeValueType], int]])->None:
+        self.names = tuple(name for name, default, weight in attributes) # type: Tuple[str, ...]
+        self.defaults = tuple(default for name, default, weight in attributes) # type: Tuple[Optional[AttributeValueType], ...]
+        self.weights = tuple(weight for name, default, weight in attributes) # type: Tuple[int, ...]
+        self.slots = {name: slot for slot, name in enumerate(self.names)} # type: Dict[str, int]
+        assert len(self.slots) == len(self.names), "Schema attribute names must be unique"
+        self._orderings = {} # type: Dict[Tuple[str, ...], Tuple[str, ...]]
+
+    def __len__(self)->int:
+        return len(self.names)
+
+    def ordered(self, names:Tuple[str, ...])->Tuple[str, ...]:
+        """Returns what order() turns names, in schema weights, into"""
+        try:
+            return self._orderings[names]
+        except KeyError:
+            ordered = self._orderings[names] = tuple(
+                _weightOrder(names, lambda name: self.weights[self.slots[name]])
+            )
+            return ordered
+
+
+_EMPTY_SCHEMA = XPlaneAttributeSchema(())
+
+# Until something is added to an XPlaneAttributes. Most XPlaneObjects never have any
+_NO_OVERFLOW = MappingProxyType({})
 
-from io_xplane2blender.xplane_types.xplane_attribute import XPlaneAttribute
 
 # Class: XPlaneAttributes
-# A Wrapper for OrderedDict that stores a collection of <XPlaneAttribute>.
-class XPlaneAttributes(OrderedDict):
-    def __init__(self):
-        super(XPlaneAttributes, self).__init__()
+# An ordered collection of <XPlaneAttribute>, by name, that works like the OrderedDict it
+# used to be.
+#
+# The attributes of the schema are always there, in one slot each. A slot stays None
+# until its attribute is asked for, everything else (custom attributes) goes in overflow.
+class XPlaneAttributes():
+    __slots__ = ("_schema", "_attributes", "_overflow", "_order")
+
+    def __init__(self, schema:Optional[XPlaneAttributeSchema] = None):
+        self._schema = schema or _EMPTY_SCHEMA
+        self._attributes = [None] * len(self._schema) if self._schema.names else () # type: List[Optional[XPlaneAttribute]]
+        self._overflow = _NO_OVERFLOW # type: Dict[str, XPlaneAttribute]
+        # None until the order isn't schema names then overflow names anymore
+        self._order = None # type: Optional[Sequence[str]]
+
+    def _names(self)->Sequence[str]:
+        if self._order is not None:
+            return self._order
+        elif self._overflow:
+            return self._schema.names + tuple(self._overflow)
+        else:
+            return self._schema.names
+
+    def _append(self, attr:XPlaneAttribute)->None:
+        if self._overflow is _NO_OVERFLOW:
+            self._overflow = {}
+        self._overflow[attr.name] = attr
+        if self._order is not None:
+            self._order = [*self._order, attr.name]
+
+    def _weight(self, name:str)->int:
+        try:
+            slot = self._schema.slots[name]
+        except KeyError:
+            return self._overflow[name].weight
+        else:
+            attr = self._attributes[slot]
+            return attr.weight if attr is not None else self._schema.weights[slot]
 
     # Method: order
     # Sorts items by weight.
     def order(self):
-        max_weight = 0
-
-        # this prevents the OrderedDict to be mutated during iteration
-        names = []
-        for name in self:
-            names.append(name)
+        names = self._names()
+        if (not self._overflow
+                and all(attr is None or attr.weight == weight
+                        for attr, weight in zip(self._attributes, self._schema.weights))):
+            self._order = self._schema.ordered(tuple(names))
+        elif names:
+            self._order = _weightOrder(names, self._weight)
 
-        for name in names:
-            if self[name].weight > max_weight:
-                self.move_to_end(name, True)
-                max_weight = self[name].weight
+    def move_to_end(self, name:str, last:bool = True)->None:
+        if name not in self:
+            raise KeyError(name)
+        names = [n for n in self._names() if n != name]
+        self._order = names + [name] if last else [name] + names
 
     def add(self, attr:XPlaneAttribute):
         if attr.name in self:
             self[attr.name].addValues(attr.getValues())
         else:
-            self[attr.name] = attr
+            self._append(attr)
 
     def get(self, name:str)->Optional[XPlaneAttribute]:
         if name in self:
@@ -40,10 +133,63 @@ class XPlaneAttributes(OrderedDict):
         if attr.name in self:
             self[attr.name] = attr
 
+    def itemsWithValues(self)->Iterator[Tuple[str, XPlaneAttribute]]:
+        """
+        Like items, but only the attributes with a value that isn't None,
+        the only ones that write anything. Attributes still at a default of None
+        are skipped without making them
+        """
+        slots = self._schema.slots
+        defaults = self._schema.defaults
+        for name in self._names():
+            slot = slots.get(name)
+            if slot is not None and self._attributes[slot] is None and defaults[slot] is None:
+                continue
+            attr = self[name]
+            if any(value is not None for value in attr.value):
+                yield name, attr
+
+    def __getitem__(self, name:str)->XPlaneAttribute:
+        try:
+            slot = self._schema.slots[name]
+        except KeyError:
+            return self._overflow[name]
+        else:
+            attr = self._attributes[slot]
+            if attr is None:
+                attr = self._attributes[slot] = XPlaneAttribute(name, self._schema.defaults[slot], self._schema.weights[slot])
+            return attr
+
+    def __setitem__(self, name:str, attr:XPlaneAttribute)->None:
+        slot = self._schema.slots.get(name)
+        if slot is not None:
+            self._attributes[slot] = attr
+        elif name in self._overflow:
+            self._overflow[name] = attr
+        else:
+            self._append(attr)
+
+    def __contains__(self, name:str)->bool:
+        return name in self._schema.slots or name in self._overflow
+
+    def __iter__(self)->Iterator[str]:
+        return iter(tuple(self._names()))
+
+    def __len__(self)->int:
+        return len(self._schema) + len(self._overflow)
+
+    def keys(self)->List[str]:
+        return list(self._names())
+
+    def values(self)->List[XPlaneAttribute]:
+        return [self[name] for name in self._names()]
+
+    def items(self)->List[Tuple[str, XPlaneAttribute]]:
+        return [(name, self[name]) for name in self._names()]
+
     def __str__(self)->str:
         o = ''
         for name in self:
             o += name + ': ' + self[name].getValuesAsString() + '\n'
 
         return o
-
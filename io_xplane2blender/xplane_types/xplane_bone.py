@@ -27,7 +27,8 @@ relationships, it cannot be assumed that the XPlaneBone Tree and Blender Hierarc
 """
 
 import math
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Sequence, Tuple
 
 import bpy
 import mathutils
@@ -38,7 +39,22 @@ from io_xplane2blender.xplane_types.xplane_keyframe import XPlaneKeyframe
 from io_xplane2blender.xplane_types.xplane_keyframe_collection import XPlaneKeyframeCollection
 #from xplane_object import XPlaneObject
 
+# Shared by everything in the tree with nothing to put in a mapping,
+# read only so it can't be filled in by accident. Most bones aren't animated
+EMPTY_MAPPING = MappingProxyType({})
+
 class XPlaneBone():
+    __slots__ = (
+        "xplaneFile",
+        "blenderObject",
+        "blenderBone",
+        "xplaneObject",
+        "parent",
+        "children",
+        "animations",
+        "datarefs",
+    )
+
     def __init__(self,
                  xplane_file:'XPlaneFile',
                  blender_obj:Optional[bpy.types.Object],
@@ -85,11 +101,12 @@ class XPlaneBone():
             self.parent.children.append(self)
 
         # dict - The keys are the dataref paths and the values are lists of <XPlaneKeyframeCollection>.
-        self.animations = {} # type: Dict[bpy.types.StringProperty,XPlaneKeyframeCollection]
+        # EMPTY_MAPPING until collectAnimations finds one
+        self.animations = EMPTY_MAPPING # type: Mapping[bpy.types.StringProperty,XPlaneKeyframeCollection]
 
         # IMPORTANT NOTE: Show/Hide Datarefs and datarefs without 2 keyframes will not be included and
         # must be accessed via blenderObject.xplane.datarefs!
-        self.datarefs:Dict[str, xplane_props.XPlaneDataref] = {}
+        self.datarefs:Mapping[str, xplane_props.XPlaneDataref] = EMPTY_MAPPING
         self.collectAnimations()
 
     def sortChildren(self)->None:
@@ -107,15 +124,11 @@ class XPlaneBone():
         if hasattr(self, 'animations') and len(self.animations) > 0:
            #Check to see if there is at least some difference in the keyframe locations
             for dataref in self.animations:
-                keyframes = self.animations[dataref]
-                if len(keyframes) > 0:
-                    last_keyframe = keyframes[0]
-                    for keyframe in keyframes:
-                        #if there is a difference
-                        if keyframe.location != last_keyframe.location:
-                            return True
-                        else:
-                            last_keyframe = keyframe
+                table = self.animations[dataref].getKeyframeTable()
+                #if there is a difference in any component
+                for column in table.locations:
+                    if any(value != column[0] for value in column):
+                        return True
 
         return False
 
@@ -125,15 +138,11 @@ class XPlaneBone():
         if hasattr(self, 'animations') and len(self.animations) > 0:
            #Check to see if there is at least some difference in the keyframe locations
             for dataref in self.animations:
-                keyframes = self.animations[dataref]
-                if len(keyframes) > 0:
-                    last_keyframe = keyframes[0]
-                    for keyframe in keyframes:
-                        #if there is a difference
-                        if keyframe.rotation != last_keyframe.rotation:
-                            return True
-                        else:
-                            last_keyframe = keyframe
+                table = self.animations[dataref].getKeyframeTable()
+                #if there is a difference in any component
+                for column in table.rotations:
+                    if any(value != column[0] for value in column):
+                        return True
 
         return False
 
@@ -205,6 +214,10 @@ class XPlaneBone():
                     return
                 else:
                     if len(fcurve.keyframe_points) > 1:
+                        if self.animations is EMPTY_MAPPING:
+                            self.animations = {}
+                            self.datarefs = {}
+
                         if bone:
                             self.datarefs[dataref] = bone.xplane.datarefs[index]
                         else:
@@ -631,6 +644,16 @@ class XPlaneBone():
                 o += f"{indent}\tANIM_keyframe_loop\t{self.datarefs[dataref].loop}\n"
         return o
 
+    def _keyframeIndicesToWrite(self, values:Sequence[float], rows:Sequence[Tuple[float, ...]])->List[int]:
+        '''
+        Which keyframes to write, all of them unless the scene simplifies keyframes,
+        in which case keyframes that don't change the animation are left out
+        '''
+        if bpy.context.scene.xplane.simplify_keyframes:
+            return XPlaneKeyframeCollection.simplified_keyframe_indices(values, rows)
+        else:
+            return list(range(len(values)))
+
     def _writeTranslationKeyframes(self, dataref:str)->str:
         debug = getDebug()
         keyframes = self.animations[dataref]
@@ -651,14 +674,18 @@ class XPlaneBone():
 
         o += f"{indent}ANIM_trans_begin\t{dataref}\n"
 
-        for keyframe in keyframes:
-            totalTrans += sum(map(abs, keyframe.location))
+        table = keyframes.getKeyframeTable()
+        rows = []
+        for x, y, z in zip(*table.locations):
+            totalTrans += abs(x) + abs(y) + abs(z)
+            rows.append((x * pre_scale[0], z * pre_scale[2], -y * pre_scale[1]))
 
+        for i in self._keyframeIndicesToWrite(table.values, rows):
             o += (f"{indent}ANIM_trans_key"
-                  f"\t{floatToStr(keyframe.dataref_value)}"
-                  f"\t{floatToStr(keyframe.location[0] * pre_scale[0])}"
-                  f"\t{floatToStr(keyframe.location[2] * pre_scale[2])}"
-                  f"\t{floatToStr(-keyframe.location[1] * pre_scale[1])}"
+                  f"\t{floatToStr(table.values[i])}"
+                  f"\t{floatToStr(rows[i][0])}"
+                  f"\t{floatToStr(rows[i][1])}"
+                  f"\t{floatToStr(rows[i][2])}"
                   f"\n")
 
         o += self._writeKeyframesLoop(dataref)
@@ -690,11 +717,12 @@ class XPlaneBone():
               f"\t{tab.join(map(floatToStr, vec_b_to_x(refAxis)))}"
               f"\t{dataref}\n")
 
-        for keyframe in keyframes:
-            deg = math.degrees(keyframe.rotation[0])
-            totalRot += abs(deg)
+        table = keyframes.getKeyframeTable()
+        degrees = [math.degrees(angle) for angle in table.rotations[0]]
+        totalRot += sum(map(abs, degrees))
 
-            o += f"{indent}ANIM_rotate_key\t{floatToStr(keyframe.dataref_value)}\t{floatToStr(deg)}\n"
+        for i in self._keyframeIndicesToWrite(table.values, [(deg,) for deg in degrees]):
+            o += f"{indent}ANIM_rotate_key\t{floatToStr(table.values[i])}\t{floatToStr(degrees[i])}\n"
 
         o += self._writeKeyframesLoop(dataref)
         o += f"{indent}ANIM_rotate_end\n"
@@ -726,11 +754,13 @@ class XPlaneBone():
                   f"\t{dataref}\n")
 
 
-            for keyframe in keyframes:
-                deg = math.degrees(keyframe.rotation[order])
-                totalRot += abs(deg)
-                totalAxisRot += abs(deg)
-                ao += f"{indent}ANIM_rotate_key\t{floatToStr(keyframe.dataref_value)}\t{floatToStr(deg)}\n"
+            table = keyframes.getKeyframeTable()
+            degrees = [math.degrees(angle) for angle in table.rotations[order]]
+            totalAxisRot += sum(map(abs, degrees))
+            totalRot += totalAxisRot
+
+            for i in self._keyframeIndicesToWrite(table.values, [(deg,) for deg in degrees]):
+                ao += f"{indent}ANIM_rotate_key\t{floatToStr(table.values[i])}\t{floatToStr(degrees[i])}\n"
 
             ao += self._writeKeyframesLoop(dataref)
             ao += f"{indent}ANIM_rotate_end\n"
@@ -756,7 +786,7 @@ class XPlaneBone():
         if debug:
             o += f"{self.getIndent()}# rotation keyframes\n"
 
-        rotationMode = keyframes[0].rotationMode
+        rotationMode = keyframes.getRotationMode()
 
         if rotationMode == 'AXIS_ANGLE':
             o += self._writeAxisAngleRotationKeyframes(dataref,keyframes)
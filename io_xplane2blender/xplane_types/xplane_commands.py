@@ -289,19 +289,19 @@ class XPlaneCommands():
         # create a temporary attributes dict
         attributes = XPlaneAttributes()
         # add custom attributes
-        for attr in xplaneObject.attributes:
-            if xplaneObject.attributes[attr].getValue():
-                attributes.add(xplaneObject.attributes[attr])
+        for name, attr in xplaneObject.attributes.itemsWithValues():
+            if attr.getValue():
+                attributes.add(attr)
 
         # add material attributes if any
         if hasattr(xplaneObject, 'material'):
-            for attr in xplaneObject.material.attributes:
-                if xplaneObject.material.attributes[attr].getValue():
-                    attributes.add(xplaneObject.material.attributes[attr])
+            for name, attr in xplaneObject.material.attributes.itemsWithValues():
+                if attr.getValue():
+                    attributes.add(attr)
         # add cockpit attributes
-        for attr in xplaneObject.cockpitAttributes:
-            if xplaneObject.cockpitAttributes[attr].getValue():
-                attributes.add(xplaneObject.cockpitAttributes[attr])
+        for name, attr in xplaneObject.cockpitAttributes.itemsWithValues():
+            if attr.getValue():
+                attributes.add(attr)
 
         WHITE_LIST = {
                 'ATTR_light_level',
@@ -10,6 +10,8 @@ from io_xplane2blender.xplane_types import XPlaneObject
 
 
 class XPlaneEmpty(XPlaneObject):
+    __slots__ = ("magnet_type",)
+
     def __init__(self, blenderObject):
         assert blenderObject.type == 'EMPTY'
         super().__init__(blenderObject)
@@ -21,8 +21,7 @@ from typing import Dict, List, Optional, NamedTuple, Set, Tuple, Union
 import bpy
 import mathutils
 from io_xplane2blender import xplane_constants, xplane_helpers, xplane_props
-from io_xplane2blender.tests import test_creation_helpers
-from io_xplane2blender.xplane_types import xplane_empty, xplane_material_utils, xplane_material
+from io_xplane2blender.xplane_types import xplane_empty, xplane_manipulator, xplane_material_utils, xplane_material
 
 from ..xplane_helpers import (BlenderParentType, ExportableRoot, PotentialRoot,
                               floatToStr, logger)
@@ -40,15 +39,30 @@ class NotExportableRootError(ValueError):
     pass
 
 
-def createFilesFromBlenderRootObjects(scene:bpy.types.Scene, view_layer:bpy.types.ViewLayer)->List["XPlaneFile"]:
+def createFilesFromBlenderRootObjects(
+        scene:bpy.types.Scene,
+        view_layer:bpy.types.ViewLayer,
+        potential_roots:Optional[List[PotentialRoot]] = None,
+        clear_caches:bool = True)->List["XPlaneFile"]:
     """
     Returns a list of all created XPlaneFiles from all valid roots found,
     ignoring any that could not be created.
 
     view_layer is needed to test exportability
+
+    potential_roots limits the search to only those, otherwise every Object
+    and Collection in the scene is tried
+
+    When exporting several scenes in a row, pass clear_caches=False
+    and call clearExportCaches before the first and after the last
     """
     xplane_files: List["XPlaneFile"] = []
-    for potential_root in scene.objects[:] + xplane_helpers.get_collections_in_scene(scene)[1:]:
+    if clear_caches:
+        # Collections may have been added, removed, or re-parented since the last export
+        xplane_helpers.clear_scene_index()
+    if potential_roots is None:
+        potential_roots = scene.objects[:] + xplane_helpers.get_collections_in_scene(scene)[1:]
+    for potential_root in potential_roots:
         try:
             xplane_file = createFileFromBlenderRootObject(potential_root, view_layer)
         except NotExportableRootError as e:
@@ -56,13 +70,23 @@ def createFilesFromBlenderRootObjects(scene:bpy.types.Scene, view_layer:bpy.type
         else:
             xplane_files.append(xplane_file)
 
-    # Without this the cache never gets cleared
-    # and no new animations are exported without a restart
-    _all_keyframe_infos.clear()
+    if clear_caches:
+        clearExportCaches()
 
     return xplane_files
 
 
+def clearExportCaches()->None:
+    """
+    Clears everything remembered during an export. Without this
+    no new animations are exported without a restart
+    """
+    _all_keyframe_infos.clear()
+    xplane_manipulator.clear_manipulator_caches()
+    xplane_helpers.frame_state.clear()
+    xplane_helpers.clear_scene_index()
+
+
 def createFileFromBlenderRootObject(potential_root:PotentialRoot, view_layer:bpy.types.ViewLayer)->"XPlaneFile":
     """
     Creates the starting point for making an OBJ, creates the file and beings
@@ -101,8 +125,9 @@ def createFileFromBlenderRootObject(potential_root:PotentialRoot, view_layer:bpy
     filename = layer_props.name if layer_props.name else exportable_root.name
 
     xplane_file = XPlaneFile(filename, layer_props)
-    xplane_file.create_xplane_bone_hiearchy(exportable_root)
-    bpy.context.scene.frame_set(1)
+    with logger.withContext(root=filename):
+        xplane_file.create_xplane_bone_hiearchy(exportable_root)
+    xplane_helpers.frame_state.set(bpy.context.scene, 1)
     assert xplane_file.rootBone, "Root Bone was not assigned during __init__ function"
     return xplane_file
 
@@ -122,7 +147,7 @@ FrameToLocRotPerFrame = Dict[int, LocRotPerFrame]
 
 # IMPORTANT! You must clear this cache when finished exporting all your OBJs,
 # or you'll never export new animations! We clear in
-# - xplane_file.createFilesFromBlenderRootObjects - from using the export operator
+# - xplane_file.clearExportCaches - from using the export operator
 # - tests/__init__.exportExportableRoot - from using a test
 _all_keyframe_infos:Dict[str, Dict[ObjectBoneNameKey, FrameToLocRotPerFrame]] = collections.defaultdict(dict)
 
@@ -154,7 +179,7 @@ def _pre_scan_all_keyframes():
 
     #--- Begin frames to visit-------------------
     for frame_num in frames_to_visit:
-        bpy.context.scene.frame_set(frame_num)
+        xplane_helpers.frame_state.set(bpy.context.scene, frame_num)
 
         #--- Begin objects to visit -------------
         for obj in bpy.context.scene.objects:
@@ -179,7 +204,7 @@ def _pre_scan_all_keyframes():
             scene_keyframe_infos[(obj.name, None)][frame_num] = l
         #--- End objects to visit ---------------
     #--- End frames to visit---------------------
-    bpy.context.scene.frame_set(1)
+    xplane_helpers.frame_state.set(bpy.context.scene, 1)
     _all_keyframe_infos[bpy.context.scene.name] = scene_keyframe_infos
     return
 
@@ -433,7 +458,8 @@ class XPlaneFile():
                 if (isinstance(new_xplane_obj, XPlaneLight)
                     and not new_xplane_obj.export_animation_only):
                     self.lights.append(new_xplane_obj)
-                new_xplane_obj.collect()
+                with logger.withContext(obj=blender_obj.name):
+                    new_xplane_obj.collect()
             elif not found_blender_obj_already and blender_obj:
                 print(f"Blender Object: {blender_obj.name}, didn't convert")
 
@@ -13,10 +13,61 @@ from ..xplane_image_composer import (combineSpecularAndNormal,
                                      getImageByFilepath, normalWithoutAlpha,
                                      specularToGrayscale)
 from .xplane_attribute import XPlaneAttribute
-from .xplane_attributes import XPlaneAttributes
+from .xplane_attributes import XPlaneAttributes, XPlaneAttributeSchema
 
 from typing import List
 
+# The attributes every XPlaneHeader has, as (name, default value, weight)
+HEADER_ATTRIBUTES = XPlaneAttributeSchema((
+    # object attributes
+    ("PARTICLE_SYSTEM", None, 0),
+    ("ATTR_layer_group", None, 0),
+    ("COCKPIT_REGION", None, 0),
+    ("DEBUG", None, 0),
+    ("GLOBAL_cockpit_lit", None, 0),
+    ("GLOBAL_tint", None, 0),
+    ("REQUIRE_WET", None, 0),
+    ("REQUIRE_DRY", None, 0),
+    ("SLOPE_LIMIT", None, 0),
+    ("slung_load_weight", None, 0),
+    ("TILTED", None, 0),
+
+    # shader attributes
+    ("TEXTURE", None, 0),
+    ("TEXTURE_LIT", None, 0),
+    ("TEXTURE_NORMAL", None, 0),
+    ("NORMAL_METALNESS", None, 0),#NORMAL_METALNESS for textures
+    ("GLOBAL_no_blend", None, 0),
+    ("GLOBAL_no_shadow", None, 0),
+    ("GLOBAL_shadow_blend", None, 0),
+    ("GLOBAL_specular", None, 0),
+    ("BLEND_GLASS", None, 0),
+
+    # draped shader attributes
+    ("TEXTURE_DRAPED", None, 0),
+    ("TEXTURE_DRAPED_NORMAL", None, 0),
+
+    # This is a hack to get around duplicate keynames!
+    # There is no NORMAL_METALNESS_draped_hack,
+    # XPlaneHeader.write will check later for draped_hack and remove it
+    #
+    # If later on we have more duplicate keynames we'll figure something
+    # else out. -Ted, 8/9/2018
+    ("NORMAL_METALNESS_draped_hack", None, 0),#NORMAL_METALNESS for draped textures
+    ("BUMP_LEVEL", None, 0),
+    ("NO_BLEND", None, 0),
+    ("SPECULAR", None, 0),
+
+    # draped general attributes
+    ("ATTR_layer_group_draped", None, 0),
+    ("ATTR_LOD_draped", None, 0),
+
+    ("EXPORT", None, 0),
+
+    # previously labeled object attributes, it must be the last thing
+    ("POINT_COUNTS", None, 0),
+))
+
 class XPlaneHeader():
     '''
     Writes OBJ info related to the OBJ8 header, such as POINT_COUNTS and TEXTURE.
@@ -59,55 +110,7 @@ class XPlaneHeader():
 
                 self.export_path_dirs.append((export_path_directive.export_path, last_folder + xplaneFile.filename + ".obj"))
 
-        self.attributes = XPlaneAttributes()
-
-        # object attributes
-        self.attributes.add(XPlaneAttribute("PARTICLE_SYSTEM", None))
-        self.attributes.add(XPlaneAttribute("ATTR_layer_group", None))
-        self.attributes.add(XPlaneAttribute("COCKPIT_REGION", None))
-        self.attributes.add(XPlaneAttribute("DEBUG", None))
-        self.attributes.add(XPlaneAttribute("GLOBAL_cockpit_lit", None))
-        self.attributes.add(XPlaneAttribute("GLOBAL_tint", None))
-        self.attributes.add(XPlaneAttribute("REQUIRE_WET", None))
-        self.attributes.add(XPlaneAttribute("REQUIRE_DRY", None))
-        self.attributes.add(XPlaneAttribute("SLOPE_LIMIT", None))
-        self.attributes.add(XPlaneAttribute("slung_load_weight", None))
-        self.attributes.add(XPlaneAttribute("TILTED", None))
-
-        # shader attributes
-        self.attributes.add(XPlaneAttribute("TEXTURE", None))
-        self.attributes.add(XPlaneAttribute("TEXTURE_LIT", None))
-        self.attributes.add(XPlaneAttribute("TEXTURE_NORMAL", None))
-        self.attributes.add(XPlaneAttribute("NORMAL_METALNESS", None))#NORMAL_METALNESS for textures
-        self.attributes.add(XPlaneAttribute("GLOBAL_no_blend", None))
-        self.attributes.add(XPlaneAttribute("GLOBAL_no_shadow", None))
-        self.attributes.add(XPlaneAttribute("GLOBAL_shadow_blend", None))
-        self.attributes.add(XPlaneAttribute("GLOBAL_specular", None))
-        self.attributes.add(XPlaneAttribute("BLEND_GLASS", None))
-
-        # draped shader attributes
-        self.attributes.add(XPlaneAttribute("TEXTURE_DRAPED", None))
-        self.attributes.add(XPlaneAttribute("TEXTURE_DRAPED_NORMAL", None))
-
-        # This is a hack to get around duplicate keynames!
-        # There is no NORMAL_METALNESS_draped_hack,
-        # self.write will check later for draped_hack and remove it
-        #
-        # If later on we have more duplicate keynames we'll figure something
-        # else out. -Ted, 8/9/2018
-        self.attributes.add(XPlaneAttribute("NORMAL_METALNESS_draped_hack", None))#NORMAL_METALNESS for draped textures
-        self.attributes.add(XPlaneAttribute("BUMP_LEVEL", None))
-        self.attributes.add(XPlaneAttribute("NO_BLEND", None))
-        self.attributes.add(XPlaneAttribute("SPECULAR", None))
-
-        # draped general attributes
-        self.attributes.add(XPlaneAttribute("ATTR_layer_group_draped", None))
-        self.attributes.add(XPlaneAttribute("ATTR_LOD_draped", None))
-
-        self.attributes.add(XPlaneAttribute("EXPORT", None))
-
-        # previously labeled object attributes, it must be the last thing
-        self.attributes.add(XPlaneAttribute("POINT_COUNTS", None))
+        self.attributes = XPlaneAttributes(HEADER_ATTRIBUTES)
 
 
     def _init(self):
@@ -509,9 +512,9 @@ class XPlaneHeader():
         self.attributes.move_to_end('POINT_COUNTS')
 
         # attributes
-        for attr_name,attr in self.attributes.items():
+        for attr_name,attr in self.attributes.itemsWithValues():
             if attr_name == "NORMAL_METALNESS_draped_hack":
-                # Hack: See note in __init__
+                # Hack: See note in HEADER_ATTRIBUTES
                 attr.name = "NORMAL_METALNESS"
 
             values = attr.value
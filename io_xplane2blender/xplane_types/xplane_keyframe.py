@@ -8,6 +8,17 @@ from io_xplane2blender import xplane_helpers
 from io_xplane2blender.xplane_constants import PRECISION_KEYFRAME
 
 class XPlaneKeyframe():
+    # There is one per keyframe per dataref per bone, and fromValues makes them with __new__
+    __slots__ = (
+        "dataref",
+        "dataref_values_index",
+        "dataref_value",
+        "frame_num",
+        "location",
+        "rotationMode",
+        "rotation",
+    )
+
     def __init__(self,
                  keyframe: bpy.types.Keyframe,
                  dataref_values_index: int,
@@ -69,7 +80,28 @@ class XPlaneKeyframe():
             self.rotation = mathutils.Euler(angles, order)
             assert isinstance(self.rotation, mathutils.Euler)
 
-        self.scale = copy.copy(blenderObject.scale)
+    @classmethod
+    def fromValues(cls,
+                   dataref: str,
+                   dataref_values_index: int,
+                   frame_num: int,
+                   dataref_value: float,
+                   location: mathutils.Vector,
+                   rotationMode: str,
+                   rotation)->'XPlaneKeyframe':
+        '''
+        Makes a keyframe from already collected values without looking at Blender,
+        used by XPlaneKeyframeTable
+        '''
+        keyframe = cls.__new__(cls)
+        keyframe.dataref = dataref
+        keyframe.dataref_values_index = dataref_values_index
+        keyframe.frame_num = frame_num
+        keyframe.dataref_value = dataref_value
+        keyframe.location = location
+        keyframe.rotationMode = rotationMode
+        keyframe.rotation = rotation
+        return keyframe
 
     def __str__(self)->str:
         # TODO: We aren't printing out the bone, or saving it, because we haven't solved the deepcopy
@@ -1,21 +1,30 @@
 from collections import Iterable, namedtuple
 from collections.abc import MutableSequence
-import copy
 import math
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
 
 import bpy
 import mathutils
 from mathutils import Vector
 
 from io_xplane2blender.xplane_types.xplane_keyframe import XPlaneKeyframe
+from io_xplane2blender.xplane_types.xplane_keyframe_table import XPlaneKeyframeTable
 from io_xplane2blender.xplane_helpers import round_vec
 from io_xplane2blender import xplane_constants
+from io_xplane2blender.xplane_config import getDebug
 
 # Class: XPlaneKeyframeCollection
 #
 # A list of at least 2 XPlaneKeyframes. All keyframes should share the same dataref and
 # have the same rotation mode
+#
+# The keyframes are stored in an XPlaneKeyframeTable, indexing or iterating makes
+# XPlaneKeyframes from it as needed. Changing a keyframe you got this way doesn't change the
+# collection, assign it back with collection[i] = keyframe
+#
+# Conversions (asAA, asEuler, asQuaternion) and keyframe tables are made the first time
+# they're asked for and cached until the collection changes. Callers must treat what they get
+# back as read only, the next caller gets the same object!
 class XPlaneKeyframeCollection(MutableSequence):
     EULER_AXIS_ORDERING = {
         'ZYX': (0, 1, 2),
@@ -29,9 +38,9 @@ class XPlaneKeyframeCollection(MutableSequence):
     def __init__(self, data:List[XPlaneKeyframe]):
         '''
         data - A list of XPlaneKeyframes, all with the same dataref and
-        rotationMode, at least 2 entries big.
+        rotationMode, at least 2 entries big. They are copied, never changed.
 
-        XPlaneKeyframeCollection may mutate some of the keyframe data to maintain a reference
+        XPlaneKeyframeCollection may change some of its copy of the keyframe data to maintain a reference
         axis of animation.
         '''
 
@@ -39,7 +48,10 @@ class XPlaneKeyframeCollection(MutableSequence):
         assert data is not None and len(data) >= 2
         assert len({kf.dataref for kf in data}) == 1
         assert len({kf.rotationMode for kf in data}) == 1
-        self._list = copy.deepcopy(data)
+        self._table = XPlaneKeyframeTable.fromKeyframes(data)
+
+        # Conversion or table name: what it made, see _cached
+        self._cache = {} # type: Dict[str, Any]
 
         # _makeReferenceAxes uses a "cute but regrettable" recursive strategy for
         # converting Quaternions->AA->Euler as needed
@@ -52,7 +64,7 @@ class XPlaneKeyframeCollection(MutableSequence):
                 refAxis    = None
                 refAxisInv = None
 
-                for keyframe in keyframes:
+                for i, keyframe in enumerate(keyframes):
                     angle = keyframe.rotation[0]
                     axis = keyframe.rotation[1]
 
@@ -76,6 +88,7 @@ class XPlaneKeyframeCollection(MutableSequence):
                         continue
                     elif round_vector(refAxisInv) == round_vector(axis):
                         keyframe.rotation = (angle*-1, axis * -1)
+                        keyframes[i] = keyframe
                     else:
                         return _makeReferenceAxes(keyframes.toEuler())
 
@@ -94,38 +107,67 @@ class XPlaneKeyframeCollection(MutableSequence):
                 except:
                     raise Exception("Rotation mode %s doesn't exist in eulerAxisMap" % (keyframes.getRotationMode()))
 
-            assert len(axes) == 1 or len(axes) == 3
-            assert len([axis for axis in axes if not isinstance(axis,mathutils.Vector)]) == 0
+            if getDebug():
+                assert len(axes) == 1 or len(axes) == 3
+                assert len([axis for axis in axes if not isinstance(axis,mathutils.Vector)]) == 0
             return axes, keyframes.getRotationMode()
 
         self._referenceAxes, final_rotation_mode  = _makeReferenceAxes(self)
 
     def __repr__(self):
-        return "<{0} {1}>".format(self.__class__.__name__, self._list)
+        return "<{0} {1}>".format(self.__class__.__name__, self._table.keyframes())
 
     def __len__(self):
         """List length"""
-        return len(self._list)
+        return len(self._table)
 
     def __getitem__(self, i):
-        """Get a list item"""
-        return self._list[i]
+        """Get a list item, or a list of items for a slice"""
+        if isinstance(i, slice):
+            return [self._table.keyframe(j) for j in range(*i.indices(len(self._table)))]
+        if not -len(self._table) <= i < len(self._table):
+            raise IndexError("XPlaneKeyframeCollection index out of range")
+        return self._table.keyframe(i)
+
+    def __iter__(self)->Iterator[XPlaneKeyframe]:
+        return (self._table.keyframe(i) for i in range(len(self._table)))
 
     def __delitem__(self, i):
         """Delete an item"""
-        del self._list[i]
+        del self._table[i]
+        self._invalidate()
 
     def __setitem__(self, i, val):
-        self._list[i] = val
+        self._table[i] = val
+        self._invalidate()
 
     def __str__(self):
-        return str(self._list)
+        return str(self._table.keyframes())
 
     def insert(self, i, val):
-        self._list.insert(i, val)
+        self._table.insert(i, val)
+        self._invalidate()
 
     def append(self, val):
-        self.insert(len(self._list), val)
+        self.insert(len(self._table), val)
+
+    def _invalidate(self)->None:
+        '''
+        Forgets all cached conversions and tables,
+        must be called after any change to the keyframes
+        '''
+        self._cache.clear()
+
+    def _cached(self, name:str, make:Callable[[], Any])->Any:
+        '''
+        Returns what make() returned the first time it was called with this name,
+        since the collection last changed
+        '''
+        try:
+            return self._cache[name]
+        except KeyError:
+            result = self._cache[name] = make()
+            return result
 
     def getReferenceAxes(self):
         '''
@@ -135,34 +177,44 @@ class XPlaneKeyframeCollection(MutableSequence):
         return (self._referenceAxes, self.getRotationMode())
 
     def getDataref(self):
-        return self._list[0].dataref
+        return self._table.dataref
 
     def getRotationMode(self):
-        return self._list[0].rotationMode
+        return self._table.rotation_mode
+
+    def getKeyframeTable(self)->XPlaneKeyframeTable:
+        '''
+        The columns behind this collection, for reading only.
+        The fastest way to go through every keyframe
+        '''
+        return self._table
 
     AxisKeyframeTable = namedtuple('AxisKeyframeTable', ['axis', 'table'])
     AxisKeyframeTable.__doc__ = "The reference axis and the table of keyframe rotations along it"
     TableEntry = namedtuple('TableEntry', ['value','degrees'])
     TableEntry.__doc__ = "An entry in the keyframe table, where value is the dataref value"
+    TranslationKeyframe = namedtuple('TranslationKeyframe', ['value','location'])
+    TranslationKeyframe.__doc__ = "An entry in the translation keyframe table, where location is a Vector"
 
     def getRotationKeyframeTables(self) -> List["XPlaneKeyframeCollection.AxisKeyframeTable"]:
         '''
         List of sub tables will either be 1 (for AA or Quaternion) or 3 (for Eulers)
         '''
+        return self._cached("rotation_tables", self._makeRotationKeyframeTables)
+
+    def _makeRotationKeyframeTables(self) -> List["XPlaneKeyframeCollection.AxisKeyframeTable"]:
         AxisKeyframeTable = XPlaneKeyframeCollection.AxisKeyframeTable
         TableEntry = XPlaneKeyframeCollection.TableEntry
 
         axes, final_rotation_mode = self.getReferenceAxes()
+        table = self._table
         if final_rotation_mode in {"AXIS_ANGLE", "QUATERNION"}:
             rot_keyframe_tables = [
                 AxisKeyframeTable(
                     axis=axes[0],
                     table=[
-                        TableEntry(
-                            keyframe.dataref_value,
-                            math.degrees(keyframe.rotation[0]),
-                        )
-                        for keyframe in self
+                        TableEntry(value, math.degrees(angle))
+                        for value, angle in zip(table.values, table.rotations[0])
                     ],
                 )
             ]
@@ -174,25 +226,23 @@ class XPlaneKeyframeCollection(MutableSequence):
                     AxisKeyframeTable(
                         axis=axis,
                         table=[
-                            TableEntry(
-                                keyframe.dataref_value,
-                                math.degrees(keyframe.rotation[cur_order[i]]),
-                            )
-                            for keyframe in self
+                            TableEntry(value, math.degrees(angle))
+                            for value, angle in zip(table.values, table.rotations[cur_order[i]])
                         ],
                     )
                 )
 
-        assert isinstance(rot_keyframe_tables,list)
-        for axis_info in rot_keyframe_tables:
-            assert isinstance(axis_info,tuple)
-            assert isinstance(axis_info.axis,Vector)
-            assert isinstance(axis_info.table,list)
+        if getDebug():
+            assert isinstance(rot_keyframe_tables,list)
+            for axis_info in rot_keyframe_tables:
+                assert isinstance(axis_info,tuple)
+                assert isinstance(axis_info.axis,Vector)
+                assert isinstance(axis_info.table,list)
 
-            for table_entry in axis_info.table:
-                assert isinstance(table_entry,tuple)
-                assert isinstance(table_entry.value,float)
-                assert isinstance(table_entry.degrees,float)
+                for table_entry in axis_info.table:
+                    assert isinstance(table_entry,tuple)
+                    assert isinstance(table_entry.value,float)
+                    assert isinstance(table_entry.degrees,float)
 
         return rot_keyframe_tables
 
@@ -202,21 +252,33 @@ class XPlaneKeyframeCollection(MutableSequence):
         Throws a ValueError if all resulting keyframe tables would be less than 2 keyframes
         (this should only be possible for certain Euler cases)
         '''
-        return XPlaneKeyframeCollection.filter_clamping_keyframes(self.getRotationKeyframeTables(), "degrees")
+        return self._cached(
+            "rotation_tables_no_clamps",
+            lambda: XPlaneKeyframeCollection.filter_clamping_keyframes(self.getRotationKeyframeTables(), "degrees")
+        )
 
     def getTranslationKeyframeTable(self):
         '''
         Returns List[TranslationKeyframe[keyframe.value, keyframe.location]] where location is a Vector
         '''
-        TranslationKeyframe = namedtuple('TranslationKeyframe', ['value','location'])
-        return [TranslationKeyframe(keyframe.dataref_value, keyframe.location) for keyframe in self]
+        TranslationKeyframe = XPlaneKeyframeCollection.TranslationKeyframe
+        return self._cached(
+            "translation_table",
+            lambda: [
+                TranslationKeyframe(self._table.values[i], self._table.location(i))
+                for i in range(len(self._table))
+            ]
+        )
 
     def getTranslationKeyframeTableNoClamps(self):
         '''
         ()->List[TranslationKeyframe[keyframe.value, keyframe.location]] where location is a Vector
         without any clamping values in the keyframe table
         '''
-        return XPlaneKeyframeCollection.filter_clamping_keyframes(self.getTranslationKeyframeTable(), "location")
+        return self._cached(
+            "translation_table_no_clamps",
+            lambda: XPlaneKeyframeCollection.filter_clamping_keyframes(self.getTranslationKeyframeTable(), "location")
+        )
 
     # Returns list  of tuples of (keyframe.dataref_value, keyframe.location)
     # with location being a Vector in Blender form and scaled by the scaling amount
@@ -225,24 +287,36 @@ class XPlaneKeyframeCollection(MutableSequence):
         return [(value, location * pre_scale) for value, location in self.getTranslationKeyframeTable()]
 
     def asAA(self)->'XPlaneKeyframeCollection':
-        return XPlaneKeyframeCollection([keyframe.asAA() for keyframe in self])
+        return self._cached(
+            "AXIS_ANGLE",
+            lambda: XPlaneKeyframeCollection([keyframe.asAA() for keyframe in self])
+        )
 
     def asEuler(self)->'XPlaneKeyframeCollection':
-        return XPlaneKeyframeCollection([keyframe.asEuler() for keyframe in self])
+        return self._cached(
+            "EULER",
+            lambda: XPlaneKeyframeCollection([keyframe.asEuler() for keyframe in self])
+        )
 
     def asQuaternion(self)->'XPlaneKeyframeCollection':
-        return XPlaneKeyframeCollection([keyframe.asQuaternion() for keyframe in self])
+        return self._cached(
+            "QUATERNION",
+            lambda: XPlaneKeyframeCollection([keyframe.asQuaternion() for keyframe in self])
+        )
 
     def toAA(self)->'XPlaneKeyframeCollection':
-        self._list = [keyframe.asAA() for keyframe in self]
+        self._table = XPlaneKeyframeTable.fromKeyframes(keyframe.asAA() for keyframe in self)
+        self._invalidate()
         return self
 
     def toEuler(self)->'XPlaneKeyframeCollection':
-        self._list = [keyframe.asEuler() for keyframe in self]
+        self._table = XPlaneKeyframeTable.fromKeyframes(keyframe.asEuler() for keyframe in self)
+        self._invalidate()
         return self
 
     def toQuaternion(self)->'XPlaneKeyframeCollection':
-        self._list = [keyframe.asQuaternion() for keyframe in self]
+        self._table = XPlaneKeyframeTable.fromKeyframes(keyframe.asQuaternion() for keyframe in self)
+        self._invalidate()
         return self
 
     @staticmethod
@@ -322,3 +396,46 @@ class XPlaneKeyframeCollection(MutableSequence):
                 raise ValueError("XPlaneKeyframeCollection had only clamping keyframes")
             return new_keyframe_table
 
+
+    @staticmethod
+    def simplified_keyframe_indices(values:Sequence[float], rows:Sequence[Sequence[float]])->List[int]:
+        '''
+        Returns the indices of the keyframes needed to draw the same animation,
+        dropping keyframes that X-Plane would get by interpolating between
+        their neighbors (within PRECISION_KEYFRAME), such as the middle of a
+        straight line or of a run of keyframes that don't move.
+
+        values are the dataref values, rows the written components of each keyframe
+        (degrees or a location). The first and last keyframe are always kept,
+        so clamping is not changed
+        '''
+        assert len(values) == len(rows)
+        if len(values) < 3:
+            return list(range(len(values)))
+
+        ndigits = xplane_constants.PRECISION_KEYFRAME
+
+        def on_line(start:int, end:int, i:int)->bool:
+            start_value, end_value, value = values[start], values[end], values[i]
+            if start_value == end_value:
+                # A jump or a repeated keyframe, only an exact copy can go
+                return value == start_value and all(
+                    round(a - b, ndigits) == 0 and round(a - c, ndigits) == 0
+                    for a, b, c in zip(rows[i], rows[start], rows[end])
+                )
+            if not min(start_value, end_value) <= value <= max(start_value, end_value):
+                return False
+            t = (value - start_value) / (end_value - start_value)
+            return all(
+                round(a + (b - a) * t - c, ndigits) == 0
+                for a, b, c in zip(rows[start], rows[end], rows[i])
+            )
+
+        kept = [0]
+        for i in range(1, len(values) - 1):
+            # Every keyframe dropped since the last one kept must still be on the line
+            # to the next keyframe, otherwise error could add up along a gentle curve
+            if not all(on_line(kept[-1], i + 1, j) for j in range(kept[-1] + 1, i + 1)):
+                kept.append(i)
+        kept.append(len(values) - 1)
+        return kept
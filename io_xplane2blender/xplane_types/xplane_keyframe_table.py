@@ -0,0 +1,125 @@
+"""
+Column oriented storage for the keyframes of one dataref.
+
+Instead of one XPlaneKeyframe (with its own Vector, rotation, etc) per keyframe,
+a table keeps parallel arrays of doubles: one for the dataref values, one per
+location component, and one per rotation component. The layout of the rotation
+columns depends on rotation_mode:
+
+- 'QUATERNION': w, x, y, z
+- 'AXIS_ANGLE': angle, axis x, axis y, axis z
+- Euler orders ('XYZ', 'XZY', etc): x, y, z (in radians)
+
+XPlaneKeyframeCollection is a view over one of these, XPlaneKeyframes are only
+made when something asks for one. Writers can format straight from the columns.
+"""
+
+import array
+from typing import Iterable, List, Tuple
+
+import mathutils
+
+from io_xplane2blender.xplane_types.xplane_keyframe import XPlaneKeyframe
+
+
+def rotation_component_count(rotation_mode:str)->int:
+    return 4 if rotation_mode in {"QUATERNION", "AXIS_ANGLE"} else 3
+
+
+class XPlaneKeyframeTable():
+    __slots__ = (
+        "dataref",
+        "rotation_mode",
+        "frame_nums",
+        "dataref_values_indices",
+        "values",
+        "locations",
+        "rotations",
+    )
+
+    def __init__(self, dataref:str, rotation_mode:str)->None:
+        self.dataref = dataref
+        self.rotation_mode = rotation_mode
+        self.frame_nums = array.array("l")
+        self.dataref_values_indices = array.array("l")
+        self.values = array.array("d")
+        self.locations = tuple(array.array("d") for i in range(3)) # type: Tuple[array.array, ...]
+        self.rotations = tuple(array.array("d") for i in range(rotation_component_count(rotation_mode))) # type: Tuple[array.array, ...]
+
+    @classmethod
+    def fromKeyframes(cls, keyframes:Iterable[XPlaneKeyframe])->"XPlaneKeyframeTable":
+        """
+        Copies keyframes into a new table. All keyframes must
+        share the same dataref and rotation mode
+        """
+        keyframes = list(keyframes)
+        table = cls(keyframes[0].dataref, keyframes[0].rotationMode)
+        for keyframe in keyframes:
+            table.append(keyframe)
+        return table
+
+    def __len__(self)->int:
+        return len(self.values)
+
+    def _columns(self)->Tuple[array.array, ...]:
+        return (self.frame_nums, self.dataref_values_indices, self.values, *self.locations, *self.rotations)
+
+    def _row(self, keyframe:XPlaneKeyframe)->Tuple[float, ...]:
+        assert keyframe.dataref == self.dataref, f"{keyframe.dataref} != {self.dataref}"
+        assert keyframe.rotationMode == self.rotation_mode, f"{keyframe.rotationMode} != {self.rotation_mode}"
+
+        if self.rotation_mode == "AXIS_ANGLE":
+            rotation = (keyframe.rotation[0], *keyframe.rotation[1])
+        else:
+            # Quaternions iterate as w, x, y, z and Eulers as x, y, z
+            rotation = tuple(keyframe.rotation)
+        return (
+            keyframe.frame_num,
+            keyframe.dataref_values_index,
+            keyframe.dataref_value,
+            *keyframe.location,
+            *rotation,
+        )
+
+    def append(self, keyframe:XPlaneKeyframe)->None:
+        for column, item in zip(self._columns(), self._row(keyframe)):
+            column.append(item)
+
+    def insert(self, i:int, keyframe:XPlaneKeyframe)->None:
+        for column, item in zip(self._columns(), self._row(keyframe)):
+            column.insert(i, item)
+
+    def __setitem__(self, i:int, keyframe:XPlaneKeyframe)->None:
+        for column, item in zip(self._columns(), self._row(keyframe)):
+            column[i] = item
+
+    def __delitem__(self, i:int)->None:
+        for column in self._columns():
+            del column[i]
+
+    def location(self, i:int)->mathutils.Vector:
+        return mathutils.Vector((self.locations[0][i], self.locations[1][i], self.locations[2][i]))
+
+    def rotation(self, i:int):
+        """Returns the rotation of row i, in the same form XPlaneKeyframe.rotation would be"""
+        if self.rotation_mode == "QUATERNION":
+            return mathutils.Quaternion([column[i] for column in self.rotations])
+        elif self.rotation_mode == "AXIS_ANGLE":
+            return (self.rotations[0][i], mathutils.Vector([column[i] for column in self.rotations[1:]]))
+        else:
+            return mathutils.Euler([column[i] for column in self.rotations], self.rotation_mode)
+
+    def keyframe(self, i:int)->XPlaneKeyframe:
+        """Makes an XPlaneKeyframe from row i. Changing it does not change the table"""
+        return XPlaneKeyframe.fromValues(
+            dataref=self.dataref,
+            dataref_values_index=self.dataref_values_indices[i],
+            frame_num=self.frame_nums[i],
+            dataref_value=self.values[i],
+            location=self.location(i),
+            rotationMode=self.rotation_mode,
+            rotation=self.rotation(i),
+        )
+
+    def keyframes(self)->List[XPlaneKeyframe]:
+        return [self.keyframe(i) for i in range(len(self))]
@@ -19,6 +19,20 @@ from ..xplane_helpers import (floatToStr, logger, vec_b_to_x,
 
 
 class XPlaneLight(xplane_object.XPlaneObject):
+    __slots__ = (
+        "indices",
+        "lightType",
+        "color",
+        "dataref",
+        "energy",
+        "size",
+        "uv",
+        "lightName",
+        "params",
+        "comment",
+        "record_completed",
+    )
+
     def __init__(self, blenderObject:bpy.types.Object):
         super().__init__(blenderObject)
         # Indices for VLIGHTs table
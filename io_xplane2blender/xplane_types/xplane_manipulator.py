@@ -6,7 +6,7 @@ Created on Jan 30, 2018
 
 import collections
 import typing
-from typing import Callable,List,Tuple,Optional
+from typing import Callable,Dict,List,Tuple,Optional
 import bpy
 from mathutils import Vector
 from io_xplane2blender import xplane_helpers
@@ -21,6 +21,32 @@ from io_xplane2blender.xplane_types.xplane_keyframe_collection import XPlaneKeyf
 def round_vector(vec,ndigits=5) -> Vector:
     return Vector([round(comp,ndigits) for comp in vec])
 
+# Many manipulators share the same animated parents (knobs with many click spots),
+# so the results of checking them with log_errors=False are remembered per bone.
+# Bones don't change after collection, so this is safe for the length of an export.
+#
+# IMPORTANT! Clear with clear_manipulator_caches when finished exporting, like _all_keyframe_infos
+_predicate_results: Dict[Tuple[XPlaneBone, Callable[..., bool]], bool] = {}
+_next_animated_bones: Dict[XPlaneBone, Optional[XPlaneBone]] = {}
+
+
+def clear_manipulator_caches()->None:
+    _predicate_results.clear()
+    _next_animated_bones.clear()
+
+
+def check_silently(predicate:Callable[..., bool], bone:XPlaneBone) -> bool:
+    '''
+    Returns predicate(bone, log_errors=False), only calling it the first time a bone and
+    predicate are seen during an export. Predicates with side effects when log_errors=False
+    must not be used with this
+    '''
+    try:
+        return _predicate_results[bone, predicate]
+    except KeyError:
+        result = _predicate_results[bone, predicate] = predicate(bone, False)
+        return result
+
 '''
 Some of these check_* methods break the rule of "no side effects in a boolean expression" when log_errors = True
 However, without this, the logic must be duplicated, making it, in my opinion, worth it.
@@ -162,7 +188,7 @@ def check_bone_is_not_animated_for_rotation(bone:XPlaneBone,log_errors:bool=True
     if log_errors:
         assert manipulator
 
-    if check_bone_is_animated_for_rotation(bone, log_errors=False):
+    if check_silently(check_bone_is_animated_for_rotation, bone):
         if log_errors:
             logger.error("{} manipulator attached to {} must not have rotation keyframes".format(
                 manipulator.manip.get_effective_type_name(),
@@ -188,7 +214,7 @@ def check_bone_is_not_animated_for_translation(bone:XPlaneBone,log_errors:bool=T
 
 def check_bone_parent_is_animated_for_rotation(bone:XPlaneBone, log_errors:bool=True) -> bool:
     assert bone.parent
-    if not check_bone_is_animated_for_rotation(bone.parent, False):
+    if not check_silently(check_bone_is_animated_for_rotation, bone.parent):
         if log_errors:
             logger.error("{}'s parent {} must be animated with rotation".format(
                          bone.getBlenderName(),
@@ -401,6 +427,12 @@ def get_information_sources(manipulator:'XPlaneManipulator',
     Returns a list of collected bones or None if there was an error
     '''
     def find_next_animated_bone(bone:XPlaneBone):
+        try:
+            return _next_animated_bones[bone]
+        except KeyError:
+            pass
+
+        start_bone = bone
         #Note the use of blenderObject.xplane.datarefs, as opposed to bone.datarefs!
         while bone is not None:
             if bone.blenderBone is None:
@@ -419,6 +451,7 @@ def get_information_sources(manipulator:'XPlaneManipulator',
 
             bone = bone.parent
 
+        _next_animated_bones[start_bone] = bone
         return bone
 
     def log_error(manipulator:'XPlaneManipulator',
@@ -527,8 +560,8 @@ Possible Solutions:
             found_error = True
             break
         else:
-            white_list_result = white_list[idx][0](current_bone,False)
-            black_list_result = black_list[idx][0](current_bone,False)
+            white_list_result = check_silently(white_list[idx][0], current_bone)
+            black_list_result = check_silently(black_list[idx][0], current_bone)
 
             if not white_list_result or black_list_result:
                 found_error = True
@@ -5,9 +5,39 @@ from io_xplane2blender.xplane_types import xplane_object
 from ..xplane_config import getDebug
 from ..xplane_helpers import floatToStr, logger
 from ..xplane_constants import *
-from .xplane_attributes import XPlaneAttributes
+from .xplane_attributes import XPlaneAttributes, XPlaneAttributeSchema
 from .xplane_attribute import XPlaneAttribute
 
+# The attributes every XPlaneMaterial has, as (name, default value, weight)
+MATERIAL_ATTRIBUTES = XPlaneAttributeSchema((
+    ("ATTR_shiny_rat", None, 0),
+    ("ATTR_hard", None, 0),
+    ("ATTR_hard_deck", None, 0),
+    ("ATTR_no_hard", None, 0),
+
+    ("ATTR_blend", None, 0),
+    ("ATTR_shadow_blend", None, 0),
+    ("ATTR_no_blend", None, 0),
+
+    ("ATTR_shadow", None, 0),
+    ("ATTR_no_shadow", None, 0),
+    ("ATTR_draw_enable", None, 0),
+    ("ATTR_draw_disable", None, 0),
+    ("ATTR_solid_camera", None, 0),
+    ("ATTR_no_solid_camera", None, 0),
+
+    ("ATTR_light_level", None, 1000),
+    ("ATTR_poly_os", None, 1000),
+    ("ATTR_draped", None, 1000),
+    ("ATTR_no_draped", True, 1000),
+))
+
+MATERIAL_COCKPIT_ATTRIBUTES = XPlaneAttributeSchema((
+    ("ATTR_cockpit", None, 2000),
+    ("ATTR_no_cockpit", True, 2000),
+    ("ATTR_cockpit_region", None, 2000),
+))
+
 # Class: XPlaneMaterial
 # A Material
 class XPlaneMaterial():
@@ -49,33 +79,8 @@ class XPlaneMaterial():
         self.name = None
 
         # Material
-        self.attributes = XPlaneAttributes()
-
-        self.attributes.add(XPlaneAttribute("ATTR_shiny_rat"))
-        self.attributes.add(XPlaneAttribute("ATTR_hard"))
-        self.attributes.add(XPlaneAttribute("ATTR_hard_deck"))
-        self.attributes.add(XPlaneAttribute("ATTR_no_hard"))
-
-        self.attributes.add(XPlaneAttribute("ATTR_blend"))
-        self.attributes.add(XPlaneAttribute("ATTR_shadow_blend"))
-        self.attributes.add(XPlaneAttribute("ATTR_no_blend"))
-
-        self.attributes.add(XPlaneAttribute("ATTR_shadow"))
-        self.attributes.add(XPlaneAttribute("ATTR_no_shadow"))
-        self.attributes.add(XPlaneAttribute("ATTR_draw_enable"))
-        self.attributes.add(XPlaneAttribute("ATTR_draw_disable"))
-        self.attributes.add(XPlaneAttribute("ATTR_solid_camera"))
-        self.attributes.add(XPlaneAttribute("ATTR_no_solid_camera"))
-
-        self.attributes.add(XPlaneAttribute('ATTR_light_level', None, 1000))
-        self.attributes.add(XPlaneAttribute('ATTR_poly_os', None, 1000))
-        self.attributes.add(XPlaneAttribute('ATTR_draped', None, 1000))
-        self.attributes.add(XPlaneAttribute('ATTR_no_draped', True, 1000))
-
-        self.cockpitAttributes = XPlaneAttributes()
-        self.cockpitAttributes.add(XPlaneAttribute('ATTR_cockpit', None, 2000))
-        self.cockpitAttributes.add(XPlaneAttribute('ATTR_no_cockpit', True, 2000))
-        self.cockpitAttributes.add(XPlaneAttribute('ATTR_cockpit_region', None, 2000))
+        self.attributes = XPlaneAttributes(MATERIAL_ATTRIBUTES)
+        self.cockpitAttributes = XPlaneAttributes(MATERIAL_COCKPIT_ATTRIBUTES)
 
         self.conditions = []
 
@@ -214,15 +219,15 @@ class XPlaneMaterial():
         xplaneFile = self.xplaneObject.xplaneBone.xplaneFile
         commands =  xplaneFile.commands
 
-        for attr in self.attributes:
-            o += commands.writeAttribute(self.attributes[attr], self.xplaneObject)
+        for name, attr in self.attributes.itemsWithValues():
+            o += commands.writeAttribute(attr, self.xplaneObject)
 
         # if the file is a cockpit file write all cockpit attributes
         if xplaneFile.options.export_type == EXPORT_TYPE_COCKPIT or \
             (bpy.context.scene.xplane.version >= VERSION_1040 and \
             xplaneFile.options.export_type == EXPORT_TYPE_AIRCRAFT):
-            for attr in self.cockpitAttributes:
-                o += commands.writeAttribute(self.cockpitAttributes[attr], self.xplaneObject)
+            for name, attr in self.cockpitAttributes.itemsWithValues():
+                o += commands.writeAttribute(attr, self.xplaneObject)
 
         return o
 
@@ -3,19 +3,39 @@ import itertools
 import bpy
 import mathutils
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 from io_xplane2blender.xplane_config import getDebug
 from io_xplane2blender.xplane_helpers import *
 from io_xplane2blender.xplane_constants import *
 from io_xplane2blender.xplane_types.xplane_attribute import XPlaneAttribute
 from io_xplane2blender.xplane_types.xplane_attributes import XPlaneAttributes
 from io_xplane2blender.xplane_types import xplane_bone
+from io_xplane2blender.xplane_types.xplane_bone import EMPTY_MAPPING
 
 class XPlaneObject():
     """
     An object in the XPlane2Blender collection tree,
     tied with the Blender Object it is based off.
+
+    There is one per exported Blender Object, so subclasses declare
+    __slots__ too and share empty containers where they can
     """
+    __slots__ = (
+        "export_animation_only",
+        "blenderObject",
+        "xplaneBone",
+        "name",
+        "type",
+        "datarefs",
+        "bakeMatrix",
+        "attributes",
+        "cockpitAttributes",
+        "animAttributes",
+        "conditions",
+        "effective_buckets",
+        "weight",
+    )
+
     def __init__(self, blenderObject: bpy.types.Object)->None:
         # When true, keyframes and Custom Animation Properties
         # are included in OBJ
@@ -27,19 +47,17 @@ class XPlaneObject():
         self.xplaneBone = None # type: xplane_bone.XPlaneBone
         self.name = blenderObject.name # type: str
         self.type = self.blenderObject.type # type: str
-        self.datarefs = {} # type: Dict[str,str]
+        self.datarefs = {dataref.path: dataref for dataref in self.blenderObject.xplane.datarefs} or EMPTY_MAPPING # type: Mapping[str,io_xplane2blender.xplane_props.XPlaneDataref]
         self.bakeMatrix = None # type: Optional[mathutils.Matrix]
 
         self.attributes = XPlaneAttributes()
         self.cockpitAttributes = XPlaneAttributes()
         self.animAttributes = XPlaneAttributes()
-        self.conditions = [] # type: List[io_xplane2blender.xplane_props.XPlaneCondition]
+        self.conditions = () # type: Sequence[io_xplane2blender.xplane_props.XPlaneCondition]
 
         # This represents all specializations of lods, on this subject,
         # including it's parents. Set in XPlaneBone's constructor
         self.effective_buckets:Tuple[...] = (False,) * 4
-        for i, dataref in self.blenderObject.xplane.datarefs.items():
-            self.datarefs[dataref.path] = dataref
 
         self.setWeight()
 
@@ -141,12 +159,12 @@ class XPlaneObject():
 
         o += commands.writeReseters(self)
 
-        for attr in self.attributes:
-            o += commands.writeAttribute(self.attributes[attr], self)
+        for name, attr in self.attributes.itemsWithValues():
+            o += commands.writeAttribute(attr, self)
 
         # if the file is a cockpit file write all cockpit attributes
         if xplaneFile.options.export_type == EXPORT_TYPE_COCKPIT:
-            for attr in self.cockpitAttributes:
-                o += commands.writeAttribute(self.cockpitAttributes[attr], self)
+            for name, attr in self.cockpitAttributes.itemsWithValues():
+                o += commands.writeAttribute(attr, self)
 
         return o
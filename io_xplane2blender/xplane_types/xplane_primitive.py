@@ -23,6 +23,8 @@ class XPlanePrimitive(XPlaneObject):
     """
     Used to represent Mesh objects and their XPlaneObjectSettings
     """
+    __slots__ = ("indices", "material", "manipulator")
+
     def __init__(self, blenderObject:bpy.types.Object):
         assert blenderObject.type == 'MESH'
         super().__init__(blenderObject)
@@ -70,8 +72,8 @@ class XPlanePrimitive(XPlaneObject):
 
         o += commands.writeReseters(self)
 
-        for attr in self.attributes:
-            o += commands.writeAttribute(self.attributes[attr], self)
+        for name, attr in self.attributes.itemsWithValues():
+            o += commands.writeAttribute(attr, self)
 
         # rendering (do not render meshes/objects with no indices)
         if self.indices[1] > self.indices[0]:
@@ -88,8 +90,8 @@ class XPlanePrimitive(XPlaneObject):
                     if not xplane_manipulator.check_bone_is_leaf(self.xplaneBone,True,self.manipulator):
                         return ''
 
-            for attr in self.cockpitAttributes:
-                o += commands.writeAttribute(self.cockpitAttributes[attr], self)
+            for name, attr in self.cockpitAttributes.itemsWithValues():
+                o += commands.writeAttribute(attr, self)
 
         if self.indices[1] > self.indices[0]:
             offset = self.indices[0]
@@ -1,6 +1,6 @@
 import bpy
 from typing import List
-from ..xplane_helpers import floatToStr, vec_b_to_x
+from ..xplane_helpers import floatToStr, frame_state, vec_b_to_x
 from ..xplane_constants import *
 from io_xplane2blender.xplane_types import xplane_light
 
@@ -26,7 +26,8 @@ class XPlaneVLights():
     def append(self, light:xplane_light.XPlaneLight)->None:
         # we only write vlights here, all other lights go into the commands table directly
         if light.lightType in LIGHTS_OLD_TYPES:
-            bpy.context.scene.frame_set(1)
+            # Almost always already evaluated, this is just in case
+            frame_state.set(bpy.context.scene, 1)
             self.items.append(light)
             light.indices = [self.globalindex, self.globalindex+1]
             self.indices.append(self.globalindex)
@@ -4,12 +4,14 @@ Creates the User Interface for all X-Plane properties.
 
 import collections
 import math
+import pathlib
 from typing import Optional, Union
 
 import bpy
 from bpy.types import Object, UILayout
 
-from io_xplane2blender import xplane_constants, xplane_props, xplane_types, xplane_utils
+from io_xplane2blender import xplane_constants, xplane_helpers, xplane_props, xplane_utils
+from io_xplane2blender.xplane_utils import xplane_commands_txt_parser, xplane_datarefs_txt_parser
 
 from .xplane_constants import *
 from .xplane_ops import *
@@ -174,6 +176,8 @@ def empty_layout(layout:bpy.types.UILayout, empty_obj:bpy.types.Object):
 
 def scene_layout(layout:bpy.types.UILayout, scene:bpy.types.Scene):
     layout.row().operator("scene.export_to_relative_dir", icon="EXPORT")
+    if len(bpy.data.scenes) > 1:
+        layout.row().operator("scene.export_to_relative_dir", text="Export OBJs (All Scenes)", icon="EXPORT").all_scenes = True
     layout.row().prop(scene.xplane, "version")
     layout.row().prop(scene.xplane, "compositeTextures")
 
@@ -199,11 +203,12 @@ def scene_layout(layout:bpy.types.UILayout, scene:bpy.types.Scene):
     if needs_warning is True:
         layout.row().label(text="     Make backups or switch to a more stable release!")
 
+    collections = xplane_helpers.get_collections_in_scene(scene)[1:]
     exp_box = layout.box()
     exp_box.label(text="Root Collections")
     for collection in [
         coll
-        for coll in xplane_helpers.get_collections_in_scene(scene)[1:]
+        for coll in collections
         if coll.xplane.is_exportable_collection]:
         collection_layer_layout(exp_box, collection)
 
@@ -218,7 +223,7 @@ def scene_layout(layout:bpy.types.UILayout, scene:bpy.types.Scene):
     if scene.xplane.expanded_non_exporting_collections:
         for collection in [
             coll
-            for coll in xplane_helpers.get_collections_in_scene(scene)[1:]
+            for coll in collections
             if not coll.xplane.is_exportable_collection]:
             collection_layer_layout(non_exp_box, collection)
 
@@ -226,6 +231,11 @@ def scene_layout(layout:bpy.types.UILayout, scene:bpy.types.Scene):
     advanced_box.label(text="Advanced Settings")
     advanced_column = advanced_box.column()
     advanced_column.prop(scene.xplane, "optimize")
+    advanced_column.prop(scene.xplane, "simplify_keyframes")
+    live_export_row = advanced_column.row()
+    live_export_row.prop(scene.xplane, "live_export")
+    if scene.xplane.live_export:
+        live_export_row.prop(scene.xplane, "live_export_delay", text="Delay")
     advanced_column.prop(scene.xplane, "debug")
 
     if scene.xplane.debug:
@@ -592,6 +602,7 @@ def light_layout(layout:bpy.types.UILayout, obj:bpy.types.Object)->None:
                 #try_param("param_size", "Size", 3)
                 #--- WIDTH -----------------------------------------------
                 if has_width or has_dir_mag:
+                    from io_xplane2blender.xplane_types.xplane_light import XPlaneLight
                     # Covers DIR_MAG case as well,
                     # though, ideally we'd stick with only using is_omni
                     if light_data.type == "POINT":
@@ -601,11 +612,11 @@ def light_layout(layout:bpy.types.UILayout, obj:bpy.types.Object)->None:
                     elif not is_omni:
                         if has_width:
                             if "BILLBOARD" in parsed_light.best_overload().overload_type:
-                                WIDTH_val = round(xplane_types.XPlaneLight.WIDTH_for_billboard(light_data.spot_size), 5)
+                                WIDTH_val = round(XPlaneLight.WIDTH_for_billboard(light_data.spot_size), 5)
                             elif "SPILL" in parsed_light.best_overload().overload_type:
-                                WIDTH_val = round(xplane_types.XPlaneLight.WIDTH_for_spill(light_data.spot_size), 5)
+                                WIDTH_val = round(XPlaneLight.WIDTH_for_spill(light_data.spot_size), 5)
                         elif has_dir_mag:
-                            WIDTH_val = round(xplane_types.XPlaneLight.DIR_MAG_for_billboard(light_data.spot_size), 5)
+                            WIDTH_val = round(XPlaneLight.DIR_MAG_for_billboard(light_data.spot_size), 5)
                     debug_box.row().label(text=f"Width: {WIDTH_val}")
                 #---------------------------------------------------------
                 #try_param("param_index", "INDEX", "Dataref Index", n=0)
@@ -1153,6 +1164,18 @@ class XPLANE_UL_CommandSearchList(bpy.types.UIList):
         if filter_name == "":
             return flt_flags,flt_neworder
 
+        # The search index is in the same order as the file, and therefore the
+        # search list (see XPLANE_OT_CommandSearchToggle). A list saved in an older .blend
+        # could be out of sync with the resource file, then we fall back to scanning
+        command_search_list = bpy.context.scene.xplane.command_search_window_state.command_search_list
+        search_index = xplane_commands_txt_parser.get_commands_txt_search_index(
+                pathlib.Path(xplane_helpers.get_plugin_resources_folder(), "Commands.txt").as_posix())
+        if (not isinstance(search_index, str)
+                and len(command_search_list) > 0
+                and len(search_index) == len(command_search_list)
+                and search_index.keys[-1] == command_search_list[-1].command.upper()):
+            return search_index.filter_flags(filter_name, self.bitflag_filter_item), flt_neworder
+
         #Search info:
         # A set of one or more unique searches (split on |) composed of one or more unique search terms (split by ' ')
         # A command must match at least one search in all searches, and must partially match each search term
@@ -1171,7 +1194,7 @@ class XPLANE_UL_CommandSearchList(bpy.types.UIList):
                     return True
             return False
 
-        for command_info in bpy.context.scene.xplane.command_search_window_state.command_search_list:
+        for command_info in command_search_list:
             if check_command(command_info.command, search_info):
                 flt_flags.append(self.bitflag_filter_item)
             else:
@@ -1219,6 +1242,18 @@ class XPLANE_UL_DatarefSearchList(bpy.types.UIList):
         if filter_name == "":
             return flt_flags,flt_neworder
 
+        # The search index is in the same order as the file, and therefore the
+        # search list (see XPLANE_OT_DatarefSearchToggle). A list saved in an older .blend
+        # could be out of sync with the resource file, then we fall back to scanning
+        dataref_search_list = bpy.context.scene.xplane.dataref_search_window_state.dataref_search_list
+        search_index = xplane_datarefs_txt_parser.get_datarefs_txt_search_index(
+                pathlib.Path(xplane_helpers.get_plugin_resources_folder(), "DataRefs.txt").as_posix())
+        if (not isinstance(search_index, str)
+                and len(dataref_search_list) > 0
+                and len(search_index) == len(dataref_search_list)
+                and search_index.keys[-1] == dataref_search_list[-1].dataref_path.upper()):
+            return search_index.filter_flags(filter_name, self.bitflag_filter_item), flt_neworder
+
         #Search info:
         # A set of one or more unique searches (split on |) composed of one or more unique search terms (split by ' ')
         # A dataref must match at least one search in all searches, and must partially match each search term
@@ -1237,7 +1272,7 @@ class XPLANE_UL_DatarefSearchList(bpy.types.UIList):
                     return True
             return False
 
-        for dref in bpy.context.scene.xplane.dataref_search_window_state.dataref_search_list:
+        for dref in dataref_search_list:
             if check_dref(dref.dataref_path, search_info):
                 flt_flags.append(self.bitflag_filter_item)
             else:
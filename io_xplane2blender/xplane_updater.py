@@ -226,7 +226,7 @@ def _update_LocRot(has_datarefs:Union[bpy.types.Object, bpy.types.Bone],logger:X
               )
 
 
-def _rollback_blend_glass(logger:XPlaneLogger)->None:
+def _rollback_blend_glass(mat:bpy.types.Material, logger:XPlaneLogger)->None:
     """
     Side Effects: mat.xplane.blend_glass may change, mat.xplane.blend_v1100 deleted
 
@@ -235,28 +235,27 @@ def _rollback_blend_glass(logger:XPlaneLogger)->None:
 
     This saves Blend Glass (if needed) before blend_v1100 is deleted
     """
-    for mat in bpy.data.materials:
-        v10 = mat.xplane.get('blend_v1000')
-        v11 = mat.xplane.get('blend_v1100')
+    v10 = mat.xplane.get('blend_v1000')
+    v11 = mat.xplane.get('blend_v1100')
 
-        if v11 == 3: #Aka, where BLEND_GLASS was in the enum
-            mat.xplane.blend_glass = True
+    if v11 == 3: #Aka, where BLEND_GLASS was in the enum
+        mat.xplane.blend_glass = True
 
-            # This bit of code reachs around Blender's magic EnumProperty
-            # stuff and get at the RNA behind it, all to find the name.
-            # If the default for blend_v1000 ever changes, we'll be covered.
-            blend_v1000 = xplane_props.XPlaneMaterialSettings.bl_rna.properties['blend_v1000']
-            enum_items = blend_v1000.enum_items
+        # This bit of code reachs around Blender's magic EnumProperty
+        # stuff and get at the RNA behind it, all to find the name.
+        # If the default for blend_v1000 ever changes, we'll be covered.
+        blend_v1000 = xplane_props.XPlaneMaterialSettings.bl_rna.properties['blend_v1000']
+        enum_items = blend_v1000.enum_items
 
-            if v10 is None:
-                v10_mode = enum_items[enum_items.find(blend_v1000.default)].name
-            else:
-                v10_mode = enum_items[v10].name
-            logger.info(
-                    "Set material \"{name}\"'s Blend Glass property to true and its Blend Mode to {v10_mode}"
-                    .format(name=mat.name, v10_mode=v10_mode))
+        if v10 is None:
+            v10_mode = enum_items[enum_items.find(blend_v1000.default)].name
+        else:
+            v10_mode = enum_items[v10].name
+        logger.info(
+                "Set material \"{name}\"'s Blend Glass property to true and its Blend Mode to {v10_mode}"
+                .format(name=mat.name, v10_mode=v10_mode))
 
-        xplane_updater_helpers.delete_property_from_datablock(mat.xplane, "blend_v1100")
+    xplane_updater_helpers.delete_property_from_datablock(mat.xplane, "blend_v1100")
 
 
 def _set_shadow_local_and_delete_global_shadow(logger:xplane_helpers.XPlaneLogger)->None:
@@ -279,7 +278,7 @@ def _set_shadow_local_and_delete_global_shadow(logger:xplane_helpers.XPlaneLogge
             mat.xplane.shadow_local = val # Easy case #1
 
     def _print_error_table(material_uses: Dict[bpy.types.Material, List[UsedLayerInfo]])->None:
-        error_count = len(logger.findErrors())
+        error_count = logger.countErrors()
         for mat, layers_used_in in material_uses.items():
             if (len(layers_used_in) > 1
                 and any(layers_used_in[0].cast_shadow != l.cast_shadow for l in layers_used_in)): # Checks for mixed use of Cast Shadow (Global)
@@ -295,7 +294,7 @@ def _set_shadow_local_and_delete_global_shadow(logger:xplane_helpers.XPlaneLogge
                             ]
                         )
                     )
-        if len(logger.findErrors()) > error_count:
+        if logger.countErrors() > error_count:
             logger.info("'Cast shadows' has been replaced by the Material's 'Cast Shadows (Local)'."
                         " The above OBJs may have incorrect shadows unless 'Cast Shadows (Local)'"
                         " is manually made uniform again, which could involve making"
@@ -328,6 +327,91 @@ def _set_shadow_local_and_delete_global_shadow(logger:xplane_helpers.XPlaneLogge
     for obj in bpy.data.objects:
         xplane_updater_helpers.delete_property_from_datablock(obj.xplane.layer, "shadow")
 
+def _pre_4_0_0_alpha_6_layer(has_layer:Union[bpy.types.Collection, bpy.types.Object], logger:XPlaneLogger)->None:
+    """
+    Side Effects: has_layer.xplane.layer.autodetectTextures set to False,
+    its "index" and "export" (Include in Export) deleted
+    """
+    # I acknowledge that the 3_3_0 updater already has code like this,
+    # however it doesn't matter much since most people aren't coming from
+    # that anymore /s
+    has_layer.xplane.layer.autodetectTextures = False
+    xplane_updater_helpers.delete_property_from_datablock(has_layer.xplane.layer, "index")
+    xplane_updater_helpers.delete_property_from_datablock(has_layer.xplane.layer, "export")
+
+
+def _delete_export_mode(scene:bpy.types.Scene, logger:XPlaneLogger)->None:
+    """Side Effects: scene.xplane's "exportMode" deleted"""
+    xplane_updater_helpers.delete_property_from_datablock(scene.xplane, "exportMode")
+
+
+def _delete_export_mesh(obj:bpy.types.Object, logger:XPlaneLogger)->None:
+    """Side Effects: XPlaneObjectSettings's "export_mesh" deleted"""
+    xplane_updater_helpers.delete_property_from_datablock(obj.xplane, "export_mesh")
+
+
+def _default_light_type(light:bpy.types.Light, logger:XPlaneLogger)->None:
+    """Side Effects: light.xplane.type set to LIGHT_DEFAULT, if it was never set"""
+    # Remember, get returning 0 and return None means something different
+    if light.xplane.get("type") is None:
+        light.xplane.type = xplane_constants.LIGHT_DEFAULT
+
+
+# Migrations that need the whole file, as (the version that made them unnecessary, migration(logger)).
+# They run first, in this order. 4.0.0's must be first, everything else expects Collections
+_FILE_MIGRATIONS = (
+    ("4.0.0", _layers_to_collection),
+    ("3.3.0", _change_pre_3_3_0_properties),
+    ("3.5.1-dev.0+43.20190606030000", _set_shadow_local_and_delete_global_shadow),
+)
+
+# Migrations that only read and change the datablock they are given, as
+# (the version that made them unnecessary, kind of datablock, migration(datablock, logger)).
+#
+# Every one a file needs is applied in one pass over bpy.data after _FILE_MIGRATIONS,
+# in this order per datablock. Anything that needs other datablocks goes in _FILE_MIGRATIONS
+_DATABLOCK_MIGRATIONS = (
+    ("3.4.0", "BONE", _update_LocRot),
+    ("3.4.0", "OBJECT", _update_LocRot),
+    ("3.5.0-beta.2+32.20180725010500", "MATERIAL", _rollback_blend_glass),
+    ("4.0.0-alpha.6+71.20200207171400", "COLLECTION", _pre_4_0_0_alpha_6_layer),
+    ("4.0.0-alpha.6+71.20200207171400", "OBJECT", _pre_4_0_0_alpha_6_layer),
+    ("4.0.0-alpha.6+71.20200207171400", "OBJECT", _delete_export_mesh),
+    ("4.0.0-alpha.6+71.20200207171400", "SCENE", _delete_export_mode),
+    ("4.0.0-beta.2+88.20200622133200", "LIGHT", _default_light_type),
+)
+
+# The order datablocks are visited in
+_DATABLOCK_KINDS = ("SCENE", "COLLECTION", "BONE", "OBJECT", "MATERIAL", "LIGHT")
+
+
+def _datablocks(kind:str)->Sequence[Union[bpy.types.ID, bpy.types.Bone]]:
+    if kind == "BONE":
+        #Thanks to Python's duck typing and Blender's PointerProperties, Bones work like IDs here
+        return [bone for arm in bpy.data.armatures for bone in arm.bones]
+    return {
+        "SCENE": bpy.data.scenes,
+        "COLLECTION": bpy.data.collections,
+        "OBJECT": bpy.data.objects,
+        "MATERIAL": bpy.data.materials,
+        "LIGHT": bpy.data.lights,
+    }[kind][:]
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_version(version_str:str)->xplane_helpers.VerStruct:
+    return xplane_helpers.VerStruct.parse_version(version_str)
+
+
+def data_model_is_current(last_version:xplane_helpers.VerStruct)->bool:
+    """
+    True if a file last saved with last_version needs no migrations,
+    without looking at the file
+    """
+    return all(last_version >= _parse_version(migration[0])
+               for migration in _FILE_MIGRATIONS + _DATABLOCK_MIGRATIONS)
+
+
 def update(last_version:xplane_helpers.VerStruct, logger:xplane_helpers.XPlaneLogger)->None:
     """
     Entry point for the updater, which may change or delete XPlane2Blender
@@ -336,56 +420,27 @@ def update(last_version:xplane_helpers.VerStruct, logger:xplane_helpers.XPlaneLo
 
     Re-running the updater should result in no changes
     """
-    if last_version < xplane_helpers.VerStruct.parse_version("4.0.0"):
-        _layers_to_collection(logger)
-
-    if last_version < xplane_helpers.VerStruct.parse_version('3.3.0'):
-        _change_pre_3_3_0_properties(logger)
-
-    if last_version < xplane_helpers.VerStruct.parse_version('3.4.0'):
-        for arm in bpy.data.armatures:
-            for bone in arm.bones:
-                #Thanks to Python's duck typing and Blender's PointerProperties, this works
-                _update_LocRot(bone,logger)
-
-        for obj in bpy.data.objects:
-            _update_LocRot(obj,logger)
-
-    if last_version < xplane_helpers.VerStruct.parse_version('3.5.0-beta.2+32.20180725010500'):
-        _rollback_blend_glass(logger)
-
-    if last_version < xplane_helpers.VerStruct.parse_version("3.5.1-dev.0+43.20190606030000"):
-        _set_shadow_local_and_delete_global_shadow(logger)
-
-    if last_version < xplane_helpers.VerStruct.parse_version("4.0.0-alpha.6+71.20200207171400"):
-        #--- Disable autodetect textures --------------------------------------
-
-        # I acknowledge that the 3_3_0 updater already has code like this,
-        # however it doesn't matter much since most people aren't coming from
-        # that anymore /s
-        for has_layer in bpy.data.collections[:] + bpy.data.objects[:]:
-            has_layer.xplane.layer.autodetectTextures = False
-        #--- Delete "exportMode" ----------------------------------------------
-        for scene in bpy.data.scenes:
-            xplane_updater_helpers.delete_property_from_datablock(scene.xplane, "exportMode")
-        #----------------------------------------------------------------------
-        #--- Delete index -----------------------------------------------------
-        for has_layer in bpy.data.collections[:] + bpy.data.objects[:]:
-            xplane_updater_helpers.delete_property_from_datablock(has_layer.xplane.layer, "index")
-        #----------------------------------------------------------------------
-        #--- Delete XPlaneObjectSettings.export_mesh---------------------------
-        for obj in bpy.data.objects:
-            xplane_updater_helpers.delete_property_from_datablock(obj.xplane, "export_mesh")
-        #----------------------------------------------------------------------
-        #--- Delete all XPlaneLayer's "Include in Export" ---------------------
-        for has_layer in bpy.data.collections[:] + bpy.data.objects[:]:
-            xplane_updater_helpers.delete_property_from_datablock(has_layer.xplane.layer, "export")
-        #----------------------------------------------------------------------
-
-    if last_version < xplane_helpers.VerStruct.parse_version("4.0.0-beta.2+88.20200622133200"):
-        # Remember, get returning 0 and return None means something different
-        for light in filter(lambda l: l.xplane.get("type") is None, bpy.data.lights):
-            light.xplane.type = xplane_constants.LIGHT_DEFAULT
+    if data_model_is_current(last_version):
+        return
+
+    # _layers_to_collection renames and makes Collections,
+    # nothing cached about the file from before can be trusted
+    xplane_helpers.clear_scene_index()
+    for version_str, migration in _FILE_MIGRATIONS:
+        if last_version < _parse_version(version_str):
+            migration(logger)
+
+    migrations_by_kind = collections.defaultdict(list) # type: Dict[str, List[Any]]
+    for version_str, kind, migration in _DATABLOCK_MIGRATIONS:
+        if last_version < _parse_version(version_str):
+            migrations_by_kind[kind].append(migration)
+
+    for kind in _DATABLOCK_KINDS:
+        migrations = migrations_by_kind.get(kind)
+        if migrations:
+            for datablock in _datablocks(kind):
+                for migration in migrations:
+                    migration(datablock, logger)
 
 
 @persistent
@@ -5,10 +5,12 @@ import sys
 from collections import OrderedDict
 from pathlib import Path
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from io_xplane2blender import xplane_helpers
 from io_xplane2blender.xplane_export import showLogDialog
+from io_xplane2blender.xplane_utils import xplane_resource_cache
+from io_xplane2blender.xplane_utils.xplane_search_index import SearchIndex
 
 """
 Datarefs.txt file format spec
@@ -118,9 +120,57 @@ def parse_datarefs_txt(filepath: str)->Union[List[DatarefInfoStruct],str]:
     except Exception as e:
         return e.args[1]
 
+_datarefs_txt_search_index = {} # type: Dict[str,SearchIndex]
+
+# Why filepath couldn't be parsed, until it changes, as (source_stamp, error)
+_datarefs_txt_errors = {} # type: Dict[str,Tuple[Optional[Tuple[int,int]],str]]
+
+def _load_datarefs_txt(filepath:str)->Union[List[DatarefInfoStruct],str]:
+    '''
+    Fills _datarefs_txt_content and _datarefs_txt_search_index from the cache next to
+    filepath, or by parsing filepath and (re)making that cache.
+
+    Errors are remembered too, the search window asks on every redraw
+    '''
+    stamp = xplane_resource_cache.source_stamp(filepath)
+    try:
+        error_stamp, error = _datarefs_txt_errors[filepath]
+    except KeyError:
+        pass
+    else:
+        if error_stamp == stamp:
+            return error
+        del _datarefs_txt_errors[filepath]
+
+    cached = xplane_resource_cache.read_cache(filepath)
+    if cached is not None:
+        file_contents, search_index = cached
+    else:
+        file_contents = parse_datarefs_txt(filepath)
+        if isinstance(file_contents,str):
+            _datarefs_txt_errors[filepath] = (stamp, file_contents)
+            return file_contents
+        search_index = SearchIndex(dref.path for dref in file_contents)
+        xplane_resource_cache.write_cache(filepath, (file_contents, search_index))
+
+    _datarefs_txt_content[filepath] = file_contents
+    _datarefs_txt_search_index[filepath] = search_index
+    return file_contents
+
 def get_datarefs_txt_file_content(filepath:str)->Union[List[DatarefInfoStruct],str]:
     if filepath in _datarefs_txt_content:
         return _datarefs_txt_content[filepath]
     else:
         # Lazy parsing of file
-        return parse_datarefs_txt(filepath)
+        return _load_datarefs_txt(filepath)
+
+def get_datarefs_txt_search_index(filepath:str)->Union[SearchIndex,str]:
+    '''
+    Returns a SearchIndex over the paths of filepath's datarefs, in file order,
+    or an error string
+    '''
+    if filepath not in _datarefs_txt_search_index:
+        result = _load_datarefs_txt(filepath)
+        if isinstance(result,str):
+            return result
+    return _datarefs_txt_search_index[filepath]
@@ -93,6 +93,7 @@ from typing import Dict, Iterator, List, Optional, Mapping, Set, Tuple, Union
 
 from io_xplane2blender import xplane_constants
 from io_xplane2blender.xplane_helpers import XPlaneLogger, logger
+from io_xplane2blender.xplane_utils import xplane_resource_cache
 
 
 OVERLOAD_TYPES = {
@@ -575,17 +576,26 @@ def parse_lights_file():
     If already parsed, does nothing. Raises OSError or ValueError
     if file not found or content invalid,
     logger errors and warnings will have been collected
+
+    A successful parse is cached next to lights.txt, and used instead of parsing
+    as long as lights.txt and the addon version haven't changed
+    (see xplane_resource_cache)
     """
     global _parsed_lights_txt_content
     if _parsed_lights_txt_content:
         return
 
-    num_logger_problems = len(logger.findErrors())
+    num_logger_problems = logger.countErrors()
     LIGHTS_FILEPATH = os.path.join(xplane_constants.ADDON_RESOURCES_FOLDER,"lights.txt")
     if not os.path.isfile(LIGHTS_FILEPATH):
         logger.error(f"lights.txt file was not found in resource folder {LIGHTS_FILEPATH}")
         raise FileNotFoundError
 
+    cached_content = xplane_resource_cache.read_cache(LIGHTS_FILEPATH)
+    if cached_content:
+        _parsed_lights_txt_content = cached_content
+        return
+
     def is_allowed_param(p:str)->bool:
         return (p in {
             "R",
@@ -686,7 +696,7 @@ def parse_lights_file():
                             else:
                                 return False
 
-                    prev_logger_errors = len(logger.findErrors())
+                    prev_logger_errors = logger.countErrors()
                     for i, arg in enumerate(light_args):
                         if not validate_parameterization_arg(i, arg):
                             logger.error(
@@ -695,7 +705,7 @@ def parse_lights_file():
                                 )
                             continue
 
-                    return not (len(logger.findErrors()) - prev_logger_errors)
+                    return not (logger.countErrors() - prev_logger_errors)
                 if not validate_arguments():
                     continue
 
@@ -734,5 +744,9 @@ def parse_lights_file():
 
     if not _parsed_lights_txt_content:
         logger.error("lights.txt had no valid light records in it")
-    if len(logger.findErrors()) - num_logger_problems:
+    if logger.countErrors() - num_logger_problems:
         raise LightsTxtFileParsingError
+
+    # Only a problem free parse is cached, otherwise the problems
+    # would never be reported again
+    xplane_resource_cache.write_cache(LIGHTS_FILEPATH, _parsed_lights_txt_content)
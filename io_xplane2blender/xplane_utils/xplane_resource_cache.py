@@ -0,0 +1,100 @@
+"""
+Pickled caches of preparsed resource files (DataRefs.txt, etc), stored next to
+the resource file as "<resource file>.pickle".
+
+A cache is only used if it was made by this version of the addon from a source file
+with the same contents. Checking is cheap when the source's mtime and size
+haven't changed, otherwise its hash is compared.
+
+Failing to read or write a cache is never an error, the caller simply parses
+the resource file like it always has. The addon's folder may be read-only.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Optional, Tuple
+
+from io_xplane2blender import xplane_config
+
+# Increment when the layout of the header or any cached data changes
+CACHE_FORMAT_VERSION = 2
+
+
+def get_cache_filepath(source_filepath:str)->str:
+    return source_filepath + ".pickle"
+
+
+def _hash_file(filepath:str)->str:
+    with open(filepath, "rb") as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+
+def _make_header(source_filepath:str, source_hash:Optional[str]=None)->Tuple[Any, ...]:
+    stat = os.stat(source_filepath)
+    return (
+        CACHE_FORMAT_VERSION,
+        tuple(xplane_config.CURRENT_ADDON_VERSION),
+        stat.st_mtime_ns,
+        stat.st_size,
+        source_hash or _hash_file(source_filepath),
+    )
+
+
+def read_cache(source_filepath:str)->Optional[Any]:
+    """
+    Returns the data cached for source_filepath, or None if there
+    is no cache or it is out of date
+    """
+    try:
+        with open(get_cache_filepath(source_filepath), "rb") as cache_file:
+            header = pickle.load(cache_file)
+            format_version, addon_version, mtime_ns, size, source_hash = header
+            if (format_version != CACHE_FORMAT_VERSION
+                or tuple(addon_version) != tuple(xplane_config.CURRENT_ADDON_VERSION)):
+                return None
+
+            stat = os.stat(source_filepath)
+            if ((stat.st_mtime_ns, stat.st_size) != (mtime_ns, size)
+                and _hash_file(source_filepath) != source_hash):
+                return None
+            return pickle.load(cache_file)
+    except Exception:
+        # Missing, unreadable, truncated, or from an incompatible version.
+        # It will be remade
+        return None
+
+
+def write_cache(source_filepath:str, data:Any)->bool:
+    """
+    Pickles data as the cache for source_filepath, returns True if successful.
+    The write is atomic, readers never see a half written cache
+    """
+    cache_filepath = get_cache_filepath(source_filepath)
+    tmp_filepath = f"{cache_filepath}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filepath, "wb") as cache_file:
+            pickle.dump(_make_header(source_filepath), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filepath, cache_filepath)
+    except Exception:
+        try:
+            os.remove(tmp_filepath)
+        except OSError:
+            pass
+        return False
+    else:
+        return True
+
+
+def source_stamp(source_filepath:str)->Optional[Tuple[int, int]]:
+    """
+    Returns (mtime_ns, size) of source_filepath, or None if it can't be found.
+    Cheap enough to check on every UI redraw, for remembering why a file couldn't
+    be parsed until it changes
+    """
+    try:
+        stat = os.stat(source_filepath)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
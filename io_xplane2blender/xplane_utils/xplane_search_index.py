@@ -0,0 +1,177 @@
+"""
+A prebuilt index for filtering the dataref and command search windows.
+
+Filtering follows the search window's rules: a filter is one or more searches
+split by '|', each made of one or more search terms split by ' '. A key matches
+if, for any search, every term is a case insensitive substring of the key.
+
+Keys (usually paths like "sim/cockpit2/gauges/...") are split into tokens on every
+non-alphanumeric character, and each token gets a posting list of the keys it is in.
+Tokens are kept sorted (and sorted reversed), a compact stand-in for a prefix (and suffix) trie,
+so a term only has to be compared against the much smaller set of unique tokens:
+- A term without separators can only be found inside a single token. Each token's
+  n-grams are indexed too, so only tokens having all of the term's n-grams are checked
+- A term like "AB/CD/EF" needs a token ending with "AB", the token "CD",
+  and a token starting with "EF"
+
+Candidates found this way are always checked against the real substring rule,
+so results are exactly what a linear scan would give.
+"""
+
+import bisect
+import collections
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+_SEPARATORS = re.compile(r"[^A-Z0-9]+")
+
+# Sorts after any character found in a token
+_MAX_CHAR = "\U0010FFFF"
+
+# Length of the n-grams indexed for each token
+NGRAM_LENGTH = 3
+
+
+def _ngrams(s:str)->Set[str]:
+    return {s[i:i+NGRAM_LENGTH] for i in range(len(s) - NGRAM_LENGTH + 1)}
+
+
+class SearchIndex():
+    """
+    Index over a list of keys, search returns the positions of matching keys
+    """
+
+    # How many filter results to remember before starting over,
+    # enough for someone typing and backspacing
+    MAX_CACHED_RESULTS = 256
+
+    def __init__(self, keys:Iterable[str])->None:
+        self.keys: List[str] = [key.upper() for key in keys]
+
+        postings = collections.defaultdict(list) # type: Dict[str, List[int]]
+        for i, key in enumerate(self.keys):
+            for token in set(_SEPARATORS.split(key)):
+                if token:
+                    postings[token].append(i)
+
+        self.postings: Dict[str, List[int]] = dict(postings)
+        self.tokens: List[str] = sorted(self.postings)
+        self.reversed_tokens: List[str] = sorted(token[::-1] for token in self.tokens)
+
+        token_ngrams = collections.defaultdict(list) # type: Dict[str, List[int]]
+        for i, token in enumerate(self.tokens):
+            for ngram in _ngrams(token):
+                token_ngrams[ngram].append(i)
+        # n-gram to positions in self.tokens
+        self.token_ngrams: Dict[str, List[int]] = dict(token_ngrams)
+        self._results: Dict[str, FrozenSet[int]] = {}
+
+    def __len__(self)->int:
+        return len(self.keys)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_results"]
+        return state
+
+    def __setstate__(self, state)->None:
+        self.__dict__.update(state)
+        self._results = {}
+
+    @staticmethod
+    def _with_prefix(sorted_tokens:List[str], prefix:str)->List[str]:
+        start = bisect.bisect_left(sorted_tokens, prefix)
+        end = bisect.bisect_left(sorted_tokens, prefix + _MAX_CHAR, start)
+        return sorted_tokens[start:end]
+
+    def _postings_union(self, tokens:Iterable[str])->Set[int]:
+        matches = set()
+        for token in tokens:
+            matches.update(self.postings[token])
+        return matches
+
+    def _tokens_containing(self, term:str)->Iterable[str]:
+        """Returns all tokens with term somewhere in it"""
+        if len(term) < NGRAM_LENGTH:
+            return (token for token in self.tokens if term in token)
+
+        token_ids = None # type: Optional[Set[int]]
+        for ngram in _ngrams(term):
+            try:
+                ngram_token_ids = self.token_ngrams[ngram]
+            except KeyError:
+                return ()
+            token_ids = set(ngram_token_ids) if token_ids is None else token_ids.intersection(ngram_token_ids)
+            if not token_ids:
+                return ()
+        # Having all of the term's n-grams doesn't mean having them in order
+        return (self.tokens[i] for i in token_ids if term in self.tokens[i])
+
+    def _candidates(self, term:str)->Optional[Set[int]]:
+        """
+        Returns a superset of the keys term could be in,
+        or None if the index can't narrow it down
+        """
+        if not term:
+            return None
+
+        pieces = _SEPARATORS.split(term)
+        if len(pieces) == 1:
+            return self._postings_union(self._tokens_containing(term))
+
+        constraints = [] # type: List[Set[int]]
+        if pieces[0]:
+            constraints.append(self._postings_union(
+                token[::-1] for token in self._with_prefix(self.reversed_tokens, pieces[0][::-1])))
+        for piece in pieces[1:-1]:
+            if piece:
+                constraints.append(set(self.postings.get(piece, ())))
+        if pieces[-1]:
+            constraints.append(self._postings_union(self._with_prefix(self.tokens, pieces[-1])))
+
+        if not constraints:
+            return None
+        return set.intersection(*constraints)
+
+    def search(self, filter_name:str)->FrozenSet[int]:
+        """
+        Returns the positions of all keys matching filter_name,
+        see the module docstring for the rules
+        """
+        try:
+            return self._results[filter_name]
+        except KeyError:
+            pass
+
+        searches = {frozenset(search.split(' ')) for search in filter_name.upper().split('|')}
+        matches = set() # type: Set[int]
+        for search in searches:
+            candidates = None # type: Optional[Set[int]]
+            for term in search:
+                term_candidates = self._candidates(term)
+                if term_candidates is None:
+                    continue
+                candidates = term_candidates if candidates is None else candidates & term_candidates
+                if not candidates:
+                    break
+
+            keys = self.keys
+            matches.update(
+                i for i in (range(len(keys)) if candidates is None else candidates)
+                if all(term in keys[i] for term in search)
+            )
+
+        if len(self._results) >= self.MAX_CACHED_RESULTS:
+            self._results.clear()
+        self._results[filter_name] = frozenset(matches)
+        return self._results[filter_name]
+
+    def filter_flags(self, filter_name:str, bitflag_filter_item:int)->List[int]:
+        """
+        Returns the flt_flags for UIList.filter_items: bitflag_filter_item
+        for every matching key, else 0
+        """
+        flags = [0] * len(self.keys)
+        for i in self.search(filter_name):
+            flags[i] = bitflag_filter_item
+        return flags
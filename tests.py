@@ -1,11 +1,56 @@
 import argparse
+import collections
+import concurrent.futures
 import glob
+import io
+import json
 import os
+import queue
 import re
+import secrets
+import statistics
 import shutil
+import socket
 import subprocess
 import sys
 import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+TMP_FOLDER = './tests/tmp'
+
+# Read by io_xplane2blender.tests for its TMP_DIR
+TMP_DIR_ENV_VAR = "XPLANE2BLENDER_TEST_TMP_DIR"
+
+# Run by each Blender in --persistent mode, and the environment variables it reads
+WORKER_SCRIPT = './tests/worker.py'
+WORKER_ADDRESS_ENV_VAR = "XPLANE2BLENDER_TEST_WORKER_ADDRESS"
+WORKER_TOKEN_ENV_VAR = "XPLANE2BLENDER_TEST_WORKER_TOKEN"
+
+"""
+Rather than mess with fancy ways to pass back test results
+we have a stupid simple solution: Print a special string
+at the end and parse it here.
+
+Unfortunately, the REGEX must be duplicated across both files
+due to some problems with importing it from the test module
+"""
+TEST_RESULTS_REGEX = re.compile(r"RESULT: After (?P<testsRun>\d+) tests got (?P<errors>\d+) errors, (?P<failures>\d+) failures, and (?P<skipped>\d+) skipped")
+
+# Printed right after the results, a JSON object of test method to seconds taken
+TEST_TIMINGS_REGEX = re.compile(r"^TIMINGS: (?P<timings>\{.*\})$\n?", re.MULTILINE)
+
+# How many runs the timing history keeps, oldest are dropped first
+MAX_TIMINGS_HISTORY = 20
+
+# Anything faster than this is too noisy to call a regression
+MIN_REGRESSION_SECONDS = 0.5
+
+# Everything we need to know about a finished test file
+TestFileResult = collections.namedtuple(
+    "TestFileResult",
+    ["pyFile", "out", "testsRun", "errors", "failures", "skipped", "seconds", "testTimings"]
+)
 
 
 def clean_tmp_folder():
@@ -22,6 +67,14 @@ def clean_tmp_folder():
             shutil.rmtree(file_object_path)
 
 
+def get_worker_tmp_folder(worker:int)->str:
+    '''
+    Each worker in --jobs mode gets its own tmp folder so that tests writing
+    the same filenames don't trample on each other
+    '''
+    return os.path.join(TMP_FOLDER, "worker_%d" % worker)
+
+
 def _make_argparse():
     parser = argparse.ArgumentParser(description="Runs the XPlane2Blender test suite")
     test_selection = parser.add_argument_group("Test Selection And Control")
@@ -39,8 +92,35 @@ def _make_argparse():
             default=False,
             action="store_true",
             dest="keep_going")
+    test_selection.add_argument("-j", "--jobs",
+            default=1,
+            help="Run this many test files at once, each in its own Blender and tmp folder",
+            type=int)
+    test_selection.add_argument("--persistent",
+            default=False,
+            help="Start Blender once per job and run test files one after another in it,"
+                 " instead of starting Blender for every test file."
+                 " Addon state is reset between files, but Blender's C level output"
+                 " goes to the job's log instead of the test file's output",
+            action="store_true")
 
     output_control = parser.add_argument_group("Output Control")
+    output_control.add_argument("--slowest",
+            default=10,
+            help="Print this many of the slowest test methods at the end, 0 for none",
+            type=int)
+    output_control.add_argument("--regression-threshold",
+            default=50.0,
+            help="Flag test files that took this much percent longer than their median in the timing history",
+            type=float)
+    output_control.add_argument("--timings-file",
+            default="./tests/test_timings.json",
+            help="JSON file that per file and per test timings are kept in, between runs",
+            type=str)
+    output_control.add_argument("--no-save-timings",
+            default=False,
+            help="Compare against the timing history, but don't add this run to it",
+            action="store_true")
     output_control.add_argument("-q", "--quiet",
             default=False,
             help="Only output if tests pass or fail",
@@ -68,22 +148,310 @@ def _make_argparse():
             action="store_true")
     return parser
 
+def printTestBeginning(text):
+    '''
+    Print the C-Style and Vim comment block start tokens
+    so that text editors can recognize places to automatically fold up the tests
+    '''
+
+    # Why the hex escapes? So we don't fold our own code!
+    print(("\x2F*=== " + text + " ").ljust(75, '=')+'\x7B\x7B\x7B')
+
+
+def printTestEnd():
+    '''
+    Print the C-Style and Vim comment block end tokens
+    so that text editors can recognize places to automatically fold up the tests
+    '''
+    print(('=' *75)+"}}}*/")
+
+
+def _make_blender_args(argv)->List[str]:
+    blender_args = [
+        argv.blender,
+        '--addons',
+        'io_xplane2blender',
+        '--factory-startup',
+        '-noaudio',
+        '-b'
+    ]
+
+    if argv.no_factory_startup:
+        blender_args.remove('--factory-startup')
+    return blender_args
+
+
+def _make_script_args(argv, pyFile:str)->List[str]:
+    script_args = ['--python', pyFile]
+
+    if argv.force_blender_debug:
+        script_args.append('--debug')
+
+    # Small Hack!
+    # Blender stops parsing after '--', so we can append the test runner
+    # args and bridge the gap without anything fancy!
+    script_args.extend(['--']+sys.argv[1:])
+    return script_args
+
+
+def _make_env(tmp_folder:str)->Dict[str, str]:
+    os.makedirs(tmp_folder, exist_ok=True)
+    env = dict(os.environ)
+    env[TMP_DIR_ENV_VAR] = os.path.abspath(tmp_folder)
+    return env
+
+
+def _filter_output(argv, out:str)->str:
+    if not argv.force_blender_debug:
+        # Ignore the junk!
+        pattern = "^(%s)" % "|".join(
+            (
+                "DAG zero",
+                "found bundled python",
+                "Read new prefs",
+                "ID user decrement error",
+                "Smart Projection time",
+                "WARNING.*has no UV-Map.",
+                "ERROR.*wrong user count in old ID",
+            )
+        )
+
+        out = "\n".join(filter(
+            lambda line: not re.match(pattern, line),
+            out.splitlines()
+        ))
+    return out
+
+
+def _make_result(pyFile:str, out:str, seconds:float)->TestFileResult:
+    results = re.search(TEST_RESULTS_REGEX, out)
+    if results is None:
+        # Oh goodie, more string matching!
+        # I'm sure this won't ever come back to bite us!
+        # If we're ever using assertRaises,
+        # hopefully we'll figure out something better! -Ted, 8/14/18
+        assert "Traceback" in out, \
+                "Test runner must print correct results string at end or have suffered an unrecoverable error"
+        testsRun, errors, failures, skipped = 0, 1, 0, 0
+    else:
+        testsRun, errors, failures, skipped = (
+            int(results.group('testsRun')),
+            int(results.group('errors')),
+            int(results.group('failures')),
+            int(results.group('skipped'))
+        )
+
+    timings = re.search(TEST_TIMINGS_REGEX, out)
+    if timings is None:
+        testTimings = {} # type: Dict[str, float]
+    else:
+        testTimings = json.loads(timings.group('timings'))
+        # Just for us, there's enough noise already
+        out = out[:timings.start()] + out[timings.end():]
+
+    return TestFileResult(pyFile, out, testsRun, errors, failures, skipped, seconds, testTimings)
+
+
+def load_timings_history(filepath:str)->Dict[str, Any]:
+    '''
+    Returns the timing history saved by save_timings_history,
+    or an empty one if it doesn't exist or can't be read
+    '''
+    try:
+        with open(filepath) as history_file:
+            history = json.load(history_file)
+        if isinstance(history.get("runs"), list):
+            return history
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"runs": []}
+
+
+def save_timings_history(filepath:str, history:Dict[str, Any], finished:List[TestFileResult], persistent:bool)->None:
+    '''
+    Adds this run's per file and per test method timings to history and saves it.
+    Runs with and without --persistent are kept apart, their times aren't comparable
+    '''
+    history["runs"].append({
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "persistent": persistent,
+        "files": {
+            result.pyFile: {"seconds": result.seconds, "tests": result.testTimings}
+            for result in finished
+        }
+    })
+    history["runs"] = history["runs"][-MAX_TIMINGS_HISTORY:]
+    with open(filepath, "w") as history_file:
+        json.dump(history, history_file, indent=1, sort_keys=True)
+
+
+def find_regressions(history:Dict[str, Any], finished:List[TestFileResult], persistent:bool, threshold:float)->List[Tuple[TestFileResult, float]]:
+    '''
+    Returns (result, baseline seconds) for every test file that took more than
+    threshold percent longer than its baseline, the median of its times in history
+    '''
+    regressions = []
+    for result in finished:
+        past_seconds = [
+            run["files"][result.pyFile]["seconds"]
+            for run in history["runs"]
+            if run.get("persistent", False) == persistent and result.pyFile in run.get("files", {})
+        ]
+        if not past_seconds:
+            continue
+
+        baseline = statistics.median(past_seconds)
+        if (result.seconds - baseline > MIN_REGRESSION_SECONDS
+                and result.seconds > baseline * (1 + threshold / 100)):
+            regressions.append((result, baseline))
+    return regressions
+
+
+def run_test_file(argv, pyFile:str, tmp_folder:str)->TestFileResult:
+    '''
+    Runs one test file in its own Blender, with io_xplane2blender.tests.TMP_DIR
+    set to tmp_folder. Nothing is printed, the output is returned instead so
+    that parallel runs can print it in order
+    '''
+    timer_start = time.perf_counter()
+    blendFile = pyFile.replace('.py', '.blend')
+    preamble = [] # type: List[str]
+
+    blender_args = _make_blender_args(argv)
+    if os.path.exists(blendFile):
+        blender_args.append(blendFile)
+    else:
+        preamble.append("WARNING: Blender file " + blendFile + " does not exist")
+    blender_args.extend(_make_script_args(argv, pyFile))
+
+    if (not argv.quiet and
+            (argv.force_blender_debug or argv.force_xplane_debug)):
+        # print the command used to execute the script
+        # to be able to easily re-run it manually to get better error output
+        preamble.append(' '.join(blender_args))
+
+    #Run Blender, normalize output line endings because Windows is dumb
+    out = subprocess.check_output(blender_args, stderr = subprocess.STDOUT, universal_newlines=True, env=_make_env(tmp_folder)) # type: str
+    out = "\n".join(preamble + [_filter_output(argv, out)])
+    return _make_result(pyFile, out, time.perf_counter() - timer_start)
+
+
+class PersistentBlender():
+    '''
+    A long lived Blender running tests/worker.py, used by --persistent.
+    It is started on first use and restarted if it dies.
+
+    Test files are sent one JSON line at a time over a localhost socket,
+    the worker answers with a JSON line holding the file's output.
+    The first line from the worker must be the token we gave it,
+    so we know we're talking to our Blender
+    '''
+
+    # How long to wait for Blender to start and connect
+    STARTUP_TIMEOUT = 120
+
+    def __init__(self, argv, tmp_folder:str, log_filepath:str)->None:
+        self.argv = argv
+        self.tmp_folder = tmp_folder
+        self.log_filepath = log_filepath
+        self.process = None # type: Optional[subprocess.Popen]
+        self.connection = None # type: Optional[socket.socket]
+        self.stream = None # type: Optional[io.TextIOWrapper]
+        self.blender_args = [] # type: List[str]
+
+    def start(self)->None:
+        token = secrets.token_hex(16)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            server.settimeout(self.STARTUP_TIMEOUT)
+
+            env = _make_env(self.tmp_folder)
+            env[WORKER_ADDRESS_ENV_VAR] = "%s:%d" % server.getsockname()
+            env[WORKER_TOKEN_ENV_VAR] = token
+
+            self.blender_args = _make_blender_args(self.argv) + _make_script_args(self.argv, WORKER_SCRIPT)
+            # Everything not from a test file (Blender startup, crashes) ends up here
+            with open(self.log_filepath, "a") as log:
+                self.process = subprocess.Popen(self.blender_args, stdout=log, stderr=subprocess.STDOUT, env=env)
+
+            try:
+                self.connection, address = server.accept()
+            except socket.timeout:
+                self.close()
+                raise RuntimeError("Blender worker didn't connect within %d seconds, see %s" % (self.STARTUP_TIMEOUT, self.log_filepath))
+
+        # Tests can take as long as they like
+        self.connection.settimeout(None)
+        self.stream = self.connection.makefile("rw", encoding="utf-8", newline="\n")
+        if self.stream.readline().strip() != token:
+            self.close()
+            raise RuntimeError("Something other than our Blender worker connected")
+
+    def close(self)->None:
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+        if self.connection is not None:
+            # Closing the connection tells the worker to quit
+            self.connection.close()
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process, self.connection, self.stream = None, None, None
+
+    def run_test_file(self, pyFile:str)->TestFileResult:
+        '''Like run_test_file, but in this Blender'''
+        if self.process is None or self.process.poll() is not None:
+            self.close()
+            self.start()
+
+        timer_start = time.perf_counter()
+        blendFile = pyFile.replace('.py', '.blend')
+        preamble = [] # type: List[str]
+        if not os.path.exists(blendFile):
+            preamble.append("WARNING: Blender file " + blendFile + " does not exist")
+            blendFile = None
+        if (not self.argv.quiet and
+                (self.argv.force_blender_debug or self.argv.force_xplane_debug)):
+            preamble.append(' '.join(self.blender_args))
+
+        try:
+            self.stream.write(json.dumps({
+                "pyFile": pyFile,
+                "blendFile": blendFile,
+                "factoryStartup": not self.argv.no_factory_startup,
+            }) + "\n")
+            self.stream.flush()
+            response = self.stream.readline()
+        except OSError:
+            response = ""
+
+        if response:
+            out = json.loads(response)["out"]
+        else:
+            # Crashed, hung up, or worse. The next file gets a new Blender
+            self.close()
+            with open(self.log_filepath) as log:
+                log_tail = log.read()[-4000:]
+            out = ("Traceback: Blender worker died while running %s, end of %s:\n%s"
+                   % (pyFile, self.log_filepath, log_tail))
+
+        out = "\n".join(preamble + [_filter_output(self.argv, out)])
+        return _make_result(pyFile, out, time.perf_counter() - timer_start)
+
+
 def main(argv=None)->int:
     '''
     Return is exit code, 0 for good, anything else is an error
     '''
     exit_code = 0
 
-    """
-    Rather than mess with fancy ways to pass back test results
-    we have a stupid simple solution: Print a special string
-    at the end and parse it here.
-
-    Unfortunately, the REGEX must be duplicated across both files
-    due to some problems with importing it from the test module
-    """
-    TEST_RESULTS_REGEX = re.compile(r"RESULT: After (?P<testsRun>\d+) tests got (?P<errors>\d+) errors, (?P<failures>\d+) failures, and (?P<skipped>\d+) skipped")
-
     # Accumulated TestResult stats, reported at the end of everything
     total_testsCompleted, total_errors, total_failures, total_skipped = (0,) * 4
     timer_start = time.perf_counter()
@@ -98,22 +466,6 @@ def main(argv=None)->int:
         if argv.exclude:
             argv.exclude = re.escape(argv.exclude)
 
-    def printTestBeginning(text):
-        '''
-        Print the C-Style and Vim comment block start tokens
-        so that text editors can recognize places to automatically fold up the tests
-        '''
-
-        # Why the hex escapes? So we don't fold our own code!
-        print(("\x2F*=== " + text + " ").ljust(75, '=')+'\x7B\x7B\x7B')
-
-    def printTestEnd():
-        '''
-        Print the C-Style and Vim comment block end tokens
-        so that text editors can recognize places to automatically fold up the tests
-        '''
-        print(('=' *75)+"}}}*/")
-
     def inFilter(filepath:str)->bool:
         '''
         Tests if filepath matches --filter and/or --exclude,
@@ -140,129 +492,121 @@ def main(argv=None)->int:
 
         return passes
 
-    exit_code = 0
+    # Decided up front, in the same order as always, so -j doesn't change what runs
+    pyFiles = [] # type: List[str]
     for root, dirs, files in os.walk('./tests'):
-        filtered_files = list(filter(lambda file: file.endswith('.test.py') and
-                                     inFilter(os.path.join(root, file)),
-                                     files))
-        if exit_code != 0:
-            break
+        pyFiles.extend(os.path.join(root, file) for file in files
+                       if file.endswith('.test.py') and inFilter(os.path.join(root, file)))
+
+    jobs = max(1, argv.jobs)
+
+    # Workers check out a tmp folder (and in --persistent mode, their Blender)
+    # for the length of one test file. A single job keeps using tests/tmp like always
+    free_workers = queue.Queue() # type: queue.Queue
+    persistent_blenders = [] # type: List[PersistentBlender]
+    for worker in range(jobs):
+        tmp_folder = TMP_FOLDER if jobs == 1 else get_worker_tmp_folder(worker)
+        if argv.persistent:
+            persistent_blenders.append(
+                PersistentBlender(argv, tmp_folder, get_worker_tmp_folder(worker) + ".log"))
+            free_workers.put(persistent_blenders[-1])
+        else:
+            free_workers.put(tmp_folder)
 
-        for pyFile in filtered_files:
-            if exit_code != 0:
-                break
+    def run_in_free_worker(pyFile:str)->TestFileResult:
+        worker = free_workers.get()
+        try:
+            if argv.persistent:
+                return worker.run_test_file(pyFile)
+            else:
+                return run_test_file(argv, pyFile, worker)
+        finally:
+            free_workers.put(worker)
+
+    finished = [] # type: List[TestFileResult]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        if jobs == 1:
+            # Lazily, so stopping at the first failure really stops
+            futures = (executor.submit(run_in_free_worker, pyFile) for pyFile in pyFiles)
+        else:
+            futures = [executor.submit(run_in_free_worker, pyFile) for pyFile in pyFiles]
+
+        # Output is always reported in file order, no matter which worker finishes first
+        for future in futures:
+            result = future.result()
+            finished.append(result)
 
-            pyFile = os.path.join(root, pyFile)
-            blendFile = pyFile.replace('.py', '.blend')
+            total_testsCompleted += result.testsRun
+            total_errors         += result.errors
+            total_failures       += result.failures
+            total_skipped        += result.skipped
 
             if not (argv.quiet or argv.print_fails):
-                printTestBeginning("Running file " + pyFile)
-
-            blender_args = [
-                argv.blender,
-                '--addons',
-                'io_xplane2blender',
-                '--factory-startup',
-                '-noaudio',
-                '-b'
-            ]
-
-            if argv.no_factory_startup:
-                blender_args.remove('--factory-startup')
-
-            if os.path.exists(blendFile):
-                blender_args.append(blendFile)
-            else:
-                if not (argv.quiet or argv.print_fails):
-                    print("WARNING: Blender file " + blendFile + " does not exist")
-                    printTestEnd()
+                printTestBeginning("Running file " + result.pyFile)
+                print(result.out)
 
-            blender_args.extend(['--python', pyFile])
-
-            if argv.force_blender_debug:
-                blender_args.append('--debug')
-
-            # Small Hack!
-            # Blender stops parsing after '--', so we can append the test runner
-            # args and bridge the gap without anything fancy!
-            blender_args.extend(['--']+sys.argv[1:])
-
-            if (not argv.quiet and
-                    (argv.force_blender_debug or argv.force_xplane_debug)):
-                # print the command used to execute the script
-                # to be able to easily re-run it manually to get better error output
-                print(' '.join(blender_args))
-
-            #Run Blender, normalize output line endings because Windows is dumb
-            out = subprocess.check_output(blender_args, stderr = subprocess.STDOUT, universal_newlines=True) # type: str
-            if not argv.force_blender_debug:
-                # Ignore the junk!
-                pattern = "^(%s)" % "|".join(
-                    (
-                        "DAG zero",
-                        "found bundled python",
-                        "Read new prefs",
-                        "ID user decrement error",
-                        "Smart Projection time",
-                        "WARNING.*has no UV-Map.",
-                        "ERROR.*wrong user count in old ID",
-                    )
-                )
-
-                out = "\n".join(filter(
-                    lambda line: not re.match(pattern, line),
-                    out.splitlines()
-                ))
+            if result.errors or result.failures:
+                if argv.print_fails:
+                    printTestBeginning("Running file %s - FAILED" % (result.pyFile))
+                    print(result.out)
+                    printTestEnd()
+                else:
+                    print('%s FAILED' % result.pyFile)
+
+                if not argv.keep_going:
+                    exit_code = 1
+            elif argv.quiet or argv.print_fails:
+                print('%s passed' % result.pyFile)
+
+            #THIS IS THE LAST THING TO PRINT BEFORE A TEST ENDS
+            #Its a little easier to see the boundaries between test suites,
+            #given that there is a mess of print statements from Python, unittest, the XPlane2Blender logger,
+            #Blender, and more in there sometimes
             if not (argv.quiet or argv.print_fails):
-                print(out)
+                printTestEnd()
 
-            # TestResults from the current test
-            testsRun, errors, failures, skipped = (0,) * 4
+            if exit_code != 0:
+                # Like a single job, nothing after the first failure gets reported.
+                # Files already running are let finish, the rest are cancelled
+                if isinstance(futures, list):
+                    for not_reported in futures:
+                        not_reported.cancel()
+                break
+
+    for persistent_blender in persistent_blenders:
+        persistent_blender.close()
+
+    if finished:
+        print("Timings, slowest first:")
+        for result in sorted(finished, key=lambda result: result.seconds, reverse=True):
+            print("{seconds:9.4f}s {status} {pyFile}".format(
+                seconds=result.seconds,
+                status="FAILED" if result.errors or result.failures else "passed",
+                pyFile=result.pyFile))
+
+        if argv.slowest > 0:
+            slowest_tests = sorted(
+                ((seconds, result.pyFile, test) for result in finished for test, seconds in result.testTimings.items()),
+                reverse=True
+            )[:argv.slowest]
+            print("Slowest %d tests:" % len(slowest_tests))
+            for seconds, pyFile, test in slowest_tests:
+                print("{seconds:9.4f}s {test} ({pyFile})".format(seconds=seconds, test=test, pyFile=pyFile))
+
+        history = load_timings_history(argv.timings_file)
+        regressions = find_regressions(history, finished, argv.persistent, argv.regression_threshold)
+        for result, baseline in regressions:
+            print("REGRESSED: {pyFile} took {seconds:.4f}s, {percent:.0f}% longer than its median of {baseline:.4f}s".format(
+                pyFile=result.pyFile,
+                seconds=result.seconds,
+                percent=(result.seconds / baseline - 1) * 100,
+                baseline=baseline))
+
+        if not argv.no_save_timings:
             try:
-                results = re.search(TEST_RESULTS_REGEX, out)
-            except:
-                # Oh goodie, more string matching!
-                # I'm sure this won't ever come back to bite us!
-                # If we're ever using assertRaises,
-                # hopefully we'll figure out something better! -Ted, 8/14/18
-                assert results is not None or "Traceback" in out, \
-                        "Test runner must print correct results string at end or have suffered an unrecoverable error"
-                total_errors += 1
-                errors = 1
-            else:
-                testsRun, errors, failures, skipped = (
-                    int(results.group('testsRun')),
-                    int(results.group('errors')),
-                    int(results.group('failures')),
-                    int(results.group('skipped'))
-                )
-
-                total_testsCompleted += testsRun
-                total_errors         += errors
-                total_failures       += failures
-                total_skipped        += skipped
-            finally:
-                if errors or failures:
-                    if argv.print_fails:
-                        printTestBeginning("Running file %s - FAILED" % (pyFile))
-                        print(out)
-                        printTestEnd()
-                    else:
-                        print('%s FAILED' % pyFile)
-
-                    if not argv.keep_going:
-                        exit_code = 1
-                    else:
-                        exit_code = 0
-                elif argv.quiet or argv.print_fails:
-                    print('%s passed' % pyFile)
-
-                #THIS IS THE LAST THING TO PRINT BEFORE A TEST ENDS
-                #Its a little easier to see the boundaries between test suites,
-                #given that there is a mess of print statements from Python, unittest, the XPlane2Blender logger,
-                #Blender, and more in there sometimes
-                if not (argv.quiet or argv.print_fails):
-                    printTestEnd()
+                save_timings_history(argv.timings_file, history, finished, argv.persistent)
+            except OSError as e:
+                print("WARNING: Could not save timings to %s: %s" % (argv.timings_file, e))
 
     # Final Result String Benifits
     # - --continue concisely tells how many tests failed
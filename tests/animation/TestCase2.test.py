@@ -8,7 +8,7 @@ __dirname__ = os.path.dirname(__file__)
 
 class TestCase2(XPlaneAnimationTestCase):
     def test_TestCase2(self):
-        self.exportAnimationTestCase('TestCase2', os.path.join(__dirname__, '../tmp'))
+        self.exportAnimationTestCase('TestCase2', TMP_DIR)
         self.runAnimationTestCase('TestCase2', __dirname__)
 
 
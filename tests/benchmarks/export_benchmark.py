@@ -0,0 +1,373 @@
+"""
+Exports synthetic scenes of a chosen size and records how long, and how much memory,
+each phase of export takes. Run it from the XPlane2Blender folder with
+
+    blender --factory-startup -noaudio -b --addons io_xplane2blender --python tests/benchmarks/export_benchmark.py -- [options]
+
+Scenes are built from code with test_creation_helpers, so there is nothing to keep
+in sync with a .blend file. Each scenario is one or more exportable collections, and for each
+scenario we measure:
+
+- build, making the scene. Not the exporter's fault, but good to know
+- collect, xplane_file.createFileFromBlenderRootObject (bone tree, keyframes, etc)
+- write, XPlaneFile.write (headers, vertex tables, commands)
+
+Results are written as JSON with sorted keys so they can be diffed and compared
+between commits with --compare. Memory is measured with tracemalloc, so memory Blender
+allocates in C isn't counted. tracemalloc slows down every allocation, so times come
+from passes with it off, and memory from one more pass (a fresh scene) with it on. Per phase there is
+
+- seconds, the median of the untraced passes (and seconds_min, the fastest)
+- seconds_traced, how long the traced pass took, to see how much tracing costs
+- peak, the most Python memory allocated at once during the phase
+- retained, what was allocated during the phase and is still alive at the end of it.
+  For collect, that's the collection tree (XPlaneBones, XPlaneObjects, keyframes, etc)
+
+--allocations N prints the N places that allocated the most of what collect retained
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import bpy
+from mathutils import Vector
+
+from io_xplane2blender import xplane_constants, xplane_helpers
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.tests.test_creation_helpers import DatablockInfo, KeyframeInfo, ParentInfo
+from io_xplane2blender.xplane_helpers import logger
+from io_xplane2blender.xplane_types import xplane_file
+
+# Increment when the layout of the results changes
+RESULTS_FORMAT_VERSION = 3
+
+ANIMATION_DATAREF = "sim/graphics/animation/sin_wave_2"
+
+
+def _make_grid_mesh(name:str, tris:int)->bpy.types.Mesh:
+    """Makes a flat, square-ish grid of at least tris triangles (quads are 2 tris)"""
+    side = max(1, math.ceil(math.sqrt(tris / 2)))
+    verts = [(x, y, 0) for y in range(side + 1) for x in range(side + 1)]
+    faces = [
+        (y * (side + 1) + x, y * (side + 1) + x + 1, (y + 1) * (side + 1) + x + 1, (y + 1) * (side + 1) + x)
+        for y in range(side) for x in range(side)
+    ]
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.uv_layers.new()
+    mesh.update()
+    return mesh
+
+
+def _create_mesh(name:str, collection:bpy.types.Collection, tris:int, location:Vector, parent_info:ParentInfo=None)->bpy.types.Object:
+    ob = test_creation_helpers.create_datablock_mesh(
+        DatablockInfo("MESH", name, collection=collection, location=location, parent_info=parent_info)
+    )
+    cube = ob.data
+    ob.data = _make_grid_mesh(name, tris)
+    ob.data.materials.append(test_creation_helpers.get_material_default())
+    bpy.data.meshes.remove(cube)
+    return ob
+
+
+def build_meshes(collection:bpy.types.Collection, meshes:int, tris:int)->List[bpy.types.Collection]:
+    """N meshes of M tris each"""
+    for i in range(meshes):
+        _create_mesh(f"mesh_{i}", collection, tris, Vector((i * 2, 0, 0)))
+    return [collection]
+
+
+def build_armature(collection:bpy.types.Collection, bones:int, keyframes:int)->List[bpy.types.Collection]:
+    """A K bone armature, each bone with L keyframes and a small mesh"""
+    arm = test_creation_helpers.create_datablock_armature(
+        DatablockInfo("ARMATURE", "armature", collection=collection),
+        extra_bones=bones,
+        bone_direction=Vector((0, 0, 1)))
+    test_creation_helpers.set_collection(arm, collection)
+
+    for i, bone in enumerate(arm.data.bones):
+        test_creation_helpers.set_animation_data(
+            bone,
+            [KeyframeInfo(idx=frame + 1,
+                          dataref_path=ANIMATION_DATAREF,
+                          dataref_value=frame / max(1, keyframes - 1),
+                          location=(0, frame * 0.1, 0),
+                          rotation=(frame * 5, 0, 0))
+             for frame in range(keyframes)],
+            parent_armature=arm)
+        _create_mesh(f"bone_mesh_{i}", collection, 12, Vector((0, 0, i)), ParentInfo(arm, "BONE", bone.name))
+    return [collection]
+
+
+def build_lights(collection:bpy.types.Collection, lights:int)->List[bpy.types.Collection]:
+    """P point lights"""
+    for i in range(lights):
+        test_creation_helpers.create_datablock_light(
+            DatablockInfo("LIGHT", f"light_{i}", collection=collection, location=Vector((i, 0, 0))),
+            "POINT")
+    return [collection]
+
+
+def build_empties(collection:bpy.types.Collection, empties:int, depth:int)->List[bpy.types.Collection]:
+    """
+    S empties in chains of T parented empties, each with a small mesh.
+    Lots of small XPlaneBones and XPlaneObjects, for measuring the tree
+    """
+    parent = None
+    for i in range(empties):
+        ob = test_creation_helpers.create_datablock_empty(
+            DatablockInfo("EMPTY", f"empty_{i}", collection=collection, location=Vector((0, 0, 1)),
+                          parent_info=ParentInfo(parent) if parent else None))
+        _create_mesh(f"empty_mesh_{i}", collection, 2, Vector((0, 0, 0)), ParentInfo(ob))
+        parent = ob if (i + 1) % depth else None
+    return [collection]
+
+
+def build_collections(collection:bpy.types.Collection, collections:int, meshes:int)->List[bpy.types.Collection]:
+    """Q exportable collections of a few small meshes each, exported one after another"""
+    roots = []
+    for i in range(collections):
+        root = collection if i == 0 else test_creation_helpers.create_datablock_collection(f"{collection.name}_{i}")
+        for j in range(meshes):
+            _create_mesh(f"{root.name}_mesh_{j}", root, 12, Vector((j * 2, i * 2, 0)))
+        roots.append(root)
+    return roots
+
+
+def build_cockpit(collection:bpy.types.Collection, manipulators:int, keyframes:int)->List[bpy.types.Collection]:
+    """
+    A cockpit with R manipulators, alternating command, toggle, and animated drag axis
+    """
+    collection.xplane.layer.export_type = xplane_constants.EXPORT_TYPE_COCKPIT
+    for i in range(manipulators):
+        ob = _create_mesh(f"manip_{i}", collection, 12, Vector((i * 2, 0, 0)))
+        kind = i % 3
+        if kind == 0:
+            test_creation_helpers.set_manipulator_settings(
+                ob, xplane_constants.MANIP_COMMAND, manip_props={"command": "sim/none/none"})
+        elif kind == 1:
+            test_creation_helpers.set_manipulator_settings(
+                ob, xplane_constants.MANIP_TOGGLE, manip_props={"dataref1": ANIMATION_DATAREF, "v_on": 1, "v_off": 0})
+        else:
+            test_creation_helpers.set_manipulator_settings(
+                ob, xplane_constants.MANIP_DRAG_AXIS, manip_props={"dataref1": ANIMATION_DATAREF, "dx": 1, "v1": 0, "v2": 1})
+            test_creation_helpers.set_animation_data(
+                ob,
+                [KeyframeInfo(idx=frame + 1,
+                              dataref_path=ANIMATION_DATAREF,
+                              dataref_value=frame / max(1, keyframes - 1),
+                              location=(frame / max(1, keyframes - 1), 0, 0))
+                 for frame in range(keyframes)])
+    return [collection]
+
+
+# Scenario name: (builder, parameters at --scale 1)
+SCENARIOS = {
+    "meshes": (build_meshes, {"meshes": 200, "tris": 2000}),
+    "armature": (build_armature, {"bones": 50, "keyframes": 20}),
+    "lights": (build_lights, {"lights": 500}),
+    "empties": (build_empties, {"empties": 1000, "depth": 10}),
+    "collections": (build_collections, {"collections": 50, "meshes": 10}),
+    "cockpit": (build_cockpit, {"manipulators": 300, "keyframes": 2}),
+} # type: Dict[str, Tuple[Callable[..., List[bpy.types.Collection]], Dict[str, int]]]
+
+# Parameters that are shapes rather than sizes, --scale leaves them alone
+UNSCALED_PARAMETERS = {"tris", "keyframes", "depth"}
+
+
+def scale_parameters(parameters:Dict[str, int], scale:float)->Dict[str, int]:
+    return {
+        name: value if name in UNSCALED_PARAMETERS else max(1, round(value * scale))
+        for name, value in parameters.items()
+    }
+
+
+class PhaseTimer():
+    """
+    Measures one phase in seconds. With trace, also the peak and retained Python
+    allocations in bytes, and with snapshot, a tracemalloc.Snapshot of what was retained
+    """
+    def __init__(self, trace:bool = False, snapshot:bool = False)->None:
+        self.trace = trace
+        self.take_snapshot = trace and snapshot
+        self.retained_bytes = None # type: Optional[int]
+        self.peak_bytes = None # type: Optional[int]
+        self.snapshot = None # type: Optional[tracemalloc.Snapshot]
+
+    def __enter__(self)->"PhaseTimer":
+        if self.trace:
+            tracemalloc.start()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info)->bool:
+        self.seconds = time.perf_counter() - self.start
+        if self.trace:
+            self.retained_bytes, self.peak_bytes = tracemalloc.get_traced_memory()
+            if self.take_snapshot:
+                self.snapshot = tracemalloc.take_snapshot().filter_traces((
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                ))
+            tracemalloc.stop()
+        return False
+
+
+def print_allocations(snapshot:tracemalloc.Snapshot, limit:int)->None:
+    """Prints the limit lines that allocated the most memory in snapshot"""
+    for stat in snapshot.statistics("lineno")[:limit]:
+        frame = stat.traceback[0]
+        print(f"        {stat.size:>12} bytes {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+
+
+def _export_pass(name:str, parameters:Dict[str, int], repeat:int, trace:bool, snapshot:bool = False)->Tuple[Dict[str, List[PhaseTimer]], int]:
+    """
+    Builds the scenario in a fresh scene, then collects and writes it repeat times.
+    Returns each phase's PhaseTimers and how many bytes of OBJ the last write made
+    """
+    builder = SCENARIOS[name][0]
+    test_creation_helpers.create_initial_test_setup()
+    xplane_file.clearExportCaches()
+    # The console transport would be all we'd measure
+    logger.clear()
+    logger.addTransport(xplane_helpers.XPlaneLogger.InternalTextTransport(), xplane_constants.LOGGER_LEVELS_ALL)
+
+    with PhaseTimer(trace) as build_timer:
+        roots = builder(test_creation_helpers.create_datablock_collection(name), **parameters)
+        for root in roots:
+            test_creation_helpers.make_root_exportable(root)
+            root.xplane.layer.name = root.name
+    phases = {"build": [build_timer]} # type: Dict[str, List[PhaseTimer]]
+
+    view_layer = bpy.context.scene.view_layers[0]
+    obj_bytes = 0
+    for i in range(repeat):
+        with PhaseTimer(trace, snapshot and i == repeat - 1) as collect_timer:
+            xp_files = [xplane_file.createFileFromBlenderRootObject(root, view_layer) for root in roots]
+        with PhaseTimer(trace) as write_timer:
+            outs = [xp_file.write() for xp_file in xp_files]
+        xplane_file.clearExportCaches()
+        phases.setdefault("collect", []).append(collect_timer)
+        phases.setdefault("write", []).append(write_timer)
+        obj_bytes = sum(map(len, outs))
+    return phases, obj_bytes
+
+
+def run_scenario(name:str, parameters:Dict[str, int], repeat:int, allocations:int = 0)->Dict[str, Any]:
+    timed_phases, obj_bytes = _export_pass(name, parameters, repeat, trace=False)
+    logger_errors = logger.countErrors()
+    traced_phases, _ = _export_pass(name, parameters, 1, trace=True, snapshot=allocations > 0)
+
+    snapshot = traced_phases["collect"][-1].snapshot
+    if snapshot:
+        print("    Largest allocations still alive after collect:")
+        print_allocations(snapshot, allocations)
+
+    return {
+        "parameters": parameters,
+        "obj_bytes": obj_bytes,
+        "logger_errors": logger_errors,
+        "phases": {
+            phase: {
+                "seconds": statistics.median(timer.seconds for timer in timers),
+                "seconds_min": min(timer.seconds for timer in timers),
+                "seconds_traced": max(timer.seconds for timer in traced_phases[phase]),
+                "peak_python_bytes": max(timer.peak_bytes for timer in traced_phases[phase]),
+                "retained_python_bytes": max(timer.retained_bytes for timer in traced_phases[phase]),
+            }
+            for phase, timers in timed_phases.items()
+        }
+    }
+
+
+def compare_results(old:Dict[str, Any], new:Dict[str, Any])->None:
+    """Prints how each phase of each scenario changed from old to new"""
+    if old.get("format", 1) < 3:
+        print("Old results were timed with tracemalloc on, their times are slower than they should be")
+    for name, scenario in sorted(new["scenarios"].items()):
+        old_scenario = old.get("scenarios", {}).get(name)
+        if old_scenario is None or old_scenario["parameters"] != scenario["parameters"]:
+            print(f"{name}: not in the old results or different parameters, skipped")
+            continue
+        for phase, result in sorted(scenario["phases"].items()):
+            old_result = old_scenario["phases"][phase]
+            print("{name:>12} {phase:>8}: {old:9.4f}s -> {new:9.4f}s ({ratio:+.1%}), peak {old_peak} -> {new_peak} bytes,"
+                  " retained {old_retained} -> {new_retained} bytes".format(
+                name=name,
+                phase=phase,
+                old=old_result["seconds"],
+                new=result["seconds"],
+                ratio=result["seconds"] / old_result["seconds"] - 1 if old_result["seconds"] else 0,
+                old_peak=old_result["peak_python_bytes"],
+                new_peak=result["peak_python_bytes"],
+                # Not in format 1 results
+                old_retained=old_result.get("retained_python_bytes", "?"),
+                new_retained=result["retained_python_bytes"]))
+
+
+def _make_argparse()->argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmarks exporting synthetic scenes")
+    parser.add_argument("-o", "--output",
+            help="Write results as JSON to this file",
+            type=str)
+    parser.add_argument("--compare",
+            help="Compare results against a previous --output",
+            type=str)
+    parser.add_argument("--only",
+            help="Only run these scenarios",
+            nargs="+",
+            choices=sorted(SCENARIOS))
+    parser.add_argument("--scale",
+            default=1.0,
+            help="Multiply scenario sizes (meshes, bones, lights, etc) by this",
+            type=float)
+    parser.add_argument("--repeat",
+            default=3,
+            help="Collect and write each scene this many times, the median is reported."
+                 " Memory is measured in one more pass",
+            type=int)
+    parser.add_argument("--allocations",
+            default=0,
+            help="Print this many of the lines that allocated the most of what collect retained",
+            type=int)
+    return parser
+
+
+def main(args:List[str])->None:
+    argv = _make_argparse().parse_args(args)
+    results = {
+        "format": RESULTS_FORMAT_VERSION,
+        "addon_version": str(xplane_helpers.VerStruct.current()),
+        "blender_version": bpy.app.version_string,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": argv.scale,
+        "repeat": argv.repeat,
+        "scenarios": {},
+    }
+
+    for name in argv.only or sorted(SCENARIOS):
+        parameters = scale_parameters(SCENARIOS[name][1], argv.scale)
+        print(f"Running {name} {parameters}")
+        results["scenarios"][name] = run_scenario(name, parameters, max(1, argv.repeat), argv.allocations)
+        for phase, result in sorted(results["scenarios"][name]["phases"].items()):
+            print(f"    {phase:>8}: {result['seconds']:9.4f}s, peak {result['peak_python_bytes']} bytes,"
+                  f" retained {result['retained_python_bytes']} bytes")
+
+    if argv.output:
+        with open(argv.output, "w") as output_file:
+            json.dump(results, output_file, indent=1, sort_keys=True)
+
+    if argv.compare:
+        with open(argv.compare) as compare_file:
+            compare_results(json.load(compare_file), results)
+
+
+# Blender stops parsing after '--'
+main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
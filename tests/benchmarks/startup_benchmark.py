@@ -0,0 +1,182 @@
+"""
+Measures how long importing and registering XPlane2Blender takes, with a
+per module breakdown like python -X importtime. Run it from the XPlane2Blender
+folder, *without* --addons, so the addon isn't imported before timing starts
+
+    blender --factory-startup -noaudio -b --python tests/benchmarks/startup_benchmark.py -- [options]
+
+Every Blender start and every blender -b batch job pays for registration, so it
+should only import the light core: properties, UI, operators, and the updater.
+Collecting and writing OBJs (xplane_types, numpy through the image composer) and the
+test helpers are imported when first used. If registering imports any of
+DEFERRED_MODULES, this prints what imported them and exits with 1
+"""
+
+import argparse
+import importlib.abc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import bpy
+
+# Increment when the layout of the results changes
+RESULTS_FORMAT_VERSION = 1
+
+# Must not be imported just by registering the addon
+DEFERRED_MODULES = (
+    "io_xplane2blender.tests",
+    "io_xplane2blender.xplane_image_composer",
+    "io_xplane2blender.xplane_types",
+    "numpy",
+)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's loader to time exec_module"""
+    def __init__(self, loader:importlib.abc.Loader, timer:"ImportTimer")->None:
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name:str)->Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module)->None:
+        self._timer.begin(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.end(module.__name__)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Records every module imported while installed, in the order
+    they finish, with their own and cumulative time in microseconds
+    """
+    def __init__(self)->None:
+        self.records = [] # type: List[Dict[str, Any]]
+        # [start, time spent importing children] per import in progress
+        self._stack = [] # type: List[List[float]]
+        # Which module was executing when each module was imported
+        self.imported_by = {} # type: Dict[str, Optional[str]]
+        self._executing = [] # type: List[str]
+
+    def __enter__(self)->"ImportTimer":
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, *exc_info)->bool:
+        sys.meta_path.remove(self)
+        return False
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                self.imported_by[fullname] = self._executing[-1] if self._executing else None
+                return spec
+        return None
+
+    def begin(self, name:str)->None:
+        self._executing.append(name)
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def end(self, name:str)->None:
+        start, children = self._stack.pop()
+        cumulative = time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        self._executing.pop()
+        self.records.append({
+            "module": name,
+            "depth": len(self._stack),
+            "self_us": round((cumulative - children) * 1e6),
+            "cumulative_us": round(cumulative * 1e6),
+        })
+
+
+def import_chain(timer:ImportTimer, module:str)->List[str]:
+    """Returns module, what imported it, what imported that, etc"""
+    chain = [module]
+    while timer.imported_by.get(chain[-1]):
+        chain.append(timer.imported_by[chain[-1]])
+    return chain
+
+
+def _make_argparse()->argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmarks importing and registering the addon")
+    parser.add_argument("-o", "--output",
+            help="Write results as JSON to this file",
+            type=str)
+    parser.add_argument("--top",
+            default=20,
+            help="Print this many of the slowest modules",
+            type=int)
+    parser.add_argument("--max-seconds",
+            help="Also fail if importing and registering takes longer than this",
+            type=float)
+    return parser
+
+
+def main(args:List[str])->int:
+    argv = _make_argparse().parse_args(args)
+    if "io_xplane2blender" in sys.modules:
+        print("io_xplane2blender was already imported, don't run this with --addons io_xplane2blender")
+        return 2
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    already_imported = set(sys.modules)
+    with ImportTimer() as timer:
+        start = time.perf_counter()
+        import io_xplane2blender
+        imported = time.perf_counter()
+        io_xplane2blender.register()
+        registered = time.perf_counter()
+    io_xplane2blender.unregister()
+
+    results = {
+        "format": RESULTS_FORMAT_VERSION,
+        "blender_version": bpy.app.version_string,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "import_seconds": imported - start,
+        "register_seconds": registered - imported,
+        "modules": timer.records,
+    }
+
+    print("import time:       self [us] | cumulative | imported package")
+    for record in sorted(timer.records, key=lambda r: r["cumulative_us"], reverse=True)[:argv.top]:
+        print(f"import time: {record['self_us']:>15} | {record['cumulative_us']:>10} | {'  ' * record['depth']}{record['module']}")
+    print(f"Imported in {results['import_seconds']:.4f}s, registered in {results['register_seconds']:.4f}s, "
+          f"{len(timer.records)} modules")
+
+    failed = False
+    for module in sorted(set(sys.modules) - already_imported):
+        if any(module == deferred or module.startswith(deferred + ".") for deferred in DEFERRED_MODULES):
+            print(f"FAIL: registering imported {module} ({' <- '.join(import_chain(timer, module))})")
+            failed = True
+    total = results["import_seconds"] + results["register_seconds"]
+    if argv.max_seconds is not None and total > argv.max_seconds:
+        print(f"FAIL: took {total:.4f}s, more than {argv.max_seconds}s")
+        failed = True
+
+    if argv.output:
+        with open(argv.output, "w") as output_file:
+            json.dump(results, output_file, indent=1, sort_keys=True)
+
+    return 1 if failed else 0
+
+
+# Blender stops parsing after '--'
+sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
@@ -13,7 +13,7 @@ class TestBuildNumberUpdater(XPlaneTestCase):
     @classmethod
     def run_update_cycle(self,filename:str,to_parse:str):
         original_path = os.path.normpath(os.path.join(__dirname__,"originals", filename))
-        copy_path = os.path.normpath(os.path.join(__dirname__,"..","tmp", filename))
+        copy_path = os.path.normpath(os.path.join(TMP_DIR, filename))
         if os.path.isfile(copy_path) is False:
             shutil.copyfile(original_path,copy_path)
         bpy.ops.wm.open_mainfile(filepath=copy_path)
@@ -68,7 +68,7 @@ class TestBuildNumberUpdater(XPlaneTestCase):
 
         try:
             bpy.ops.wm.read_homefile()
-            blend_path = os.path.join(__dirname__,"..","tmp","build_number_new_save_test.blend")
+            blend_path = os.path.join(TMP_DIR,"build_number_new_save_test.blend")
             bpy.ops.wm.save_mainfile(filepath=blend_path, check_existing=False)
             bpy.ops.wm.open_mainfile(filepath=blend_path)
 
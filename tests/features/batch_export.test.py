@@ -0,0 +1,71 @@
+import importlib.util
+import os
+import shutil
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+
+__dirname__ = os.path.dirname(__file__)
+
+# batch_export.py isn't part of the addon, it lives next to tests.py
+_spec = importlib.util.spec_from_file_location("batch_export", os.path.join(__dirname__, "..", "..", "batch_export.py"))
+batch_export = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(batch_export)
+
+
+def make_result(blend_file:str, outputs, status:str = "exported")->"batch_export.BlendFileResult":
+    return batch_export.BlendFileResult(
+        blendFile=blend_file,
+        status=status,
+        errors=[],
+        warnings=[],
+        errorCount=0,
+        warningCount=0,
+        timings={"total": 0.0},
+        outputs=outputs,
+    )
+
+
+class TestBatchExport(XPlaneTestCase):
+    def test_find_blend_files(self)->None:
+        root = os.path.join(TMP_DIR, "batch_export_find")
+        shutil.rmtree(root, ignore_errors=True)
+        for path in ("b.blend", "a.blend", os.path.join("sub", "c.blend"), "notes.txt"):
+            os.makedirs(os.path.dirname(os.path.join(root, path)), exist_ok=True)
+            open(os.path.join(root, path), "w").close()
+        manifest = os.path.join(root, "files.txt")
+        with open(manifest, "w") as manifest_file:
+            manifest_file.write("# A comment\n\nb.blend # Again\n**/*.blend\n")
+
+        def in_root(*paths):
+            return [os.path.abspath(os.path.join(root, path)) for path in paths]
+
+        # Patterns are sorted, everything else stays in the order given, without duplicates
+        self.assertEqual(
+            batch_export.find_blend_files([os.path.join(root, "*.blend")], None),
+            in_root("a.blend", "b.blend"))
+        self.assertEqual(
+            batch_export.find_blend_files([os.path.join(root, "sub", "c.blend")], manifest),
+            in_root(os.path.join("sub", "c.blend"), "b.blend", "a.blend"))
+        self.assertEqual(batch_export.find_blend_files([os.path.join(root, "*.none")], None), [])
+
+    def test_mark_shared_outputs(self)->None:
+        results = [
+            make_result("a.blend", ["/out/a.obj", "/out/shared.obj"]),
+            make_result("b.blend", ["/out/b.obj"]),
+            make_result("c.blend", ["/out/shared.obj"]),
+            make_result("d.blend", [], status="crashed"),
+        ]
+        marked = batch_export.mark_shared_outputs(results)
+
+        self.assertEqual([result.status for result in marked], ["failed", "exported", "failed", "crashed"])
+        self.assertEqual([result.errorCount for result in marked], [1, 0, 1, 0])
+        self.assertIn("c.blend", marked[0].errors[0]["message"])
+        self.assertIn("a.blend", marked[2].errors[0]["message"])
+        self.assertIs(marked[1], results[1])
+        # The originals are left alone
+        self.assertEqual(results[0].status, "exported")
+
+
+runTestCases([TestBatchExport])
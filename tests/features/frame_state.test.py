@@ -0,0 +1,47 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender import xplane_constants
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_helpers import XPlaneFrameState, frame_state
+
+__dirname__ = os.path.dirname(__file__)
+
+
+class TestFrameState(XPlaneTestCase):
+    def test_only_sets_changed_frames(self)->None:
+        scene = bpy.context.scene
+        state = XPlaneFrameState()
+        state.set(scene, 1)
+        state.set(scene, 1)
+        self.assertEqual(state.frame_set_count, 1)
+        state.set(scene, 2)
+        self.assertEqual(state.frame_set_count, 2)
+
+        # Someone else changed the frame
+        scene.frame_set(5)
+        state.set(scene, 2)
+        self.assertEqual(state.frame_set_count, 3)
+
+        state.clear()
+        state.set(scene, 2)
+        self.assertEqual(state.frame_set_count, 4)
+
+    def test_vlights_dont_set_frames(self)->None:
+        col = test_creation_helpers.create_datablock_collection("frame_state_vlights")
+        for i in range(10):
+            ob = test_creation_helpers.create_datablock_light(
+                test_creation_helpers.DatablockInfo("LIGHT", f"vlight_{i}", collection=col, location=(i, 0, 0)),
+                "POINT"
+            )
+            ob.data.xplane.type = xplane_constants.LIGHT_DEFAULT
+
+        before = frame_state.frame_set_count
+        out = self.exportExportableRoot(col)
+        self.assertEqual(out.count("VLIGHT"), 10)
+        self.assertLessEqual(frame_state.frame_set_count - before, 1)
+
+
+runTestCases([TestFrameState])
@@ -8,7 +8,7 @@ from io_xplane2blender.tests import *
 #This folder is going to be messy with creating folders
 #We use fakefilename to imitate what a user will go through
 #in the file picking box
-EXPORT_FOLDER = '../tmp'
+EXPORT_FOLDER = TMP_DIR
 
 class TestInstantExportFromMenu(XPlaneTestCase):
     def assert_file_exists(self,layer_num:int,relpath:str):
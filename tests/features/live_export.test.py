@@ -0,0 +1,51 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender import xplane_live_export
+
+__dirname__ = os.path.dirname(__file__)
+
+
+class TestLiveExport(XPlaneTestCase):
+    def setUp(self):
+        super().setUp()
+        for name in ("root_a", "root_b"):
+            test_creation_helpers.make_root_exportable(
+                test_creation_helpers.create_datablock_collection(name)
+            )
+        self.cube_a = test_creation_helpers.create_datablock_mesh(
+            test_creation_helpers.DatablockInfo("MESH", "cube_a", collection="root_a"),
+            material_name="Material_a"
+        )
+        self.cube_b = test_creation_helpers.create_datablock_mesh(
+            test_creation_helpers.DatablockInfo("MESH", "cube_b", collection="root_b"),
+            material_name="Material_b"
+        )
+
+    def find_affected_root_names(self, changed_ids):
+        return [root.name for root in xplane_live_export.find_affected_roots(
+            changed_ids, bpy.context.scene, bpy.context.view_layer
+        )]
+
+    def test_object_change_affects_its_root(self)->None:
+        self.assertEqual(self.find_affected_root_names({("OBJECT", "cube_a")}), ["root_a"])
+
+    def test_data_and_material_changes_affect_users(self)->None:
+        self.assertEqual(self.find_affected_root_names({("MESH", self.cube_b.data.name)}), ["root_b"])
+        self.assertEqual(
+            self.find_affected_root_names({("MATERIAL", self.cube_a.material_slots[0].material.name)}),
+            ["root_a"]
+        )
+
+    def test_parent_change_affects_childs_root(self)->None:
+        self.cube_b.parent = self.cube_a
+        self.assertEqual(self.find_affected_root_names({("OBJECT", "cube_a")}), ["root_a", "root_b"])
+
+    def test_unrelated_and_deleted_changes_affect_nothing(self)->None:
+        self.assertEqual(self.find_affected_root_names({("OBJECT", "not_there"), ("SCENE", "Scene")}), [])
+
+
+runTestCases([TestLiveExport])
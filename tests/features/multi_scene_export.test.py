@@ -0,0 +1,62 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_types import xplane_file
+
+__dirname__ = os.path.dirname(__file__)
+
+
+def make_scene_with_root(scene_name:str)->bpy.types.Scene:
+    scene = bpy.data.scenes.get(scene_name) or bpy.data.scenes.new(scene_name)
+    # The mesh operators add to the current scene
+    bpy.context.window.scene = scene
+    col = test_creation_helpers.create_datablock_collection(f"{scene_name}_root", scene=scene.name)
+    col.xplane.is_exportable_collection = True
+    test_creation_helpers.create_datablock_mesh(
+        test_creation_helpers.DatablockInfo("MESH", f"{scene_name}_cube", collection=col),
+        scene=scene.name
+    )
+    return scene
+
+
+class TestMultiSceneExport(XPlaneTestCase):
+    def test_caches_kept_until_cleared(self)->None:
+        scene = make_scene_with_root("multi_scene_caches")
+        xplane_file.createFilesFromBlenderRootObjects(scene, bpy.context.view_layer, clear_caches=False)
+        self.assertIn(scene.name, xplane_file._all_keyframe_infos)
+        xplane_file.clearExportCaches()
+        self.assertNotIn(scene.name, xplane_file._all_keyframe_infos)
+
+    def test_exports_chosen_scenes(self)->None:
+        scene_a = make_scene_with_root("multi_scene_a")
+        scene_b = make_scene_with_root("multi_scene_b")
+        make_scene_with_root("multi_scene_c")
+        bpy.context.window.scene = scene_a
+        for name in ("multi_scene_a_root", "multi_scene_b_root", "multi_scene_c_root"):
+            if os.path.exists(os.path.join(TMP_DIR, name + ".obj")):
+                os.remove(os.path.join(TMP_DIR, name + ".obj"))
+
+        result = bpy.ops.export.xplane_obj(
+            filepath=os.path.join(TMP_DIR, ""),
+            scene_names="multi_scene_a, multi_scene_b"
+        )
+
+        self.assertEqual(result, {"FINISHED"})
+        self.assertTrue(os.path.exists(os.path.join(TMP_DIR, "multi_scene_a_root.obj")))
+        self.assertTrue(os.path.exists(os.path.join(TMP_DIR, "multi_scene_b_root.obj")))
+        self.assertFalse(os.path.exists(os.path.join(TMP_DIR, "multi_scene_c_root.obj")))
+        self.assertIs(bpy.context.scene, scene_a)
+        self.assertEqual(xplane_file._all_keyframe_infos, {})
+
+    def test_missing_scene_cancels(self)->None:
+        result = bpy.ops.export.xplane_obj(
+            filepath=os.path.join(TMP_DIR, ""),
+            scene_names="no_such_scene"
+        )
+        self.assertEqual(result, {"CANCELLED"})
+
+
+runTestCases([TestMultiSceneExport])
@@ -0,0 +1,48 @@
+import os
+import stat
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender import xplane_export
+
+__dirname__ = os.path.dirname(__file__)
+
+
+class TestSkipUnchangedWrites(XPlaneTestCase):
+    def test_write_if_changed(self)->None:
+        filepath = os.path.join(TMP_DIR, "skip_unchanged_writes.obj")
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+        self.assertTrue(xplane_export.writeIfChanged(filepath, "I\n800\nOBJ\n"))
+        mtime = os.stat(filepath).st_mtime_ns
+        self.assertFalse(xplane_export.writeIfChanged(filepath, "I\n800\nOBJ\n"))
+        self.assertEqual(os.stat(filepath).st_mtime_ns, mtime)
+
+        self.assertTrue(xplane_export.writeIfChanged(filepath, "I\n800\nOBJ\n\nPOINT_COUNTS\t0\t0\t0\t0\n"))
+        with open(filepath) as obj_file:
+            self.assertEqual(obj_file.read(), "I\n800\nOBJ\n\nPOINT_COUNTS\t0\t0\t0\t0\n")
+        self.assertEqual(
+            [f for f in os.listdir(TMP_DIR) if f.startswith("skip_unchanged_writes.obj.")],
+            []
+        )
+
+    def test_describe_writes(self)->None:
+        self.assertEqual(xplane_export.describeWrites(2, 1, 3), "2 of 3 OBJs written, 1 unchanged")
+        # A Dry Run neither writes nor compares
+        self.assertEqual(xplane_export.describeWrites(0, 0, 3), "0 of 3 OBJs written, 0 unchanged, 3 not written")
+
+    def test_write_if_changed_keeps_mode(self)->None:
+        filepath = os.path.join(TMP_DIR, "skip_unchanged_writes_mode.obj")
+        if os.path.exists(filepath):
+            os.remove(filepath)
+
+        self.assertTrue(xplane_export.writeIfChanged(filepath, "I\n800\nOBJ\n"))
+        os.chmod(filepath, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP)
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+        self.assertTrue(xplane_export.writeIfChanged(filepath, "I\n800\nOBJ\n\nPOINT_COUNTS\t0\t0\t0\t0\n"))
+        self.assertEqual(stat.S_IMODE(os.stat(filepath).st_mode), mode)
+
+
+runTestCases([TestSkipUnchangedWrites])
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender import xplane_constants, xplane_helpers, xplane_updater
+from io_xplane2blender.tests import *
+from io_xplane2blender.xplane_helpers import VerStruct
+
+__dirname__ = os.path.dirname(__file__)
+
+# Only needs the 4.0.0-beta.2 light migration
+BEFORE_DEFAULT_LIGHTS = VerStruct.parse_version("4.0.0-beta.1+80.20200501000000")
+
+
+class TestFusedUpdate(XPlaneTestCase):
+    def setUp(self)->None:
+        super().setUp()
+        self.light = bpy.data.lights.new("fused_update_light", "POINT")
+        self.obj = bpy.data.objects.new("fused_update_empty", None)
+        self.obj.xplane["export_mesh"] = True
+
+    def tearDown(self)->None:
+        bpy.data.objects.remove(self.obj)
+        bpy.data.lights.remove(self.light)
+        super().tearDown()
+
+    def test_data_model_is_current(self)->None:
+        self.assertTrue(xplane_updater.data_model_is_current(VerStruct.current()))
+        self.assertTrue(xplane_updater.data_model_is_current(VerStruct.parse_version("4.0.0-beta.2+88.20200622133200")))
+        self.assertFalse(xplane_updater.data_model_is_current(BEFORE_DEFAULT_LIGHTS))
+        self.assertFalse(xplane_updater.data_model_is_current(VerStruct.parse_version("3.2.0")))
+
+    def test_current_file_is_untouched(self)->None:
+        xplane_updater.update(VerStruct.current(), xplane_helpers.logger)
+        self.assertIsNone(self.light.xplane.get("type"))
+        self.assertIn("export_mesh", self.obj.xplane)
+
+    def test_only_needed_migrations_run(self)->None:
+        xplane_updater.update(BEFORE_DEFAULT_LIGHTS, xplane_helpers.logger)
+        self.assertEqual(self.light.xplane.type, xplane_constants.LIGHT_DEFAULT)
+        self.assertIsNotNone(self.light.xplane.get("type"))
+        # 4.0.0-alpha.6's migrations aren't needed
+        self.assertIn("export_mesh", self.obj.xplane)
+
+        # Re-running the updater should result in no changes
+        xplane_updater.update(BEFORE_DEFAULT_LIGHTS, xplane_helpers.logger)
+        self.assertEqual(self.light.xplane.type, xplane_constants.LIGHT_DEFAULT)
+
+    def test_migrations_share_a_pass(self)->None:
+        xplane_updater.update(VerStruct.parse_version("4.0.0-alpha.5+70.20200101000000"), xplane_helpers.logger)
+        self.assertEqual(self.light.xplane.type, xplane_constants.LIGHT_DEFAULT)
+        self.assertNotIn("export_mesh", self.obj.xplane)
+        self.assertFalse(self.obj.xplane.layer.autodetectTextures)
+
+
+runTestCases([TestFusedUpdate])
@@ -70,4 +70,19 @@ class TestCommandsTxtParser(XPlaneTestCase):
         # A little annoying? Sure, but we'll get it exactly right
         self.assertEqual(len(result), 2214, msg="Did you remember to change this hardcoded number after updating the file?")
 
+    def test_Commands_search_index_matches_linear_search(self):
+        filepath = os.path.join(__dirname__, "..", "..", "io_xplane2blender", "resources", "Commands.txt")
+        commands = xplane_commands_txt_parser.get_commands_txt_file_content(filepath)
+        self.assertSearchIndexMatchesLinearSearch(
+            xplane_commands_txt_parser.get_commands_txt_search_index(filepath),
+            [command_info.command for command_info in commands],
+            ["sim/", "toggle", "ot_", "autopilot/ser", "flaps up|flaps down", "gle ", "engage|/", "zzz"])
+
+    def test_Commands_search_index_error_remembered(self):
+        self.assertSearchIndexErrorRemembered(
+            xplane_commands_txt_parser.get_commands_txt_search_index,
+            "Commands_error_remembered.txt",
+            " sim/test/command   A test\n",
+            "sim/test/command    A test\n")
+
 runTestCases([TestCommandsTxtParser])
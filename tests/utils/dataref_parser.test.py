@@ -84,5 +84,21 @@ class TestDatarefTxtParser(XPlaneTestCase):
         #print(result)
         self.assertEqual("No such file or directory",result) #This comes from Exception's message when the file is missing
 
+    def test_DataRefs_search_index_matches_linear_search(self):
+        filepath = os.path.join(__dirname__, "..", "..", "io_xplane2blender", "resources", "DataRefs.txt")
+        datarefs = xplane_datarefs_txt_parser.get_datarefs_txt_file_content(filepath)
+        self.assertSearchIndexMatchesLinearSearch(
+            xplane_datarefs_txt_parser.get_datarefs_txt_search_index(filepath),
+            [dref.path for dref in datarefs],
+            ["sim/", "engine", "t2/gau", "cockpit2/gauges/ind", "_rat", "//", "flap ratio|gear", "pit2/ hyd"])
+
+    def test_DataRefs_search_index_error_remembered(self):
+        header = "2 950 Tue Feb 23 22:39:40 2010\n\n"
+        self.assertSearchIndexErrorRemembered(
+            xplane_datarefs_txt_parser.get_datarefs_txt_search_index,
+            "DataRefs_error_remembered.txt",
+            header + "sim/test/value\titn\ty\tmeters\tA test\n",
+            header + "sim/test/value\tint\ty\tmeters\tA test\n")
+
 
 runTestCases([TestDatarefTxtParser])
@@ -9,7 +9,7 @@ import sys
 
 import bpy
 from io_xplane2blender import xplane_config, xplane_constants
-from io_xplane2blender.xplane_utils import xplane_lights_txt_parser
+from io_xplane2blender.xplane_utils import xplane_lights_txt_parser, xplane_resource_cache
 from io_xplane2blender.xplane_utils.xplane_lights_txt_parser import LightsTxtFileParsingError
 from io_xplane2blender.tests import *
 from io_xplane2blender.tests import test_creation_helpers
@@ -92,6 +92,29 @@ class TestLightsParser(XPlaneTestCase):
         expected_lights = 429 # You'll probably need to update this every time lights.txt is replaced
         self.assertEqual(len(xplane_lights_txt_parser._parsed_lights_txt_content), expected_lights, msg=f"Found {num_lights}, expected {expected_lights}. Did you forget to update this after updating lights.txt?")
 
+    #@unittest.skip
+    def test_real_lights_txt_cache_matches_parse(self):
+        cache_path = xplane_resource_cache.get_cache_filepath(str(REAL_LIGHTS_TXT_PATH))
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+        xplane_lights_txt_parser.parse_lights_file()
+        self.assertLoggerErrors(0)
+        self.assertTrue(os.path.exists(cache_path))
+        parsed_content = {
+            light_name: (parsed_light.light_param_def, [str(overload) for overload in parsed_light.overloads])
+            for light_name, parsed_light in xplane_lights_txt_parser._parsed_lights_txt_content.items()
+        }
+
+        xplane_lights_txt_parser._parsed_lights_txt_content.clear()
+        xplane_lights_txt_parser.parse_lights_file()
+        self.assertLoggerErrors(0)
+        cached_content = {
+            light_name: (parsed_light.light_param_def, [str(overload) for overload in parsed_light.overloads])
+            for light_name, parsed_light in xplane_lights_txt_parser._parsed_lights_txt_content.items()
+        }
+        self.assertEqual(parsed_content, cached_content)
+
     #@unittest.skip
     def test_light_repeatable_cases_parse(self)->None:
         s = """
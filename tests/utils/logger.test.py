@@ -0,0 +1,67 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.xplane_helpers import XPlaneLogger
+
+__dirname__ = os.path.dirname(__file__)
+
+
+class TestXPlaneLogger(XPlaneTestCase):
+    def test_counts_and_finds_by_type(self)->None:
+        log = XPlaneLogger()
+        self.assertFalse(log.hasErrors())
+        log.warn("w1")
+        log.error("e1")
+        log.error("e2")
+        self.assertTrue(log.hasErrors())
+        self.assertEqual(log.countErrors(), 2)
+        self.assertEqual(log.countWarnings(), 1)
+        self.assertEqual([m["message"] for m in log.findErrors()], ["e1", "e2"])
+        self.assertEqual([m.type for m in log.messages], ["warning", "error", "error"])
+
+        log.clearMessages()
+        self.assertFalse(log.hasErrors())
+        self.assertEqual(log.findErrors(), [])
+
+    def test_context(self)->None:
+        log = XPlaneLogger()
+        with log.withContext(root="my_root"):
+            with log.withContext(obj="Cube"):
+                log.error("in object")
+            log.error("in root")
+        log.error("outside")
+        self.assertEqual(
+            [(m.root, m.object) for m in log.findErrors()],
+            [("my_root", "Cube"), ("my_root", None), (None, None)]
+        )
+
+    def test_deduplicate(self)->None:
+        log = XPlaneLogger()
+        sent = []
+        log.addTransport(lambda messageType, message, context=None: sent.append(message))
+        log.deduplicate = True
+        for i in range(3):
+            log.warn("same")
+        with log.withContext(obj="Cube"):
+            log.warn("same")
+
+        self.assertEqual(log.countWarnings(), 4)
+        self.assertEqual([m.count for m in log.findWarnings()], [3, 1])
+        self.assertEqual(sent, ["same", "same"])
+
+    def test_memory_cap(self)->None:
+        log = XPlaneLogger()
+        log.MAX_MESSAGES_PER_TYPE = 5
+        for i in range(10):
+            log.warn(f"w{i}")
+        log.error("e")
+
+        self.assertEqual(log.countWarnings(), 10)
+        self.assertEqual(len(log.findWarnings()), 5)
+        self.assertEqual(log.countErrors(), 1)
+        self.assertEqual(len(log.messages), 6)
+
+
+runTestCases([TestXPlaneLogger])
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender import xplane_helpers
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+
+__dirname__ = os.path.dirname(__file__)
+
+
+class TestSceneIndex(XPlaneTestCase):
+    def test_collections_are_cached_until_they_change(self)->None:
+        scene = bpy.context.scene
+        parent = test_creation_helpers.create_datablock_collection("scene_index_parent")
+        first = xplane_helpers.get_collections_in_scene(scene)
+        self.assertEqual(first[0], scene.collection)
+        self.assertIn(parent, first)
+        self.assertIs(xplane_helpers._scene_collections[scene.as_pointer()][0], scene.collection)
+
+        # Callers get their own list
+        first.clear()
+        self.assertIn(parent, xplane_helpers.get_collections_in_scene(scene))
+
+        # Adding a collection is noticed without any handler
+        child = test_creation_helpers.create_datablock_collection("scene_index_child", parent=parent)
+        self.assertIn(child, xplane_helpers.get_collections_in_scene(scene))
+
+        # Re-parenting is noticed by the depsgraph handler, or clearing
+        scene.collection.children.link(child)
+        parent.children.unlink(child)
+        xplane_helpers.clear_scene_index()
+        collections = xplane_helpers.get_collections_in_scene(scene)
+        self.assertEqual(collections.count(child), 1)
+
+    def test_visibility_is_never_stale(self)->None:
+        view_layer = bpy.context.scene.view_layers[0]
+        parent = test_creation_helpers.create_datablock_collection("scene_index_visibility")
+        col = test_creation_helpers.create_datablock_collection("scene_index_visibility_child", parent=parent)
+        layer_collection = view_layer.layer_collection.children[parent.name].children[col.name]
+        self.assertTrue(xplane_helpers.is_visible_in_viewport(col, view_layer))
+        self.assertIn(view_layer.as_pointer(), xplane_helpers._layer_collection_paths)
+
+        # No clearing or handlers in between, each change is seen right away
+        layer_collection.hide_viewport = True
+        self.assertFalse(xplane_helpers.is_visible_in_viewport(col, view_layer))
+        layer_collection.hide_viewport = False
+        self.assertTrue(xplane_helpers.is_visible_in_viewport(col, view_layer))
+
+        col.hide_viewport = True
+        self.assertFalse(xplane_helpers.is_visible_in_viewport(col, view_layer))
+        col.hide_viewport = False
+        self.assertTrue(xplane_helpers.is_visible_in_viewport(col, view_layer))
+
+        view_layer.layer_collection.children[parent.name].exclude = True
+        self.assertFalse(xplane_helpers.is_visible_in_viewport(col, view_layer))
+        view_layer.layer_collection.children[parent.name].exclude = False
+        self.assertTrue(xplane_helpers.is_visible_in_viewport(col, view_layer))
+
+        # Nor when the collection leaves the view layer
+        parent.children.unlink(col)
+        bpy.context.scene.collection.children.link(col)
+        self.assertTrue(xplane_helpers.is_visible_in_viewport(col, view_layer))
+        bpy.context.scene.collection.children.unlink(col)
+        self.assertFalse(xplane_helpers.is_visible_in_viewport(col, view_layer))
+
+
+runTestCases([TestSceneIndex])
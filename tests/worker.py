@@ -0,0 +1,78 @@
+"""
+The Blender half of tests.py --persistent, run once per job with --python.
+
+Rather than starting Blender, registering the addon, and parsing lights.txt
+for every test file, this keeps one Blender around and runs test files in it
+as tests.py sends them:
+
+1. Connect to tests.py, introduce ourselves with the token it gave us
+2. Read a JSON line with the test file and .blend file to run
+3. Open the .blend (or the startup file if there isn't one) and run the test file
+4. Send back a JSON line with everything it printed, go to 2
+
+When tests.py hangs up, we quit.
+
+Between test files we put back what a fresh Blender would have: the export
+caches, the logger, the debug flag, and the message counter. Blender's own
+C level output (bpy.ops reports, warnings from the C code) doesn't go through
+sys.stdout, so it ends up in the job's log, not in the test file's output.
+"""
+
+import contextlib
+import io
+import json
+import os
+import runpy
+import socket
+import sys
+import traceback
+from typing import Optional
+
+import bpy
+
+from io_xplane2blender import xplane_config, xplane_helpers
+from io_xplane2blender.xplane_types import xplane_file
+
+
+def reset_addon_state()->None:
+    """Puts back the module level state the last test file may have left behind"""
+    xplane_file.clearExportCaches()
+    xplane_helpers.logger.clear()
+    xplane_helpers.message_to_str_count = 0
+    xplane_config.setDebug(False)
+
+
+def run_test_file(pyFile:str, blendFile:Optional[str], factoryStartup:bool)->str:
+    """Runs a test file as if Blender was started for it, returns all its output"""
+    reset_addon_state()
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        try:
+            if blendFile:
+                bpy.ops.wm.open_mainfile(filepath=blendFile)
+            else:
+                bpy.ops.wm.read_homefile(use_factory_startup=factoryStartup)
+            runpy.run_path(pyFile, run_name="__main__")
+        except SystemExit:
+            pass
+        except Exception:
+            # Printing "Traceback" is what tests.py looks for when there are no results
+            traceback.print_exc()
+    return out.getvalue()
+
+
+def main()->None:
+    host, port = os.environ["XPLANE2BLENDER_TEST_WORKER_ADDRESS"].rsplit(":", 1)
+    with socket.create_connection((host, int(port))) as connection:
+        stream = connection.makefile("rw", encoding="utf-8", newline="\n")
+        stream.write(os.environ["XPLANE2BLENDER_TEST_WORKER_TOKEN"] + "\n")
+        stream.flush()
+
+        for request in stream:
+            request = json.loads(request)
+            out = run_test_file(request["pyFile"], request["blendFile"], request["factoryStartup"])
+            stream.write(json.dumps({"out": out}) + "\n")
+            stream.flush()
+
+
+main()
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.xplane_types import XPlaneAttribute, XPlaneAttributes, XPlaneAttributeSchema
+from io_xplane2blender.xplane_types.xplane_material import MATERIAL_ATTRIBUTES
+
+__dirname__ = os.path.dirname(__file__)
+
+SCHEMA = XPlaneAttributeSchema((
+    ("ATTR_a", None, 0),
+    ("ATTR_heavy", None, 1000),
+    ("ATTR_b", True, 0),
+    ("ATTR_heavier", None, 2000),
+))
+
+
+class TestXPlaneAttributeSchema(XPlaneTestCase):
+    def test_schema_attributes_are_lazy(self)->None:
+        attributes = XPlaneAttributes(SCHEMA)
+        self.assertEqual(list(attributes), ["ATTR_a", "ATTR_heavy", "ATTR_b", "ATTR_heavier"])
+        self.assertEqual(len(attributes), 4)
+        self.assertIn("ATTR_b", attributes)
+        self.assertEqual(attributes._attributes, [None] * 4)
+
+        self.assertEqual(attributes["ATTR_b"].getValue(), True)
+        self.assertEqual(attributes["ATTR_heavy"].weight, 1000)
+        self.assertIs(attributes["ATTR_b"], attributes["ATTR_b"])
+        self.assertEqual(attributes._attributes.count(None), 2)
+
+    def test_items_with_values(self)->None:
+        attributes = XPlaneAttributes(SCHEMA)
+        self.assertEqual([name for name, attr in attributes.itemsWithValues()], ["ATTR_b"])
+        # Skipped None defaults aren't made
+        self.assertEqual(attributes._attributes.count(None), 3)
+
+        attributes["ATTR_a"].setValue(0.5)
+        attributes["ATTR_b"].setValue(None)
+        attributes.add(XPlaneAttribute("ATTR_custom", "1"))
+        attributes.add(XPlaneAttribute("ATTR_custom_none"))
+        self.assertEqual([name for name, attr in attributes.itemsWithValues()], ["ATTR_a", "ATTR_custom"])
+
+    def test_order_matches_weight_rules(self)->None:
+        # Anything heavier than everything before it goes to the end, in turn
+        attributes = XPlaneAttributes(SCHEMA)
+        attributes.order()
+        self.assertEqual(list(attributes), ["ATTR_a", "ATTR_b", "ATTR_heavy", "ATTR_heavier"])
+        attributes.order()
+        self.assertEqual(list(attributes), ["ATTR_a", "ATTR_b", "ATTR_heavy", "ATTR_heavier"])
+
+        attributes.add(XPlaneAttribute("ATTR_custom", None, 3000))
+        attributes["ATTR_a"].weight = 1500
+        attributes.order()
+        self.assertEqual(list(attributes), ["ATTR_b", "ATTR_heavy", "ATTR_a", "ATTR_heavier", "ATTR_custom"])
+
+    def test_move_to_end_and_overflow(self)->None:
+        attributes = XPlaneAttributes(SCHEMA)
+        attributes.add(XPlaneAttribute("ATTR_custom", 1))
+        attributes.add(XPlaneAttribute("ATTR_custom", 2))
+        self.assertEqual(attributes["ATTR_custom"].getValues(), [1, 2])
+
+        attributes.move_to_end("ATTR_a")
+        attributes.add(XPlaneAttribute("ATTR_custom2", 3))
+        self.assertEqual(list(attributes), ["ATTR_heavy", "ATTR_b", "ATTR_heavier", "ATTR_custom", "ATTR_a", "ATTR_custom2"])
+        self.assertIsNone(attributes.get("ATTR_missing"))
+        with self.assertRaises(KeyError):
+            attributes.move_to_end("ATTR_missing")
+
+    def test_material_schema_keeps_old_order(self)->None:
+        self.assertEqual(MATERIAL_ATTRIBUTES.names[:4], ("ATTR_shiny_rat", "ATTR_hard", "ATTR_hard_deck", "ATTR_no_hard"))
+        self.assertEqual(MATERIAL_ATTRIBUTES.names[-1], "ATTR_no_draped")
+        self.assertEqual(MATERIAL_ATTRIBUTES.defaults[-1], True)
+
+
+runTestCases([TestXPlaneAttributeSchema])
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_types import xplane_file
+from io_xplane2blender.xplane_types.xplane_bone import EMPTY_MAPPING
+
+__dirname__ = os.path.dirname(__file__)
+
+DATAREF = "sim/graphics/animation/sin_wave_2"
+
+
+class TestCompactTree(XPlaneTestCase):
+    def _collect(self)->"XPlaneFile":
+        col = test_creation_helpers.create_datablock_collection("compact_tree")
+        empty = test_creation_helpers.create_datablock_empty(
+            test_creation_helpers.DatablockInfo("EMPTY", "anim_empty", collection=col)
+        )
+        test_creation_helpers.set_animation_data(
+            empty,
+            [
+                test_creation_helpers.KeyframeInfo(1, DATAREF, 0, location=(0, 0, 0)),
+                test_creation_helpers.KeyframeInfo(2, DATAREF, 1, location=(0, 0, 1)),
+            ],
+        )
+        test_creation_helpers.create_datablock_mesh(
+            test_creation_helpers.DatablockInfo(
+                "MESH", "static_mesh", collection=col, parent_info=test_creation_helpers.ParentInfo(empty)
+            )
+        )
+        test_creation_helpers.create_datablock_light(
+            test_creation_helpers.DatablockInfo("LIGHT", "light", collection=col), "POINT"
+        )
+        xp_file = self.createXPlaneFileFromPotentialRoot(col)
+        xplane_file._all_keyframe_infos.clear()
+        return xp_file
+
+    def _bones(self, bone:"XPlaneBone"):
+        yield bone
+        for child in bone.children:
+            yield from self._bones(child)
+
+    def test_tree_has_no_instance_dicts(self)->None:
+        xp_file = self._collect()
+        bones = list(self._bones(xp_file.rootBone))
+        self.assertEqual(len(bones), 4)
+        for bone in bones:
+            self.assertFalse(hasattr(bone, "__dict__"), bone.getName())
+            if bone.xplaneObject:
+                self.assertFalse(hasattr(bone.xplaneObject, "__dict__"), bone.getName())
+            for keyframes in bone.animations.values():
+                for keyframe in keyframes:
+                    self.assertFalse(hasattr(keyframe, "__dict__"))
+
+    def test_unanimated_bones_share_empty_mappings(self)->None:
+        xp_file = self._collect()
+        bones = {bone.getName(ignore_indent_level=True): bone for bone in self._bones(xp_file.rootBone)}
+        self.assertEqual(list(bones["Empty: anim_empty"].animations), [DATAREF])
+        self.assertEqual(list(bones["Empty: anim_empty"].datarefs), [DATAREF])
+        for name in ("Mesh: static_mesh", "Light: light"):
+            self.assertIs(bones[name].animations, EMPTY_MAPPING)
+            self.assertIs(bones[name].datarefs, EMPTY_MAPPING)
+            with self.assertRaises(TypeError):
+                bones[name].animations["something"] = None
+        self.assertEqual(len(EMPTY_MAPPING), 0)
+
+
+runTestCases([TestCompactTree])
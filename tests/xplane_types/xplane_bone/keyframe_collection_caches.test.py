@@ -0,0 +1,68 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_types import xplane_file
+
+__dirname__ = os.path.dirname(__file__)
+
+DATAREF = "sim/graphics/animation/sin_wave_2"
+
+
+class TestKeyframeCollectionCaches(XPlaneTestCase):
+    def _make_keyframe_collection(self):
+        col = test_creation_helpers.create_datablock_collection("keyframe_caches")
+        ob = test_creation_helpers.create_datablock_empty(
+            test_creation_helpers.DatablockInfo("EMPTY", "anim_empty", collection=col)
+        )
+        test_creation_helpers.set_animation_data(
+            ob,
+            [
+                test_creation_helpers.KeyframeInfo(1, DATAREF, 0, rotation=(0, 0, 0)),
+                test_creation_helpers.KeyframeInfo(2, DATAREF, 1, rotation=(0, 0, 45)),
+                test_creation_helpers.KeyframeInfo(3, DATAREF, 2, rotation=(0, 0, 90)),
+            ],
+        )
+        xp_file = self.createXPlaneFileFromPotentialRoot(col)
+        xplane_file._all_keyframe_infos.clear()
+        return xp_file.rootBone.children[0].animations[DATAREF]
+
+    def test_conversions_and_tables_are_reused(self)->None:
+        keyframes = self._make_keyframe_collection()
+        self.assertIs(keyframes.asAA(), keyframes.asAA())
+        self.assertIs(keyframes.asEuler(), keyframes.asEuler())
+        self.assertIs(keyframes.asQuaternion(), keyframes.asQuaternion())
+        self.assertIs(keyframes.getRotationKeyframeTables(), keyframes.getRotationKeyframeTables())
+        self.assertIs(keyframes.getTranslationKeyframeTable(), keyframes.getTranslationKeyframeTable())
+
+    def test_mutation_invalidates_caches(self)->None:
+        keyframes = self._make_keyframe_collection()
+        old_aa = keyframes.asAA()
+        old_tables = keyframes.getRotationKeyframeTables()
+        self.assertEqual(len(old_aa), 3)
+
+        del keyframes[-1]
+
+        self.assertIsNot(keyframes.asAA(), old_aa)
+        self.assertEqual(len(keyframes.asAA()), 2)
+        self.assertTrue(all(len(table) == 2 for axis, table in keyframes.getRotationKeyframeTables()))
+        self.assertTrue(all(len(table) == 3 for axis, table in old_tables))
+
+    def test_keyframes_come_from_table(self)->None:
+        keyframes = self._make_keyframe_collection()
+        table = keyframes.getKeyframeTable()
+        self.assertEqual(len(table), 3)
+        self.assertEqual(list(table.values), [keyframe.dataref_value for keyframe in keyframes])
+
+        # Changing a keyframe only changes the collection when it is assigned back
+        keyframe = keyframes[1]
+        keyframe.dataref_value = 5.0
+        self.assertEqual(keyframes[1].dataref_value, 1.0)
+        keyframes[1] = keyframe
+        self.assertEqual(keyframes[1].dataref_value, 5.0)
+        self.assertEqual(table.values[1], 5.0)
+
+
+runTestCases([TestKeyframeCollectionCaches])
@@ -0,0 +1,61 @@
+import os
+import sys
+
+import bpy
+from io_xplane2blender.tests import *
+from io_xplane2blender.tests import test_creation_helpers
+from io_xplane2blender.xplane_types.xplane_keyframe_collection import XPlaneKeyframeCollection
+
+__dirname__ = os.path.dirname(__file__)
+
+DATAREF = "sim/graphics/animation/sin_wave_2"
+
+
+class TestSimplifyKeyframes(XPlaneTestCase):
+    def test_simplified_keyframe_indices(self)->None:
+        simplify = XPlaneKeyframeCollection.simplified_keyframe_indices
+        # Straight line
+        self.assertEqual(simplify([0, 1, 2, 3], [(0,), (1,), (2,), (3,)]), [0, 3])
+        # Static run after a move
+        self.assertEqual(simplify([0, 1, 2, 3], [(0,), (1,), (1,), (1,)]), [0, 1, 3])
+        # A jump must stay
+        self.assertEqual(simplify([0, 1, 1, 2], [(0,), (1,), (5,), (5,)]), [0, 1, 2, 3])
+        # Off the line by more than PRECISION_KEYFRAME
+        self.assertEqual(simplify([0, 1, 2], [(0, 0), (1, 0.001), (2, 0)]), [0, 1, 2])
+        # Two keyframes are never simplified
+        self.assertEqual(simplify([0, 1], [(0,), (0,)]), [0, 1])
+
+    def test_simplify_keyframes_drops_redundant_keys(self)->None:
+        col = test_creation_helpers.create_datablock_collection("simplify_keyframes")
+        ob = test_creation_helpers.create_datablock_empty(
+            test_creation_helpers.DatablockInfo("EMPTY", "anim_empty", collection=col)
+        )
+        test_creation_helpers.set_animation_data(
+            ob,
+            [
+                test_creation_helpers.KeyframeInfo(1, DATAREF, 0, location=(0, 0, 0), rotation=(0, 0, 0)),
+                test_creation_helpers.KeyframeInfo(2, DATAREF, 1, location=(1, 0, 0), rotation=(0, 0, 10)),
+                test_creation_helpers.KeyframeInfo(3, DATAREF, 2, location=(2, 0, 0), rotation=(0, 0, 20)),
+                test_creation_helpers.KeyframeInfo(4, DATAREF, 3, location=(2, 0, 0), rotation=(0, 0, 20)),
+            ],
+        )
+
+        bpy.context.scene.xplane.simplify_keyframes = False
+        out = self.exportExportableRoot(col)
+        self.assertEqual(out.count("ANIM_trans_key"), 4)
+        self.assertEqual(out.count("ANIM_rotate_key"), 4)
+
+        # Optimize is about the mesh, it leaves keyframes alone
+        bpy.context.scene.xplane.optimize = True
+        out = self.exportExportableRoot(col)
+        self.assertEqual(out.count("ANIM_trans_key"), 4)
+        self.assertEqual(out.count("ANIM_rotate_key"), 4)
+
+        bpy.context.scene.xplane.optimize = False
+        bpy.context.scene.xplane.simplify_keyframes = True
+        out = self.exportExportableRoot(col)
+        self.assertEqual(out.count("ANIM_trans_key"), 3)
+        self.assertEqual(out.count("ANIM_rotate_key"), 3)
+
+
+runTestCases([TestSimplifyKeyframes])
@@ -17,7 +17,7 @@ def filterLines(line:Tuple[str])->bool:
 
 class TestCreateFromRootObjects(XPlaneTestCase):
     def test_create_files_from_root_objects(self):
-        tmpDir = os.path.realpath(os.path.join(__dirname__, '../../tmp'))
+        tmpDir = TMP_DIR
 
         xplaneFile = self.createXPlaneFileFromPotentialRoot("root_1")
 